@@ -6,6 +6,8 @@ from .models import Aluno, Matricula, Cartao
 class AlunoAdmin(admin.ModelAdmin):
     # Mostra esses campos na lista de alunos no admin
     list_display = ('id', 'nome', 'ativo', 'criacao', 'atualizacao')
+    # Busca do admin (icontains, atendido pelos índices de trigramas)
+    search_fields = ('nome', 'email')
 
 
 @admin.register(Matricula)
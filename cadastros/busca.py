@@ -0,0 +1,88 @@
+# =============================================================================
+# ARQUIVO: cadastros/busca.py
+# DESCRIÇÃO: Busca de alunos por nome e e-mail do projeto Dumbbell Fitness
+# FUNÇÃO: Monta as consultas de busca, com ranking no PostgreSQL (pg_trgm)
+# =============================================================================
+
+"""
+Busca de alunos.
+
+No PostgreSQL, os filtros nome__icontains/email__icontains viram
+UPPER(coluna) LIKE UPPER('%termo%'). A migração 0008 cria índices GIN
+pg_trgm sobre UPPER(nome) e UPPER(email), que atendem exatamente essa
+expressão, então os filtros deixam de varrer a tabela inteira.
+
+O ranking usa a similaridade de trigramas (TrigramWordSimilarity) no
+PostgreSQL. Em outros bancos (SQLite nos testes locais) a busca funciona
+igual, só sem essa parte do ranking.
+"""
+
+# Consultas e expressões do ORM
+from django.db import connections
+from django.db.models import Case, FloatField, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest
+
+
+def _usa_postgres(queryset):
+    """Indica se o queryset roda em um banco PostgreSQL."""
+    return connections[queryset.db].vendor == 'postgresql'
+
+
+def filtrar_alunos(queryset, nome=None, email=None):
+    """
+    Aplica os filtros ?nome= e ?email= da listagem de alunos.
+
+    Args:
+        queryset: QuerySet de Aluno
+        nome (str | None): Trecho do nome
+        email (str | None): Trecho do e-mail
+
+    Returns:
+        QuerySet: Alunos filtrados
+    """
+    if nome:
+        queryset = queryset.filter(nome__icontains=nome)
+    if email:
+        queryset = queryset.filter(email__icontains=email)
+    return queryset
+
+
+def buscar_alunos(queryset, termo):
+    """
+    Busca alunos cujo nome ou e-mail contenha o termo, ordenados por relevância.
+
+    Ordem dos resultados:
+    1. Nome ou e-mail que começam com o termo ("jo" -> "João Silva")
+    2. Alguma palavra do nome que começa com o termo ("si" -> "João Silva")
+    3. Demais ocorrências, pela similaridade de trigramas (só PostgreSQL)
+    Empates são resolvidos por nome e id.
+
+    Args:
+        queryset: QuerySet de Aluno
+        termo (str): Texto digitado na busca
+
+    Returns:
+        QuerySet: Alunos encontrados, anotados com 'prefixo' e 'similaridade'
+    """
+    termo = ' '.join(termo.split())
+    queryset = queryset.filter(Q(nome__icontains=termo) | Q(email__icontains=termo))
+
+    prefixo = Case(
+        When(Q(nome__istartswith=termo) | Q(email__istartswith=termo), then=Value(2)),
+        When(nome__icontains=' ' + termo, then=Value(1)),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+
+    if _usa_postgres(queryset):
+        # Import local: django.contrib.postgres só é necessário no PostgreSQL
+        from django.contrib.postgres.search import TrigramWordSimilarity
+        similaridade = Greatest(
+            TrigramWordSimilarity(termo, 'nome'),
+            TrigramWordSimilarity(termo, 'email'),
+        )
+    else:
+        similaridade = Value(0.0, output_field=FloatField())
+
+    return queryset.annotate(prefixo=prefixo, similaridade=similaridade).order_by(
+        '-prefixo', '-similaridade', 'nome', 'id')
@@ -0,0 +1,324 @@
+# =============================================================================
+# ARQUIVO: cadastros/importacao.py
+# DESCRIÇÃO: Importação de alunos em massa do projeto Dumbbell Fitness
+# FUNÇÃO: Lê CSV/JSONL em streaming e cria User, Endereço, Aluno e Token em lotes
+# =============================================================================
+
+"""
+Importação de alunos em massa (ex.: academia parceira).
+
+O cadastro pela API (AlunoSerializer.create) faz, por aluno, uma
+requisição, um hash PBKDF2 da senha e vários INSERTs. Aqui o arquivo é
+lido linha a linha (nunca inteiro na memória) e processado em lotes:
+
+1. Cada linha é validada com as regras dos próprios modelos (full_clean,
+   que aplica os validadores de core.validators: CPF, CEP etc.)
+2. CPF e e-mail repetidos são descartados, dentro do lote e contra o
+   banco (uma consulta para cada um, por lote)
+3. As senhas das linhas válidas são hasheadas em um pool de processos
+   (o PBKDF2 é CPU-bound, então threads não ajudariam por causa do GIL)
+4. Endereços, usuários, alunos e tokens entram com um bulk_create cada,
+   em uma transação por lote; endereços idênticos (mesmo hash_conteudo,
+   no arquivo ou no banco) são gravados uma única vez
+
+Uma linha inválida nunca interrompe a importação: o erro é informado com
+o número da linha e o restante segue. Se o lote falhar no banco (ex.: um
+CPF cadastrado pela API no meio da importação), ele é refeito linha a
+linha, e só as linhas em conflito ficam de fora.
+"""
+
+import csv
+import logging
+# Pool de processos para o hash das senhas
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+
+# Leitor JSON rápido (o mesmo do parser da API)
+import orjson
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from rest_framework.authtoken.models import Token
+
+from core.models import EnderecoModel
+
+from .models import Aluno
+
+logger = logging.getLogger(__name__)
+
+# Campos do aluno lidos do arquivo (os do endereço são EnderecoModel.CAMPOS_CONTEUDO)
+CAMPOS_ALUNO = ('nome', 'cpf', 'email', 'sexo', 'data_nascimento', 'peso', 'altura')
+
+
+def ler_arquivo(caminho, formato=None):
+    """
+    Lê o arquivo de importação em streaming.
+
+    Formatos:
+    - csv: primeira linha com os nomes das colunas
+    - jsonl: um objeto JSON por linha (linhas em branco são ignoradas)
+
+    Sem formato, ele é deduzido da extensão (.jsonl/.ndjson ou CSV).
+
+    Yields:
+        tuple: (número da linha no arquivo, dict da linha) no CSV, ou
+            (número da linha, texto da linha) no JSONL; o texto é
+            decodificado em validar_linha, para que um JSON inválido vire
+            erro da linha e não da importação
+    """
+    if formato is None:
+        formato = 'jsonl' if caminho.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+    # utf-8-sig: aceita o BOM das planilhas exportadas pelo Excel
+    with open(caminho, encoding='utf-8-sig', newline='') as arquivo:
+        if formato == 'csv':
+            leitor = csv.DictReader(arquivo)
+            for linha in leitor:
+                yield leitor.line_num, linha
+        else:
+            for numero, texto in enumerate(arquivo, start=1):
+                if texto.strip():
+                    yield numero, texto
+
+
+def descrever_erro(exc):
+    """Texto de uma ValidationError: 'campo: mensagem; campo: mensagem'."""
+    if hasattr(exc, 'error_dict'):
+        return '; '.join(
+            f'{campo}: {" ".join(mensagens)}' for campo, mensagens in exc.message_dict.items())
+    return ' '.join(exc.messages)
+
+
+def validar_linha(dados):
+    """
+    Valida uma linha e monta os objetos (ainda não gravados).
+
+    Usa o full_clean dos modelos, sem as verificações de unicidade (feitas
+    por lote em _descartar_repetidas): nenhuma consulta ao banco por linha.
+
+    Args:
+        dados (dict | str): Linha do CSV ou texto JSON da linha
+
+    Returns:
+        dict: {'endereco': EnderecoModel, 'aluno': Aluno, 'senha': str,
+               'first_name': str}
+
+    Raises:
+        ValidationError: Com os erros de todos os campos da linha
+    """
+    if isinstance(dados, str):
+        try:
+            dados = orjson.loads(dados)
+        except orjson.JSONDecodeError:
+            raise ValidationError('JSON inválido.')
+    if not isinstance(dados, dict):
+        raise ValidationError('A linha deve ser um objeto JSON.')
+
+    # Colunas extras do CSV ficam na chave None; textos chegam sem espaços nas pontas
+    dados = {
+        chave: valor.strip() if isinstance(valor, str) else valor
+        for chave, valor in dados.items() if chave
+    }
+
+    erros = {}
+    endereco = EnderecoModel(**{campo: dados.get(campo) for campo in EnderecoModel.CAMPOS_CONTEUDO})
+    aluno = Aluno(**{campo: dados.get(campo) for campo in CAMPOS_ALUNO})
+    for objeto, excluir in ((endereco, []), (aluno, ['user', 'endereco'])):
+        try:
+            objeto.full_clean(exclude=excluir, validate_unique=False, validate_constraints=False)
+        except ValidationError as exc:
+            erros.update(exc.message_dict)
+
+    senha = dados.get('password')
+    if not senha:
+        erros['password'] = ['Este campo é obrigatório.']
+    if erros:
+        raise ValidationError(erros)
+
+    # bulk_create não chama save(), então o hash é preenchido aqui
+    endereco.hash_conteudo = EnderecoModel.calcular_hash(
+        {campo: getattr(endereco, campo) for campo in EnderecoModel.CAMPOS_CONTEUDO})
+
+    # Mesma regra do cadastro pela API: sem first_name, usa o primeiro nome
+    first_name = dados.get('first_name') or aluno.nome.split()[0]
+    return {'endereco': endereco, 'aluno': aluno, 'senha': str(senha), 'first_name': first_name}
+
+
+def _descartar_repetidas(linhas, registrar_erro):
+    """
+    Remove as linhas com CPF ou e-mail (username) repetido no próprio lote
+    ou já cadastrado, com uma consulta por campo.
+
+    Args:
+        linhas (list): [(número, linha validada)]
+        registrar_erro (callable): Chamado com (número, mensagem)
+
+    Returns:
+        list: Linhas que podem ser gravadas
+    """
+    cpfs = set(Aluno.all_objects.filter(
+        cpf__in=[linha['aluno'].cpf for _, linha in linhas]).values_list('cpf', flat=True))
+    emails = set(User.objects.filter(
+        username__in=[linha['aluno'].email for _, linha in linhas]).values_list('username', flat=True))
+
+    aceitas = []
+    for numero, linha in linhas:
+        aluno = linha['aluno']
+        if aluno.cpf in cpfs:
+            registrar_erro(numero, 'cpf: CPF já cadastrado (no banco ou em outra linha).')
+        elif aluno.email in emails:
+            registrar_erro(numero, 'email: E-mail já cadastrado (no banco ou em outra linha).')
+        else:
+            aceitas.append((numero, linha))
+        # A primeira ocorrência no arquivo fica; as seguintes são repetidas
+        cpfs.add(aluno.cpf)
+        emails.add(aluno.email)
+    return aceitas
+
+
+def _gravar(linhas):
+    """
+    Grava um lote já validado, em uma transação: um bulk_create para
+    endereços novos, usuários, alunos e tokens.
+
+    Args:
+        linhas (list): Linhas validadas, com a senha já hasheada
+
+    Returns:
+        int: Alunos criados
+    """
+    # Uma tentativa anterior desfeita (lote refeito linha a linha) deixa
+    # o pk preenchido nos objetos pelo bulk_create
+    for linha in linhas:
+        linha['endereco'].pk = None
+        linha['aluno'].pk = None
+
+    with transaction.atomic():
+        # Endereços: reaproveita os que já existem (mesmo hash) e grava cada
+        # endereço novo uma vez, mesmo que apareça em várias linhas
+        enderecos = dict(
+            EnderecoModel.all_objects
+            .filter(hash_conteudo__in={linha['endereco'].hash_conteudo for linha in linhas})
+            .values_list('hash_conteudo', 'pk')
+        )
+        novos = {}
+        for linha in linhas:
+            hash_conteudo = linha['endereco'].hash_conteudo
+            if hash_conteudo not in enderecos:
+                novos.setdefault(hash_conteudo, linha['endereco'])
+        EnderecoModel.all_objects.bulk_create(novos.values())
+        enderecos.update((hash_conteudo, endereco.pk) for hash_conteudo, endereco in novos.items())
+
+        # Usuários com o e-mail como username, como no cadastro pela API
+        usuarios = User.objects.bulk_create([
+            User(username=linha['aluno'].email, email=linha['aluno'].email,
+                 first_name=linha['first_name'], password=linha['senha'])
+            for linha in linhas
+        ])
+
+        alunos = []
+        for linha, usuario in zip(linhas, usuarios):
+            aluno = linha['aluno']
+            aluno.user_id = usuario.pk
+            aluno.endereco_id = enderecos[linha['endereco'].hash_conteudo]
+            alunos.append(aluno)
+        Aluno.all_objects.bulk_create(alunos)
+
+        # Token.save() gera a chave; no bulk_create ela é gerada aqui
+        Token.objects.bulk_create([
+            Token(key=Token.generate_key(), user_id=usuario.pk) for usuario in usuarios])
+    return len(alunos)
+
+
+@contextmanager
+def _hasheador(processos):
+    """
+    Função que hasheia uma lista de senhas, em um pool de processos.
+
+    O pool usa 'spawn' (processos novos, que rodam django.setup()): um
+    fork herdaria a conexão aberta com o banco, que seria fechada pelos
+    filhos. Com processos=1, o hash roda no próprio processo.
+
+    Yields:
+        callable: hashear(senhas) -> lista de hashes, na mesma ordem
+    """
+    if processos <= 1:
+        yield lambda senhas: [make_password(senha) for senha in senhas]
+        return
+
+    contexto = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=processos, mp_context=contexto,
+                             initializer=django.setup) as pool:
+        def hashear(senhas):
+            # Blocos grandes o bastante para amortizar a troca de mensagens
+            bloco = max(1, len(senhas) // (processos * 4))
+            return list(pool.map(make_password, senhas, chunksize=bloco))
+        yield hashear
+
+
+def importar_alunos(linhas, lote=500, processos=None, registrar_erro=None):
+    """
+    Importa alunos a partir de (número da linha, dados), em lotes.
+
+    Args:
+        linhas (iterable): Saída de ler_arquivo (consumida aos poucos)
+        lote (int): Linhas por lote (uma transação por lote)
+        processos (int | None): Processos para o hash das senhas
+            (padrão: número de CPUs; 1 desliga o pool)
+        registrar_erro (callable | None): Chamado com (número, mensagem)
+            para cada linha recusada
+
+    Returns:
+        tuple: (alunos criados, linhas recusadas)
+    """
+    processos = processos or os.cpu_count() or 1
+    criados = recusadas = 0
+
+    def recusar(numero, mensagem):
+        nonlocal recusadas
+        recusadas += 1
+        if registrar_erro is not None:
+            registrar_erro(numero, mensagem)
+
+    linhas = iter(linhas)
+    with _hasheador(processos) as hashear:
+        while True:
+            bloco = list(islice(linhas, lote))
+            if not bloco:
+                break
+
+            validas = []
+            for numero, dados in bloco:
+                try:
+                    validas.append((numero, validar_linha(dados)))
+                except ValidationError as exc:
+                    recusar(numero, descrever_erro(exc))
+            validas = _descartar_repetidas(validas, recusar)
+            if not validas:
+                continue
+
+            for (_, linha), senha in zip(validas, hashear([linha['senha'] for _, linha in validas])):
+                linha['senha'] = senha
+
+            try:
+                criados += _gravar([linha for _, linha in validas])
+            except IntegrityError:
+                # Conflito com um cadastro feito durante a importação:
+                # refaz o lote linha a linha para isolar as linhas em conflito
+                logger.warning("Lote com conflito no banco; gravando linha a linha")
+                for numero, linha in validas:
+                    try:
+                        criados += _gravar([linha])
+                    except IntegrityError as exc:
+                        recusar(numero, f'Conflito ao gravar: {exc}')
+
+            logger.info("Importação de alunos: %s criados, %s recusadas até agora",
+                        criados, recusadas)
+
+    return criados, recusadas
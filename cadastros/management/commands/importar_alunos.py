@@ -0,0 +1,66 @@
+# =============================================================================
+# ARQUIVO: cadastros/management/commands/importar_alunos.py
+# DESCRIÇÃO: Comando de manutenção do projeto Dumbbell Fitness
+# FUNÇÃO: Importa alunos em massa a partir de um arquivo CSV ou JSONL
+# =============================================================================
+
+# Erro de formato do leitor de CSV
+import csv
+
+# Base dos comandos de gerenciamento do Django
+from django.core.management.base import BaseCommand, CommandError
+
+# Leitura em streaming e importação em lotes
+from cadastros.importacao import importar_alunos, ler_arquivo
+
+
+class Command(BaseCommand):
+    """
+    Importa alunos (User + Endereço + Aluno + Token) de um arquivo.
+
+    Uso:
+        python manage.py importar_alunos alunos.csv
+        python manage.py importar_alunos alunos.jsonl --lote 1000 --processos 4
+
+    Colunas (CSV) ou chaves (JSONL), as mesmas do cadastro pela API:
+        nome, cpf, email, sexo, data_nascimento, peso, altura, password,
+        first_name (opcional), cep, rua, numero, complemento (opcional),
+        bairro, cidade, estado
+
+    O arquivo é lido aos poucos e gravado em lotes, uma transação por lote
+    (ver cadastros/importacao.py). Linhas inválidas ou repetidas são
+    listadas com o número da linha e não interrompem a importação; as
+    demais são gravadas normalmente. Rodar de novo com o mesmo arquivo só
+    cria os alunos que ainda não existem (os demais são recusados por CPF
+    ou e-mail já cadastrado).
+    """
+    help = 'Importa alunos em massa de um arquivo CSV ou JSONL.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('arquivo', help='Caminho do arquivo CSV ou JSONL')
+        parser.add_argument('--formato', choices=['csv', 'jsonl'],
+                            help='Formato do arquivo (padrão: pela extensão)')
+        parser.add_argument('--lote', type=int, default=500,
+                            help='Quantidade de linhas por lote (padrão: 500)')
+        parser.add_argument('--processos', type=int, default=None,
+                            help='Processos para o hash das senhas (padrão: número de CPUs)')
+
+    def handle(self, *args, **options):
+        def registrar_erro(numero, mensagem):
+            self.stderr.write(f'Linha {numero}: {mensagem}')
+
+        try:
+            criados, recusadas = importar_alunos(
+                ler_arquivo(options['arquivo'], options['formato']),
+                lote=options['lote'],
+                processos=options['processos'],
+                registrar_erro=registrar_erro,
+            )
+        except (OSError, UnicodeDecodeError, csv.Error) as exc:
+            # Erros do arquivo como um todo (inexistente, codificação, CSV corrompido)
+            raise CommandError(f'Não foi possível ler o arquivo: {exc}')
+
+        self.stdout.write(self.style.SUCCESS(f'{criados} aluno(s) importado(s).'))
+        if recusadas:
+            self.stdout.write(self.style.WARNING(
+                f'{recusadas} linha(s) recusada(s); veja os erros acima.'))
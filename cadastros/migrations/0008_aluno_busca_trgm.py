@@ -0,0 +1,39 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# Índices GIN de trigramas sobre UPPER(coluna): é a expressão que o Django
+# gera para icontains/istartswith no PostgreSQL (ver cadastros/busca.py)
+INDICES = [
+    ('aluno_nome_trgm', 'nome'),
+    ('aluno_email_trgm', 'email'),
+]
+
+
+def criar_indices(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for nome_indice, coluna in INDICES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {nome_indice} ON aluno '
+            f'USING gin (UPPER({coluna}::text) gin_trgm_ops)'
+        )
+
+
+def remover_indices(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for nome_indice, _ in INDICES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {nome_indice}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastros', '0007_alter_municipio_estado'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(criar_indices, remover_indices),
+    ]
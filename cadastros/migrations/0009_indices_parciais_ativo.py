@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastros', '0008_aluno_busca_trgm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cartao',
+            index=models.Index(condition=models.Q(('ativo', True)), fields=['aluno'], name='cartao_aluno_ativo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='matricula',
+            index=models.Index(condition=models.Q(('ativo', True)), fields=['aluno'], name='matricula_aluno_ativo_idx'),
+        ),
+    ]
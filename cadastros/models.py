@@ -105,6 +105,11 @@ class Cartao(BaseModel):
         db_table = 'cartoes'
         verbose_name = 'Cartão'
         verbose_name_plural = 'Cartões'
+        # Índice parcial: só os cartões ativos de cada aluno
+        indexes = [
+            models.Index(fields=['aluno'], condition=models.Q(ativo=True),
+                         name='cartao_aluno_ativo_idx'),
+        ]
 
     def __str__(self):
         """
@@ -154,6 +159,11 @@ class Matricula(BaseModel):
         db_table = 'matriculas'
         verbose_name = 'Matrícula'
         verbose_name_plural = 'Matrículas'
+        # Índice parcial: só as matrículas ativas de cada aluno
+        indexes = [
+            models.Index(fields=['aluno'], condition=models.Q(ativo=True),
+                         name='matricula_aluno_ativo_idx'),
+        ]
 
     def __str__(self):
         """
@@ -4,15 +4,23 @@
 # FUNÇÃO: Define endpoints da API para alunos, matrículas e cartões
 # =============================================================================
 
+import logging
+
 from rest_framework import viewsets, mixins, serializers, status
+from rest_framework.decorators import action
 from rest_framework.mixins import UpdateModelMixin
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
 
+from core.conditional import CondicionalGetMixin
+
+from .busca import buscar_alunos, filtrar_alunos
 from .models import Aluno, Matricula, Cartao
 from .serializers import AlunoSerializer, MatriculaSerializer, CartaoSerializer
 
+logger = logging.getLogger(__name__)
+
 
 class AlunoViewSet(viewsets.ModelViewSet, UpdateModelMixin):
     """
@@ -21,6 +29,7 @@ class AlunoViewSet(viewsets.ModelViewSet, UpdateModelMixin):
     Fornece endpoints RESTful completos para gerenciamento de alunos:
     - GET /api/v1/cadastros/alunos/ - Lista todos os alunos
     - POST /api/v1/cadastros/alunos/ - Cria novo aluno (sem autenticação)
+    - GET /api/v1/cadastros/alunos/busca/?q=termo - Busca por nome/e-mail com ranking
     - GET /api/v1/cadastros/alunos/{id}/ - Obtém aluno específico
     - PUT /api/v1/cadastros/alunos/{id}/ - Atualiza aluno
     - DELETE /api/v1/cadastros/alunos/{id}/ - Remove aluno
@@ -30,9 +39,13 @@ class AlunoViewSet(viewsets.ModelViewSet, UpdateModelMixin):
     - Exige autenticação para outras operações
     - Remove usuário vinculado ao deletar aluno
     """
-    queryset = Aluno.objects.all().order_by('id')
+    queryset = Aluno.all_objects.all().order_by('id')
     serializer_class = AlunoSerializer
 
+    # Quantidade de resultados da busca (?limite=), padrão e máximo
+    busca_limite_padrao = 20
+    busca_limite_maximo = 50
+
     def get_permissions(self):
         """
         Define permissões baseadas na ação sendo executada.
@@ -56,34 +69,33 @@ class AlunoViewSet(viewsets.ModelViewSet, UpdateModelMixin):
         - Por nome: ?nome=nome
         - Por email: ?email=email
         
+        Os filtros de nome e email usam os índices de trigramas no
+        PostgreSQL (ver cadastros/busca.py).
+        
         Returns:
             QuerySet: Alunos filtrados conforme parâmetros
         """
-        queryset = Aluno.objects.all().order_by('id')
+        queryset = Aluno.all_objects.all().order_by('id')
         
         # Filtro por usuário
         user_id = self.request.query_params.get('user', None)
         if user_id is not None:
             queryset = queryset.filter(user_id=user_id)
         
-        # Filtro por nome
-        nome = self.request.query_params.get('nome', None)
-        if nome is not None:
-            queryset = queryset.filter(nome__icontains=nome)
-        
-        # Filtro por email
-        email = self.request.query_params.get('email', None)
-        if email is not None:
-            queryset = queryset.filter(email__icontains=email)
-        
-        return queryset
+        # Filtros por nome e email
+        return filtrar_alunos(
+            queryset,
+            nome=self.request.query_params.get('nome', None),
+            email=self.request.query_params.get('email', None),
+        )
 
     def list(self, request, *args, **kwargs):
         """
         Retorna lista paginada dos alunos.
         
         Sobrescreve o método padrão para garantir uso do serializer correto
-        e permitir futuras customizações.
+        e permitir futuras customizações. A paginação é por cursor
+        (ver core/pagination.py).
         
         Args:
             request: Requisição HTTP
@@ -93,19 +105,44 @@ class AlunoViewSet(viewsets.ModelViewSet, UpdateModelMixin):
         Returns:
             Response: Lista de alunos serializados
         """
+        # O filtro por usuário (?user=id) já é aplicado em get_queryset
         queryset = self.get_queryset()
-        
-        # Filtrar por usuário se especificado
-        user_id = request.query_params.get('user')
-        if user_id:
-            queryset = queryset.filter(user_id=user_id)
-            print(f"Filtrando alunos por usuário: {user_id}")
-        
-        print(f"Total de alunos encontrados: {queryset.count()}")
-        
+
+        # Busca apenas a página atual a partir do cursor
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'])
+    def busca(self, request):
+        """
+        Busca alunos por nome ou e-mail, do mais relevante para o menos.
+        
+        Parâmetros:
+        - q: termo buscado (mínimo de 2 caracteres)
+        - limite: quantidade de resultados (padrão 20, máximo 50)
+        
+        Returns:
+            Response: {"results": [...]} com os alunos mais relevantes
+        """
+        termo = request.query_params.get('q', '').strip()
+        if len(termo) < 2:
+            raise serializers.ValidationError({'q': 'Informe ao menos 2 caracteres.'})
+
+        try:
+            limite = int(request.query_params.get('limite', self.busca_limite_padrao))
+        except ValueError:
+            limite = self.busca_limite_padrao
+        limite = max(1, min(limite, self.busca_limite_maximo))
+
+        alunos = buscar_alunos(Aluno.all_objects.all(), termo)[:limite]
+        serializer = self.get_serializer(alunos, many=True)
+        return Response({'results': serializer.data})
+
     def destroy(self, request, *args, **kwargs):
         """
         Sobrescreve a exclusão para apagar o usuário relacionado antes de deletar o aluno.
@@ -133,7 +170,7 @@ class AlunoViewSet(viewsets.ModelViewSet, UpdateModelMixin):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class MatriculaViewSet(viewsets.ModelViewSet):
+class MatriculaViewSet(CondicionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet completo para o recurso Matrícula.
     
@@ -149,6 +186,7 @@ class MatriculaViewSet(viewsets.ModelViewSet):
     - Valida regras de negócio via serializer
     - Exige autenticação para todas as operações
     - Filtra apenas matrículas ativas por padrão
+    - Responde 304 quando nada mudou (ETag / Last-Modified)
     """
     permission_classes = [IsAuthenticated]
     serializer_class = MatriculaSerializer
@@ -163,15 +201,14 @@ class MatriculaViewSet(viewsets.ModelViewSet):
         Returns:
             QuerySet: Matrículas ativas filtradas
         """
-        queryset = Matricula.objects.filter(ativo=True).order_by('id')
+        queryset = Matricula.objects.order_by('id')
         
         # Filtrar por aluno se especificado
         aluno_id = self.request.query_params.get('aluno')
         if aluno_id:
             queryset = queryset.filter(aluno_id=aluno_id)
-            print(f"Filtrando matrículas por aluno: {aluno_id}")
-        
-        print(f"Total de matrículas ativas encontradas: {queryset.count()}")
+            logger.debug("Filtrando matrículas por aluno %s", aluno_id)
+
         return queryset
 
     def list(self, request, *args, **kwargs):
@@ -179,7 +216,8 @@ class MatriculaViewSet(viewsets.ModelViewSet):
         Retorna lista paginada das matrículas ativas.
         
         Sobrescreve o método padrão para garantir uso do serializer correto
-        e permitir futuras customizações.
+        e permitir futuras customizações. A paginação é por cursor
+        (ver core/pagination.py).
         
         Args:
             request: Requisição HTTP
@@ -190,6 +228,13 @@ class MatriculaViewSet(viewsets.ModelViewSet):
             Response: Lista de matrículas serializadas
         """
         queryset = self.get_queryset()
+
+        # Busca apenas a página atual a partir do cursor
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
@@ -205,7 +250,7 @@ class MatriculaViewSet(viewsets.ModelViewSet):
         """
         instance.ativo = False
         instance.save()
-        print(f"Matrícula {instance.id} desativada (soft delete)")
+        logger.info("Matrícula %s desativada (soft delete)", instance.pk)
 
     def perform_create(self, serializer):
         """
@@ -228,15 +273,14 @@ class MatriculaViewSet(viewsets.ModelViewSet):
                 raise serializers.ValidationError(
                     {'aluno': 'Campo aluno é obrigatório para criar matrícula.'})
             try:
-                aluno = Aluno.objects.get(pk=aluno_id)
+                aluno = Aluno.all_objects.get(pk=aluno_id)
             except Aluno.DoesNotExist:
                 raise serializers.ValidationError(
                     {'aluno': 'Aluno não encontrado.'})
         else:
             # Usuário comum cria matrícula para si mesmo
-            try:
-                aluno = Aluno.objects.get(user=self.request.user)
-            except Aluno.DoesNotExist:
+            aluno = self.request.aluno
+            if not aluno:
                 raise serializers.ValidationError(
                     {'aluno': 'Aluno não encontrado para este usuário.'})
 
@@ -246,7 +290,7 @@ class MatriculaViewSet(viewsets.ModelViewSet):
 
         # Garante que a matrícula seja criada como ativa
         serializer.save(aluno=aluno, ativo=True)
-        print(f"Nova matrícula criada para aluno {aluno.id}")
+        logger.info("Nova matrícula criada para aluno %s", aluno.pk)
 
 
 class CartaoViewSet(mixins.ListModelMixin,
@@ -270,7 +314,7 @@ class CartaoViewSet(mixins.ListModelMixin,
     - Usuários comuns só podem mexer nos seus próprios cartões
     """
     permission_classes = [IsAuthenticated]
-    queryset = Cartao.objects.all().order_by('id')
+    queryset = Cartao.all_objects.all().order_by('id')
     serializer_class = CartaoSerializer
 
     def get_queryset(self):
@@ -285,14 +329,13 @@ class CartaoViewSet(mixins.ListModelMixin,
             QuerySet: Cartões filtrados conforme permissões
         """
         if self.request.user.is_superuser:
-            return Cartao.objects.all()  # Superusuário vê tudo
+            return Cartao.all_objects.all()  # Superusuário vê tudo
         
         # Usuário comum vê só os seus cartões
-        try:
-            aluno = Aluno.objects.get(user=self.request.user)
-            return Cartao.objects.filter(aluno=aluno)
-        except Aluno.DoesNotExist:
+        aluno = self.request.aluno
+        if not aluno:
             return Cartao.objects.none()  # Retorna queryset vazio se não encontrar aluno
+        return Cartao.all_objects.filter(aluno=aluno)
 
     def perform_create(self, serializer):
         """
@@ -315,15 +358,14 @@ class CartaoViewSet(mixins.ListModelMixin,
                 raise serializers.ValidationError(
                     {'aluno': 'Campo aluno é obrigatório para criar cartão.'})
             try:
-                aluno = Aluno.objects.get(pk=aluno_id)
+                aluno = Aluno.all_objects.get(pk=aluno_id)
             except Aluno.DoesNotExist:
                 raise serializers.ValidationError(
                     {'aluno': 'Aluno não encontrado.'})
         else:
             # Usuário comum cria cartão para si mesmo
-            try:
-                aluno = Aluno.objects.get(user=self.request.user)
-            except Aluno.DoesNotExist:
+            aluno = self.request.aluno
+            if not aluno:
                 raise serializers.ValidationError(
                     {'aluno': 'Aluno não encontrado para este usuário.'})
 
@@ -348,14 +390,13 @@ class CartaoViewSet(mixins.ListModelMixin,
             PermissionDenied: Se usuário não tem permissão
         """
         if not self.request.user.is_superuser:
-            try:
-                aluno = Aluno.objects.get(user=self.request.user)
-                if instance.aluno != aluno:
-                    raise PermissionDenied(
-                        "Você não pode deletar o cartão de outro aluno.")
-            except Aluno.DoesNotExist:
+            aluno = self.request.aluno
+            if not aluno:
                 raise PermissionDenied(
                     "Aluno não encontrado para este usuário.")
+            if instance.aluno_id != aluno.pk:
+                raise PermissionDenied(
+                    "Você não pode deletar o cartão de outro aluno.")
         instance.delete()
 
     def perform_update(self, serializer):
@@ -372,14 +413,14 @@ class CartaoViewSet(mixins.ListModelMixin,
         Raises:
             PermissionDenied: Se usuário não tem permissão
         """
-        instance = self.get_object()
+        # A instância já foi carregada pelo update() do DRF
+        instance = serializer.instance
         if not self.request.user.is_superuser:
-            try:
-                aluno = Aluno.objects.get(user=self.request.user)
-                if instance.aluno != aluno:
-                    raise PermissionDenied(
-                        "Você não pode atualizar o cartão de outro aluno.")
-            except Aluno.DoesNotExist:
+            aluno = self.request.aluno
+            if not aluno:
                 raise PermissionDenied(
                     "Aluno não encontrado para este usuário.")
+            if instance.aluno_id != aluno.pk:
+                raise PermissionDenied(
+                    "Você não pode atualizar o cartão de outro aluno.")
         serializer.save()
@@ -0,0 +1,131 @@
+# =============================================================================
+# ARQUIVO: core/assincrono.py
+# DESCRIÇÃO: Views assíncronas de leitura do projeto Dumbbell Fitness
+# FUNÇÃO: Autenticação e respostas JSON para as views async do perfil ASGI
+# =============================================================================
+
+"""
+Caminho assíncrono (ASGI) para os endpoints de leitura mais acessados.
+
+O DRF não tem views assíncronas, então as variantes async são views puras
+do Django, montadas com o decorador leitura_assincrona:
+
+- GET/HEAD pedindo JSON rodam na corrotina, com o ORM assíncrono: enquanto
+  uma consulta espera o banco, o worker atende outras requisições
+- Os demais métodos (POST, OPTIONS...) e a browsable API (Accept text/html
+  ou ?format=api) são repassados à view síncrona do DRF de sempre
+
+As variantes só entram nas URLs com settings.VIEWS_ASSINCRONAS, que o
+dumbbell/asgi.py liga por padrão. No perfil WSGI continuam as views do DRF.
+"""
+
+# Preserva nome e docstring da view decorada
+from functools import wraps
+
+# Executa a view síncrona do DRF fora do event loop
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+
+# Exceções do DRF, para respostas de erro iguais às das views síncronas
+from rest_framework import exceptions
+
+# Renderer JSON do projeto (o mesmo das views síncronas)
+from .renderers import ORJSONRenderer
+
+# Autenticação por token com cache (tem versão assíncrona)
+from .authentication import CachedTokenAuthentication
+
+# Métodos atendidos pela corrotina; o resto vai para a view síncrona
+METODOS_ASSINCRONOS = ('GET', 'HEAD')
+
+
+def resposta_json(dados, status=200):
+    """
+    Renderiza os dados com o ORJSONRenderer (mesmo JSON das views
+    síncronas) e devolve um HttpResponse.
+    """
+    conteudo = ORJSONRenderer().render(dados, ORJSONRenderer.media_type)
+    return HttpResponse(conteudo, content_type=ORJSONRenderer.media_type, status=status)
+
+
+def _resposta_erro(exc):
+    """Resposta de erro no formato do DRF ({"detail": ...})."""
+    resposta = resposta_json({'detail': exc.detail}, status=exc.status_code)
+    if exc.status_code == 401:
+        resposta['WWW-Authenticate'] = CachedTokenAuthentication.keyword
+    return resposta
+
+
+def _pede_browsable_api(request):
+    """True se o cliente pediu HTML (browsable API) em vez de JSON."""
+    formato = request.GET.get('format')
+    if formato:
+        return formato != 'json'
+    return 'text/html' in request.headers.get('Accept', '')
+
+
+async def autenticar_async(request):
+    """
+    Autentica a requisição sem bloquear o event loop.
+
+    Segue a ordem de REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES']:
+    primeiro o token (com cache), depois a sessão do Django.
+
+    Returns:
+        User | AnonymousUser: Usuário da requisição
+
+    Raises:
+        AuthenticationFailed: Header de token inválido ou token desconhecido
+    """
+    resultado = await CachedTokenAuthentication().aauthenticate(request)
+    if resultado is not None:
+        return resultado[0]
+    return await request.auser()
+
+
+def leitura_assincrona(view_sincrona, autenticada=False):
+    """
+    Decorador que transforma uma corrotina em variante assíncrona de uma
+    view do DRF.
+
+    Uso:
+        @leitura_assincrona(plano_detail, autenticada=True)
+        async def plano_detail_async(request, pk): ...
+
+    Args:
+        view_sincrona: View do DRF usada para os outros métodos e para a
+            browsable API (também define usar_replica, ver core/db_router.py)
+        autenticada (bool): Exige usuário autenticado (IsAuthenticated);
+            o usuário fica em request.user antes de a corrotina rodar
+
+    Returns:
+        callable: Decorador da corrotina
+    """
+    repassar = sync_to_async(view_sincrona)
+
+    def decorador(view_assincrona):
+        @wraps(view_assincrona)
+        async def view(request, *args, **kwargs):
+            if request.method not in METODOS_ASSINCRONOS or _pede_browsable_api(request):
+                return await repassar(request, *args, **kwargs)
+
+            if autenticada:
+                try:
+                    user = await autenticar_async(request)
+                except exceptions.APIException as exc:
+                    return _resposta_erro(exc)
+                if not user.is_authenticated:
+                    return _resposta_erro(exceptions.NotAuthenticated())
+                request.user = user
+
+            return await view_assincrona(request, *args, **kwargs)
+
+        # Como nas views do DRF: a autenticação por sessão cuida do CSRF
+        view.csrf_exempt = True
+        view.usar_replica = (
+            getattr(view_sincrona, 'usar_replica', True)
+            and getattr(getattr(view_sincrona, 'cls', None), 'usar_replica', True)
+        )
+        return view
+
+    return decorador
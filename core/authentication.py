@@ -0,0 +1,308 @@
+# =============================================================================
+# ARQUIVO: core/authentication.py
+# DESCRIÇÃO: Autenticação por token com cache do projeto Dumbbell Fitness
+# FUNÇÃO: Evita a consulta Token + User em toda requisição autenticada
+# =============================================================================
+
+# Cópia rasa das instâncias em cache (cada requisição recebe a sua)
+import copy
+# Trava para o cache local, que é compartilhado entre threads do processo
+import threading
+# Relógio monotônico para controlar a expiração (TTL) das entradas
+import time
+# Valores únicos para as versões dos tokens no cache compartilhado
+import uuid
+# Dicionário ordenado usado como LRU
+from collections import OrderedDict
+# Invalidação adiada para depois do commit
+from functools import partial
+
+# Configurações do projeto e caches configurados em settings.CACHES
+from django.conf import settings
+from django.core.cache import caches
+# Backends que guardam os dados só no próprio processo
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+# Autenticação por token padrão do DRF, que esta classe estende
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+# Mesmas mensagens (traduzidas) da TokenAuthentication do DRF
+from django.utils.translation import gettext_lazy as _
+
+
+class _CacheLocalLRU:
+    """
+    Cache LRU em memória, por processo, com expiração por tempo (TTL).
+
+    Guarda no máximo 'maxsize' entradas; ao estourar, descarta a menos
+    usada recentemente. Entradas mais velhas que 'ttl' segundos são
+    ignoradas e removidas na próxima leitura.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._dados = OrderedDict()
+        self._trava = threading.Lock()
+
+    def get(self, chave):
+        with self._trava:
+            item = self._dados.get(chave)
+            if item is None:
+                return None
+            valor, expira_em = item
+            if expira_em < time.monotonic():
+                del self._dados[chave]
+                return None
+            self._dados.move_to_end(chave)
+            return valor
+
+    def set(self, chave, valor):
+        with self._trava:
+            self._dados[chave] = (valor, time.monotonic() + self.ttl)
+            self._dados.move_to_end(chave)
+            while len(self._dados) > self.maxsize:
+                self._dados.popitem(last=False)
+
+    def delete(self, chave):
+        with self._trava:
+            self._dados.pop(chave, None)
+
+    def clear(self):
+        with self._trava:
+            self._dados.clear()
+
+
+def _config(nome, padrao):
+    """Lê uma opção de settings.AUTH_TOKEN_CACHE, com valor padrão."""
+    return getattr(settings, 'AUTH_TOKEN_CACHE', {}).get(nome, padrao)
+
+
+# Cache local do processo (um por worker do gunicorn)
+_cache_local = _CacheLocalLRU(
+    maxsize=_config('LOCAL_MAXSIZE', 1024),
+    ttl=_config('LOCAL_TTL', 30),
+)
+
+# Prefixos das chaves no cache compartilhado: o token e a versão dele
+_PREFIXO = 'auth-token:'
+_PREFIXO_VERSAO = 'auth-token-versao:'
+
+
+def _cache_compartilhado():
+    """
+    Retorna o cache compartilhado entre processos, se configurado.
+
+    O alias vem de AUTH_TOKEN_CACHE['SHARED_CACHE'] (padrão: 'default').
+    Um alias vazio, ou um backend que guarda os dados só no próprio
+    processo (LocMemCache, DummyCache), não conta como compartilhado: a
+    invalidação feita em um worker não chegaria aos outros.
+    """
+    alias = _config('SHARED_CACHE', 'default')
+    if not alias:
+        return None
+    cache = caches[alias]
+    return None if isinstance(cache, (LocMemCache, DummyCache)) else cache
+
+
+def _ttl_versao():
+    """
+    Validade da versão de um token no cache compartilhado.
+
+    Precisa ser maior que a de qualquer entrada que ela invalida: se a
+    versão expirasse antes, uma entrada antiga voltaria a valer.
+    """
+    return 2 * max(_config('SHARED_TTL', 300), _config('LOCAL_TTL', 30))
+
+
+def invalidar_token(chave, using=DEFAULT_DB_ALIAS):
+    """
+    Invalida um token nos caches quando a transação atual for confirmada.
+
+    Chamado pelos signals de core/signals.py quando o token é apagado
+    (logout, exclusão do usuário) ou o usuário é alterado. Fora de uma
+    transação, a invalidação é imediata.
+
+    Args:
+        chave (str): Chave do token
+        using (str): Banco da transação que alterou o token ou o usuário
+    """
+    transaction.on_commit(partial(_invalidar_agora, chave), using=using)
+
+
+def _invalidar_agora(chave):
+    """
+    Troca a versão do token no cache compartilhado e remove as entradas.
+
+    A versão nova invalida também as cópias no cache local dos outros
+    workers, que a conferem a cada leitura.
+    """
+    _cache_local.delete(chave)
+    compartilhado = _cache_compartilhado()
+    if compartilhado is not None:
+        compartilhado.set(_PREFIXO_VERSAO + chave, uuid.uuid4().hex, _ttl_versao())
+        compartilhado.delete(_PREFIXO + chave)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication com cache da chave do token para o usuário.
+
+    Substitui diretamente a rest_framework.authentication.TokenAuthentication
+    em REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES']. O header continua
+    o mesmo (Authorization: Token <chave>).
+
+    Camadas de cache:
+    - Local: LRU em memória por processo, com TTL curto (LOCAL_TTL)
+    - Compartilhado: cache do Django configurado em SHARED_CACHE (padrão
+      'default'), com TTL maior (SHARED_TTL), visível para todos os workers
+
+    Invalidação:
+    - Logout e exclusão do usuário apagam o token, o que dispara a remoção
+      do cache (signal post_delete de Token)
+    - Qualquer save do User (troca de senha, desativação) remove os tokens
+      dele do cache (signal post_save de User)
+
+    A invalidação roda depois do commit e troca a versão do token no cache
+    compartilhado. Cada entrada (local ou compartilhada) guarda a versão
+    lida antes de consultar o banco, e uma leitura só aproveita a entrada
+    se a versão ainda for a mesma: o cache local custa uma leitura da
+    versão no compartilhado, mas nenhum worker usa um token invalidado.
+
+    Sem cache compartilhado (ver _cache_compartilhado), a invalidação não
+    chegaria aos outros workers, então o cache local também fica desligado
+    e cada requisição consulta o banco, como na TokenAuthentication. Para
+    um único processo (ex.: runserver), LOCAL_SEM_COMPARTILHADO = True
+    liga o cache local mesmo assim.
+    """
+
+    def authenticate_credentials(self, key):
+        """
+        Resolve a chave do token usando o cache antes de ir ao banco.
+
+        Usuários inativos ou tokens inválidos nunca entram no cache: nesses
+        casos a validação padrão do DRF levanta AuthenticationFailed.
+
+        Returns:
+            tuple: (user, token), como na TokenAuthentication padrão
+        """
+        compartilhado = _cache_compartilhado()
+        if compartilhado is None and not _config('LOCAL_SEM_COMPARTILHADO', False):
+            return super().authenticate_credentials(key)
+
+        item = _cache_local.get(key)
+        if compartilhado is None:
+            if item is None:
+                user, token = super().authenticate_credentials(key)
+                item = (token, None)
+                _cache_local.set(key, item)
+            return self._copias(item[0])
+
+        chave_token, chave_versao = _PREFIXO + key, _PREFIXO_VERSAO + key
+        if item is not None and item[1] == compartilhado.get(chave_versao):
+            return self._copias(item[0])
+
+        valores = compartilhado.get_many([chave_token, chave_versao])
+        versao = valores.get(chave_versao)
+        item = valores.get(chave_token)
+        if item is None or item[1] != versao:
+            # A versão foi lida antes do banco: se o token for invalidado
+            # no meio, a entrada gravada aqui já nasce desatualizada
+            user, token = super().authenticate_credentials(key)
+            item = (token, versao)
+            compartilhado.set(chave_token, item, _config('SHARED_TTL', 300))
+        _cache_local.set(key, item)
+
+        return self._copias(item[0])
+
+    async def aauthenticate(self, request):
+        """
+        Versão assíncrona de authenticate(), usada pelas views assíncronas
+        do perfil ASGI (ver core/assincrono.py).
+
+        Lê o header Authorization do mesmo jeito que a TokenAuthentication
+        do DRF, com as mesmas mensagens de erro.
+
+        Returns:
+            tuple | None: (user, token), ou None se não houver header de token
+        """
+        auth = get_authorization_header(request).split()
+
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+
+        if len(auth) == 1:
+            msg = _('Invalid token header. No credentials provided.')
+            raise exceptions.AuthenticationFailed(msg)
+        elif len(auth) > 2:
+            msg = _('Invalid token header. Token string should not contain spaces.')
+            raise exceptions.AuthenticationFailed(msg)
+
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            msg = _('Invalid token header. Token string should not contain invalid characters.')
+            raise exceptions.AuthenticationFailed(msg)
+
+        return await self.aauthenticate_credentials(key)
+
+    async def aauthenticate_credentials(self, key):
+        """
+        Versão assíncrona de authenticate_credentials().
+
+        Mesmas camadas de cache; o cache compartilhado e o banco (só quando
+        o token não está em cache) são consultados sem bloquear o event loop.
+
+        Returns:
+            tuple: (user, token)
+        """
+        compartilhado = _cache_compartilhado()
+        if compartilhado is None and not _config('LOCAL_SEM_COMPARTILHADO', False):
+            token = await self._abuscar_token(key)
+            return token.user, token
+
+        item = _cache_local.get(key)
+        if compartilhado is None:
+            if item is None:
+                item = (await self._abuscar_token(key), None)
+                _cache_local.set(key, item)
+            return self._copias(item[0])
+
+        chave_token, chave_versao = _PREFIXO + key, _PREFIXO_VERSAO + key
+        if item is not None and item[1] == await compartilhado.aget(chave_versao):
+            return self._copias(item[0])
+
+        valores = await compartilhado.aget_many([chave_token, chave_versao])
+        versao = valores.get(chave_versao)
+        item = valores.get(chave_token)
+        if item is None or item[1] != versao:
+            item = (await self._abuscar_token(key), versao)
+            await compartilhado.aset(chave_token, item, _config('SHARED_TTL', 300))
+        _cache_local.set(key, item)
+
+        return self._copias(item[0])
+
+    async def _abuscar_token(self, key):
+        """Lê o token e o usuário no banco, com as validações do DRF."""
+        model = self.get_model()
+        try:
+            token = await model.objects.select_related('user').aget(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+        return token
+
+    @staticmethod
+    def _copias(token):
+        """
+        Cada requisição recebe cópias próprias, para que nada do que for
+        carregado nelas (ex.: user.aluno) fique preso na instância em cache.
+        """
+        user = copy.copy(token.user)
+        token = copy.copy(token)
+        token.user = user
+        return user, token
@@ -0,0 +1,758 @@
+# =============================================================================
+# ARQUIVO: core/benchmarks.py
+# DESCRIÇÃO: Benchmarks do projeto Dumbbell Fitness
+# FUNÇÃO: Mede latência, vazão e consultas dos caminhos mais acessados da API
+# =============================================================================
+
+"""
+Benchmarks executados pelo comando `manage.py benchmark <cenario>`.
+
+Cada cenário cria os próprios dados sintéticos dentro de uma transação
+que é desfeita no fim (ver dados_descartaveis), então pode rodar contra
+uma cópia do banco sem deixar linhas para trás. Os tempos são medidos com
+time.perf_counter e reportados como mediana e p95 das repetições; as
+consultas são contadas em uma execução separada, fora da medição.
+
+Os cenários ficam em CENARIOS ({nome: função}), registrados com o
+decorador @cenario. Cada função recebe as opções do comando e gera as
+linhas de texto do relatório.
+"""
+
+import asyncio
+import datetime
+import itertools
+import statistics
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import CommandError
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections, transaction
+from django.db.backends.signals import connection_created
+
+# Cenários disponíveis: {nome: função}
+CENARIOS = {}
+
+# Numeração das levas de dados sintéticos (CPF, e-mail e usuário únicos)
+_levas = itertools.count()
+
+# Resultado de uma medição: tempos em segundos e consultas por execução
+Medida = namedtuple('Medida', 'mediana p95 consultas')
+
+
+def cenario(nome):
+    """Registra a função decorada como o cenário `nome`."""
+    def decorador(funcao):
+        CENARIOS[nome] = funcao
+        return funcao
+    return decorador
+
+
+@contextmanager
+def dados_descartaveis(using=DEFAULT_DB_ALIAS):
+    """Transação desfeita no fim, mesmo sem erro: os dados sintéticos somem."""
+    with transaction.atomic(using=using):
+        yield
+        transaction.set_rollback(True, using=using)
+
+
+def medir(funcao, repeticoes, using=DEFAULT_DB_ALIAS):
+    """
+    Executa `funcao` uma vez contando as consultas e depois `repeticoes`
+    vezes medindo o tempo.
+
+    Args:
+        using (str | None): Banco cujas consultas são contadas (None: não conta)
+
+    Returns:
+        Medida: mediana e p95 em segundos e consultas por execução (ou None)
+    """
+    consultas = []
+
+    def contar(execute, sql, params, many, context):
+        consultas.append(sql)
+        return execute(sql, params, many, context)
+
+    if using is None:
+        funcao()
+    else:
+        # execute_wrapper conta as consultas mesmo com DEBUG=False
+        with connections[using].execute_wrapper(contar):
+            funcao()
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    tempos.sort()
+    p95 = tempos[min(len(tempos) - 1, int(len(tempos) * 0.95))]
+    return Medida(statistics.median(tempos), p95, None if using is None else len(consultas))
+
+
+def formatar(rotulo, medida):
+    """Linha do relatório: rótulo, mediana, p95 (em ms) e consultas."""
+    linha = (f'{rotulo:<44} mediana {medida.mediana * 1000:9.2f} ms   '
+             f'p95 {medida.p95 * 1000:9.2f} ms')
+    if medida.consultas is not None:
+        linha += f'   {medida.consultas:>3} consulta(s)'
+    return linha
+
+
+def criar_alunos(quantidade, com_usuario=False, lote=5000):
+    """
+    Cria `quantidade` alunos sintéticos com bulk_create, todos no mesmo
+    endereço, cada um com matrícula ativa em um plano sem limite de treinos.
+
+    Args:
+        quantidade (int): Alunos a criar
+        com_usuario (bool): Cria também um User para cada aluno
+        lote (int): Linhas por INSERT
+
+    Returns:
+        list[Aluno]: Alunos criados, com pk
+    """
+    # Imports locais: core não depende dos apps no carregamento
+    from cadastros.models import Aluno, Matricula
+    from core.models import EnderecoModel
+    from planos.models import Plano
+
+    # CPFs sintéticos começam em 9xx; endereço, e-mails e usuários levam a leva
+    leva = next(_levas)
+    endereco = EnderecoModel.objects.create(
+        cep='01310-100', rua='Avenida Paulista', numero=str(leva),
+        complemento='Benchmark', bairro='Bela Vista', cidade='São Paulo', estado='SP')
+    plano = Plano.objects.create(titulo='Benchmark', preco=100, limite_treinos=None)
+
+    usuarios = [None] * quantidade
+    if com_usuario:
+        usuarios = User.objects.bulk_create(
+            [User(username=f'bench-{leva}-{i}') for i in range(quantidade)],
+            batch_size=lote)
+
+    nomes = ['Ana', 'Bruno', 'Carla', 'Diego', 'Elisa', 'Fábio', 'Gabriela', 'Heitor']
+    sobrenomes = ['Silva', 'Souza', 'Oliveira', 'Santos', 'Pereira', 'Costa', 'Almeida']
+    alunos = Aluno.objects.bulk_create(
+        [
+            Aluno(
+                user=usuarios[i],
+                nome=f'{nomes[i % len(nomes)]} {sobrenomes[i // len(nomes) % len(sobrenomes)]} {i}',
+                cpf='{0:03d}.{1:03d}.{2:03d}-{3:02d}'.format(
+                    900 + leva % 100, i // 10 ** 5 % 1000, i // 100 % 1000, i % 100),
+                email=f'aluno{i}.{leva}@benchmark.dumbbell',
+                sexo='MF'[i % 2],
+                data_nascimento=datetime.date(1980 + i % 25, 1 + i % 12, 1 + i % 28),
+                endereco=endereco,
+                peso=60 + i % 40,
+                altura='1.75',
+            )
+            for i in range(quantidade)
+        ],
+        batch_size=lote,
+    )
+    Matricula.objects.bulk_create(
+        [Matricula(aluno=aluno, plano=plano, forma_pagamento='P') for aluno in alunos],
+        batch_size=lote)
+    return alunos
+
+
+def criar_exercicios(quantidade):
+    """Cria `quantidade` exercícios sintéticos, alternando os grupos musculares."""
+    from core.choices import GRUPO_MUSCULAR
+    from exercicios.models import Exercicio
+
+    grupos = [valor for valor, _ in GRUPO_MUSCULAR]
+    return Exercicio.objects.bulk_create([
+        Exercicio(nome=f'Exercício benchmark {i}', descricao='Sintético',
+                  categoria='Musculacao', grupo_muscular=grupos[i % len(grupos)])
+        for i in range(quantidade)
+    ])
+
+
+@cenario('logs')
+def cenario_logs(opcoes):
+    """
+    Latência dos caminhos que tinham print() de depuração: criação e
+    edição de treino (TreinoSerializer) e listagem de alunos.
+
+    Os registros de log saem no stderr, como no gunicorn; rode com
+    LOG_LEVEL=DEBUG e LOG_LEVEL=WARNING para comparar o custo dos níveis.
+    """
+    from rest_framework.test import APIClient
+
+    repeticoes = opcoes['repeticoes']
+    with dados_descartaveis():
+        aluno, = criar_alunos(1, com_usuario=True)
+        criar_alunos(opcoes['linhas'] or 200)
+        exercicios = criar_exercicios(10)
+
+        cliente = APIClient()
+        cliente.force_authenticate(aluno.user)
+        corpo = {
+            'nome': 'Treino benchmark',
+            'objetivo': 'Hipertrofia',
+            'exercicios': [
+                {'exercicio': exercicio.pk, 'series': 3, 'repeticoes': 10, 'carga': '20.00'}
+                for exercicio in exercicios
+            ],
+        }
+
+        def criar():
+            resposta = cliente.post('/api/v1/treinos/', corpo, format='json')
+            assert resposta.status_code == 201, resposta.content
+            return resposta.data['id']
+
+        treino_id = criar()
+
+        def editar():
+            resposta = cliente.put(f'/api/v1/treinos/{treino_id}/', corpo, format='json')
+            assert resposta.status_code == 200, resposta.content
+
+        def listar_alunos():
+            resposta = cliente.get('/api/v1/cadastros/alunos/')
+            assert resposta.status_code == 200, resposta.content
+
+        yield formatar('POST /api/v1/treinos/ (10 exercícios)', medir(criar, repeticoes))
+        yield formatar('PUT /api/v1/treinos/<id>/ (10 exercícios)', medir(editar, repeticoes))
+        yield formatar('GET /api/v1/cadastros/alunos/', medir(listar_alunos, repeticoes))
+
+
+@cenario('auth')
+def cenario_auth(opcoes):
+    """
+    Custo da autenticação por token em uma requisição (authenticate() do
+    DRF sobre um GET com Authorization: Token): TokenAuthentication padrão
+    e CachedTokenAuthentication só com o cache local e com o cache
+    compartilhado.
+
+    O cache compartilhado é o AUTH_TOKEN_CACHE['SHARED_CACHE'] configurado,
+    se for visível para todos os workers (ex.: Redis); senão, um cache em
+    arquivo temporário, compartilhado entre processos como seria o Redis.
+    """
+    import shutil
+    import tempfile
+
+    from django.core.cache import caches
+    from django.test import RequestFactory, override_settings
+    from rest_framework.authentication import TokenAuthentication
+    from rest_framework.authtoken.models import Token
+    from rest_framework.request import Request
+    from core import authentication
+
+    repeticoes = opcoes['repeticoes']
+    fabrica = RequestFactory()
+    diretorio = None
+    configuracao = getattr(settings, 'AUTH_TOKEN_CACHE', {})
+
+    if authentication._cache_compartilhado() is not None:
+        alias = configuracao.get('SHARED_CACHE', 'default')
+        caches_compartilhado = settings.CACHES
+        descricao = f"cache '{alias}' ({caches[alias].__class__.__name__})"
+    else:
+        alias = 'benchmark-auth'
+        diretorio = tempfile.mkdtemp(prefix='benchmark-auth-')
+        caches_compartilhado = dict(settings.CACHES, **{alias: {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': diretorio,
+        }})
+        descricao = 'cache em arquivo temporário (não há cache compartilhado configurado)'
+
+    modos = [
+        ('TokenAuthentication (DRF)', TokenAuthentication, {}),
+        ('CachedTokenAuthentication, só cache local', authentication.CachedTokenAuthentication,
+         {'AUTH_TOKEN_CACHE': dict(configuracao, SHARED_CACHE='', LOCAL_SEM_COMPARTILHADO=True)}),
+        ('CachedTokenAuthentication, compartilhado', authentication.CachedTokenAuthentication,
+         {'CACHES': caches_compartilhado,
+          'AUTH_TOKEN_CACHE': dict(configuracao, SHARED_CACHE=alias)}),
+    ]
+
+    try:
+        with dados_descartaveis():
+            user = User.objects.create(username=f'bench-auth-{next(_levas)}')
+            token = Token.objects.create(user=user)
+            cabecalho = f'Token {token.key}'
+            yield f'Compartilhado: {descricao}'
+
+            for rotulo, classe, ajustes in modos:
+                autenticacao = classe()
+
+                def autenticar():
+                    request = Request(fabrica.get('/', HTTP_AUTHORIZATION=cabecalho))
+                    usuario, _ = autenticacao.authenticate(request)
+                    assert usuario.pk == user.pk
+
+                with override_settings(**ajustes):
+                    authentication._cache_local.clear()
+                    # Carrega os caches: consultas e tempos são de acertos
+                    autenticar()
+                    yield formatar(rotulo, medir(autenticar, repeticoes))
+                    authentication._invalidar_agora(token.key)
+    finally:
+        authentication._cache_local.clear()
+        if diretorio is not None:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+
+@contextmanager
+def sem_indices(using=DEFAULT_DB_ALIAS):
+    """
+    No PostgreSQL, desliga as varreduras por índice até o fim do bloco
+    (SET LOCAL, dentro da transação do cenário), para medir a mesma
+    consulta com e sem os índices. Nos outros bancos não faz nada.
+    """
+    conexao = connections[using]
+    if conexao.vendor != 'postgresql':
+        yield
+        return
+    with conexao.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_indexscan = off')
+        cursor.execute('SET LOCAL enable_bitmapscan = off')
+    try:
+        yield
+    finally:
+        with conexao.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_indexscan = on')
+            cursor.execute('SET LOCAL enable_bitmapscan = on')
+
+
+@cenario('busca')
+def cenario_busca(opcoes):
+    """
+    Filtros ?nome= e ?email= da listagem de alunos e a busca ranqueada
+    (/alunos/busca/) sobre N alunos sintéticos (padrão: 100 mil).
+
+    No PostgreSQL, cada consulta é medida de novo com os índices
+    desligados (ver sem_indices), o que mostra o ganho dos índices de
+    trigramas da migração cadastros 0008 sobre a varredura da tabela.
+    """
+    from rest_framework.test import APIClient
+    from cadastros.models import Aluno
+
+    repeticoes = opcoes['repeticoes']
+    quantidade = opcoes['linhas'] or 100_000
+    with dados_descartaveis():
+        aluno, = criar_alunos(1, com_usuario=True)
+        alunos = criar_alunos(quantidade)
+        # Sobrenome + número de um aluno do meio: casa com uma única linha
+        trecho = ' '.join(alunos[quantidade * 2 // 3].nome.split()[1:]).lower()
+        conexao = connections[DEFAULT_DB_ALIAS]
+        if conexao.vendor == 'postgresql':
+            # Estatísticas atualizadas para o planejador escolher os índices
+            with conexao.cursor() as cursor:
+                cursor.execute(f'ANALYZE {conexao.ops.quote_name(Aluno._meta.db_table)}')
+
+        cliente = APIClient()
+        cliente.force_authenticate(aluno.user)
+        urls = [
+            ('?nome= (trecho raro)', f'/api/v1/cadastros/alunos/?nome={trecho}'),
+            ('?nome= (trecho comum)', '/api/v1/cadastros/alunos/?nome=gabriela'),
+            ('?email=', f'/api/v1/cadastros/alunos/?email=aluno{quantidade // 2}.'),
+            ('busca?q= (prefixo)', '/api/v1/cadastros/alunos/busca/?q=heit'),
+            ('busca?q= (meio do nome)', f'/api/v1/cadastros/alunos/busca/?q={trecho}'),
+        ]
+
+        yield f'{quantidade} aluno(s) sintético(s), banco {conexao.vendor}'
+        for rotulo, url in urls:
+            def buscar(url=url):
+                resposta = cliente.get(url)
+                assert resposta.status_code == 200, resposta.content
+
+            yield formatar(rotulo, medir(buscar, repeticoes))
+            if conexao.vendor == 'postgresql':
+                with sem_indices():
+                    yield formatar(f'{rotulo}, sem índices', medir(buscar, repeticoes))
+
+
+@cenario('conexoes')
+def cenario_conexoes(opcoes):
+    """
+    Custo de abrir uma conexão por requisição (TCP + TLS + autenticação)
+    contra o de pegar uma conexão já aberta do pool do psycopg, com e sem
+    a verificação de saúde (CONN_HEALTH_CHECKS -> check_connection).
+
+    Usa os parâmetros de conexão do banco 'default' (DATABASE_URL), então
+    mede o mesmo caminho de rede e SSL da produção. Só PostgreSQL.
+    """
+    conexao = connections[DEFAULT_DB_ALIAS]
+    if conexao.vendor != 'postgresql':
+        raise CommandError('O cenário conexoes precisa de um DATABASE_URL PostgreSQL.')
+
+    from psycopg_pool import ConnectionPool
+
+    parametros = conexao.get_connection_params()
+    parametros['autocommit'] = True
+
+    def consultar(banco):
+        with banco.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+
+    def conexao_nova():
+        banco = conexao.Database.connect(**parametros)
+        try:
+            consultar(banco)
+        finally:
+            banco.close()
+
+    yield formatar('conexão nova por requisição', medir(conexao_nova, opcoes['repeticoes'], None))
+
+    for rotulo, verificacao in (('pool', None),
+                                ('pool + check_connection', ConnectionPool.check_connection)):
+        with ConnectionPool(kwargs=parametros, min_size=1, max_size=1,
+                            check=verificacao, open=True) as pool:
+            pool.wait()
+
+            def do_pool():
+                with pool.connection() as banco:
+                    consultar(banco)
+
+            yield formatar(rotulo, medir(do_pool, opcoes['repeticoes'], None))
+
+
+@contextmanager
+def banco_lento(atraso):
+    """
+    Simula um banco lento: cada consulta, em qualquer thread, espera
+    `atraso` segundos antes de executar (execute_wrapper em todas as
+    conexões abertas durante o bloco).
+    """
+    def esperar(execute, sql, params, many, context):
+        time.sleep(atraso)
+        return execute(sql, params, many, context)
+
+    def instalar(sender, connection, **kwargs):
+        # A mesma conexão reabre a cada requisição: instala uma vez só
+        if esperar not in connection.execute_wrappers:
+            connection.execute_wrappers.append(esperar)
+
+    connection_created.connect(instalar)
+    for conexao in connections.all(initialized_only=True):
+        instalar(None, conexao)
+    try:
+        yield
+    finally:
+        connection_created.disconnect(instalar)
+        for conexao in connections.all(initialized_only=True):
+            if esperar in conexao.execute_wrappers:
+                conexao.execute_wrappers.remove(esperar)
+
+
+def vazao_sincrona(view, requisicoes):
+    """
+    Requisições por segundo de uma view síncrona em um worker WSGI
+    síncrono: uma requisição por vez, fechando a conexão no fim de cada
+    uma, como o sinal request_finished.
+    """
+    inicio = time.perf_counter()
+    for requisicao, kwargs in requisicoes:
+        resposta = view(requisicao, **kwargs)
+        assert resposta.status_code == 200, resposta.content
+        close_old_connections()
+    return len(requisicoes) / (time.perf_counter() - inicio)
+
+
+def vazao_assincrona(view, requisicoes, concorrencia):
+    """
+    Requisições por segundo de uma view assíncrona em um worker ASGI, com
+    até `concorrencia` requisições em andamento. Cada uma roda em seu
+    próprio ThreadSensitiveContext, como no ASGIHandler do Django.
+    """
+    async def atender(requisicao, kwargs, vagas):
+        async with vagas, ThreadSensitiveContext():
+            resposta = await view(requisicao, **kwargs)
+            assert resposta.status_code == 200, resposta.content
+            await sync_to_async(close_old_connections)()
+
+    async def todas():
+        vagas = asyncio.Semaphore(concorrencia)
+        await asyncio.gather(*(atender(requisicao, kwargs, vagas)
+                               for requisicao, kwargs in requisicoes))
+
+    inicio = time.perf_counter()
+    asyncio.run(todas())
+    return len(requisicoes) / (time.perf_counter() - inicio)
+
+
+@cenario('assincrono')
+def cenario_assincrono(opcoes):
+    """
+    Vazão (requisições/s) de um worker com as views síncronas (WSGI, uma
+    requisição por vez) e com as variantes assíncronas (ASGI, várias
+    requisições em andamento), com um banco lento simulado (--atraso ms
+    por consulta).
+
+    As variantes assíncronas leem do banco em threads separadas, então os
+    dados do cenário precisam estar gravados: um usuário com token e um
+    plano são criados no início e removidos no fim.
+    """
+    from django.test import AsyncRequestFactory, RequestFactory
+    from rest_framework.authtoken.models import Token
+    from exercicios.views import exercicios_list, exercicios_list_async
+    from planos.models import Plano
+    from planos.views import plano_detail, plano_detail_async
+
+    quantidade = opcoes['linhas'] or 200
+    atraso = opcoes['atraso'] / 1000
+    concorrencia = opcoes['concorrencia']
+
+    leva = next(_levas)
+    user = User.objects.create(username=f'bench-async-{leva}')
+    token = Token.objects.create(user=user)
+    plano = Plano.objects.create(titulo='Benchmark', preco=100)
+    cabecalhos = {'headers': {'Authorization': f'Token {token.key}'}}
+    rotas = [
+        ('GET /api/v1/planos/detail/<pk>/', plano_detail, plano_detail_async,
+         f'/api/v1/planos/detail/{plano.pk}/', {'pk': plano.pk}),
+        ('GET /api/v1/exercicios/', exercicios_list, exercicios_list_async,
+         '/api/v1/exercicios/', {}),
+    ]
+    try:
+        yield (f'{quantidade} requisição(ões) por medida, {opcoes["atraso"]} ms por consulta, '
+               f'concorrência {concorrencia} no ASGI')
+        for rotulo, sincrona, assincrona, url, kwargs in rotas:
+            # Aquece caches (token, respostas, catálogo) antes de medir
+            sincrona(RequestFactory().get(url, **cabecalhos), **kwargs)
+
+            with banco_lento(atraso):
+                fabrica = RequestFactory()
+                wsgi = vazao_sincrona(sincrona, [
+                    (fabrica.get(url, **cabecalhos), kwargs) for _ in range(quantidade)])
+                fabrica = AsyncRequestFactory()
+                asgi = vazao_assincrona(assincrona, [
+                    (fabrica.get(url, **cabecalhos), kwargs) for _ in range(quantidade)],
+                    concorrencia)
+            yield f'{rotulo:<44} WSGI {wsgi:8.1f} req/s   ASGI {asgi:8.1f} req/s'
+    finally:
+        Plano.all_objects.filter(pk=plano.pk).delete()
+        user.delete()
+
+
+def criar_treinos(alunos, exercicios, por_aluno=1):
+    """
+    Cria `por_aluno` treinos para cada aluno, cada um com todos os
+    `exercicios`, com bulk_create (sem signals).
+
+    Returns:
+        list[Treino]: Treinos criados, com pk
+    """
+    from core.choices import OBJETIVO_TREINO
+    from treinos.models import ExercicioTreino, Treino
+
+    objetivos = [valor for valor, _ in OBJETIVO_TREINO]
+    treinos = Treino.objects.bulk_create([
+        Treino(aluno=aluno, nome=f'Treino {letra}', objetivo=objetivos[i % len(objetivos)])
+        for i, aluno in enumerate(alunos)
+        for letra in 'ABCDEFGH'[:por_aluno]
+    ], batch_size=5000)
+    ExercicioTreino.objects.bulk_create([
+        ExercicioTreino(treino=treino, exercicio=exercicio, series=3 + j % 3,
+                        repeticoes=8 + j % 5, carga=f'{10 + (i + j) % 60}.50')
+        for i, treino in enumerate(treinos)
+        for j, exercicio in enumerate(exercicios)
+    ], batch_size=5000)
+    return treinos
+
+
+@cenario('json')
+def cenario_json(opcoes):
+    """
+    Renderização e leitura de JSON com o renderer/parser padrão do DRF e
+    com os de orjson (core/renderers.py, core/parsers.py), sobre a saída
+    real do TreinoSerializer: N treinos (padrão: 200) com 10 exercícios
+    cada, com Decimal (carga, peso, altura) e datas.
+    """
+    import io
+
+    from django.db.models import Prefetch
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from core.parsers import ORJSONParser
+    from core.renderers import ORJSONRenderer
+    from treinos.models import ExercicioTreino, Treino
+    from treinos.serializers import TreinoSerializer
+
+    repeticoes = opcoes['repeticoes']
+    quantidade = opcoes['linhas'] or 200
+    with dados_descartaveis():
+        alunos = criar_alunos(quantidade)
+        treinos = criar_treinos(alunos, criar_exercicios(10))
+        # Mesmo queryset da listagem de treinos (TreinoViewSet.get_queryset)
+        instancias = list(
+            Treino.all_objects.filter(pk__in=[treino.pk for treino in treinos])
+            .order_by('id')
+            .select_related('aluno')
+            .prefetch_related(Prefetch(
+                'exercicios',
+                queryset=ExercicioTreino.all_objects.select_related('exercicio').order_by('id')))
+        )
+
+    def serializar():
+        return TreinoSerializer(instancias, many=True).data
+
+    dados = serializar()
+    corpo = JSONRenderer().render(dados)
+    assert ORJSONRenderer().render(dados) == corpo
+
+    yield f'{quantidade} treino(s) com 10 exercícios, {len(corpo) / 1024:.0f} KB de JSON'
+    yield formatar('TreinoSerializer(many=True).data', medir(serializar, repeticoes, None))
+    for rotulo, renderer in (('render JSONRenderer (DRF)', JSONRenderer()),
+                             ('render ORJSONRenderer', ORJSONRenderer())):
+        yield formatar(rotulo, medir(lambda: renderer.render(dados), repeticoes, None))
+    for rotulo, parser in (('parse JSONParser (DRF)', JSONParser()),
+                           ('parse ORJSONParser', ORJSONParser())):
+        yield formatar(rotulo, medir(
+            lambda: parser.parse(io.BytesIO(corpo), 'application/json'), repeticoes, None))
+
+
+@cenario('volume')
+def cenario_volume(opcoes):
+    """
+    Volume semanal por grupo muscular (treinos/analise.py) sobre N séries
+    registradas sintéticas (padrão: 100 mil; 40 por aluno, em 4 sessões de
+    semanas diferentes).
+
+    Compara uma página do endpoint /treinos/volume/ (50 alunos, uma
+    consulta agrupada com LAG) com o cálculo em Python percorrendo as
+    séries das sessões de cada aluno, e mede também todos os alunos de
+    uma vez.
+    """
+    from django.utils import timezone
+    from treinos.analise import volume_semanal
+    from treinos.models import SerieRegistrada, SessaoTreino
+
+    repeticoes = opcoes['repeticoes']
+    quantidade = opcoes['linhas'] or 100_000
+    with dados_descartaveis():
+        alunos = criar_alunos(max(1, quantidade // 40))
+        exercicios = criar_exercicios(10)
+        # Cada aluno tem 4 sessões, uma a cada 3 semanas, com 10 séries cada
+        agora = timezone.now()
+        sessoes = SessaoTreino.objects.bulk_create([
+            SessaoTreino(aluno=aluno, inicio=agora - datetime.timedelta(weeks=3 * indice))
+            for aluno in alunos
+            for indice in range(4)
+        ], batch_size=5000)
+        SerieRegistrada.objects.bulk_create([
+            SerieRegistrada(sessao=sessao, aluno_id=sessao.aluno_id, exercicio=exercicio,
+                            repeticoes=8 + j % 5, carga=f'{10 + (i + j) % 60}.50',
+                            registrado_em=sessao.inicio + datetime.timedelta(minutes=2 * j))
+            for i, sessao in enumerate(sessoes)
+            for j, exercicio in enumerate(exercicios)
+        ], batch_size=5000)
+
+        inicio = timezone.localdate() - datetime.timedelta(weeks=12)
+        pagina = [aluno.pk for aluno in alunos[:50]]
+        todos = [aluno.pk for aluno in alunos]
+
+        def em_python(alunos_ids):
+            semanas = {}
+            for aluno_id in alunos_ids:
+                for sessao in SessaoTreino.objects.filter(aluno_id=aluno_id):
+                    for serie in sessao.series.select_related('exercicio'):
+                        data = timezone.localtime(serie.registrado_em).date()
+                        if data < inicio:
+                            continue
+                        chave = (aluno_id, serie.exercicio.grupo_muscular,
+                                 data - datetime.timedelta(days=data.weekday()))
+                        semanas[chave] = semanas.get(chave, 0) + (
+                            serie.repeticoes * (serie.carga or 0))
+            return semanas
+
+        yield (f'{len(alunos) * 40} série(s) registrada(s), {len(alunos)} aluno(s), '
+               f'banco {connections[DEFAULT_DB_ALIAS].vendor}')
+        yield formatar('página (50 alunos), em Python',
+                       medir(lambda: em_python(pagina), repeticoes))
+        yield formatar('página (50 alunos), volume_semanal',
+                       medir(lambda: volume_semanal(pagina, inicio=inicio), repeticoes))
+        yield formatar(f'todos ({len(todos)} alunos), volume_semanal',
+                       medir(lambda: volume_semanal(todos, inicio=inicio), max(1, repeticoes // 10)))
+
+
+def linhas_importacao(quantidade):
+    """
+    Linhas sintéticas no formato de cadastros.importacao (as mesmas chaves
+    do CSV/JSONL), com um endereço para cada 4 alunos.
+
+    Yields:
+        tuple: (número da linha, dict da linha)
+    """
+    leva = next(_levas)
+    for i in range(quantidade):
+        yield i + 2, {
+            'nome': f'Aluno Importado {i}',
+            'cpf': '{0:03d}.{1:03d}.{2:03d}-{3:02d}'.format(
+                900 + leva % 100, i // 10 ** 5 % 1000, i // 100 % 1000, i % 100),
+            'email': f'importado{i}.{leva}@benchmark.dumbbell',
+            'sexo': 'MF'[i % 2],
+            'data_nascimento': '1990-01-01',
+            'peso': '75.50',
+            'altura': '1.75',
+            'password': f'senha-benchmark-{i}',
+            'cep': '01310-100',
+            'rua': 'Avenida Paulista',
+            'numero': f'{leva}-{i // 4}',
+            'complemento': '',
+            'bairro': 'Bela Vista',
+            'cidade': 'São Paulo',
+            'estado': 'SP',
+        }
+
+
+@cenario('importacao')
+def cenario_importacao(opcoes):
+    """
+    Vazão (alunos/s) da importação em massa (cadastros/importacao.py),
+    com o hash das senhas no próprio processo e no pool de processos,
+    comparada ao cadastro um a um pela API (POST /cadastros/alunos/).
+
+    O PBKDF2 domina o tempo, então o número de CPUs da máquina decide o
+    ganho do pool. Por isso os dois caminhos são medidos de novo com o
+    hash MD5, o que isola o custo de validação e gravação. Padrão: 200
+    linhas (a API mede no máximo 50).
+    """
+    import os
+
+    from django.test import override_settings
+    from rest_framework.test import APIClient
+    from cadastros.importacao import importar_alunos
+    from core.models import EnderecoModel
+
+    quantidade = opcoes['linhas'] or 200
+    cpus = os.cpu_count() or 1
+
+    def linha(rotulo, total, segundos):
+        return f'{rotulo:<44} {total:>6} aluno(s) em {segundos:8.2f} s   {total / segundos:8.1f} aluno(s)/s'
+
+    yield f'{quantidade} linha(s), {cpus} CPU(s), banco {connections[DEFAULT_DB_ALIAS].vendor}'
+
+    def medir_importacao(sufixo, processos_testados):
+        endereco = EnderecoModel.objects.create(
+            cep='01310-100', rua='Avenida Paulista', numero=f'api-{next(_levas)}',
+            bairro='Bela Vista', cidade='São Paulo', estado='SP')
+        cliente = APIClient()
+        corpos = [dict(dados, endereco=endereco.pk)
+                  for _, dados in linhas_importacao(min(quantidade, 50))]
+        inicio = time.perf_counter()
+        for corpo in corpos:
+            resposta = cliente.post('/api/v1/cadastros/alunos/', corpo, format='json')
+            assert resposta.status_code == 201, resposta.content
+        yield linha(f'API, um POST por aluno{sufixo}', len(corpos), time.perf_counter() - inicio)
+
+        for processos in processos_testados:
+            inicio = time.perf_counter()
+            criados, recusadas = importar_alunos(
+                linhas_importacao(quantidade), lote=500, processos=processos)
+            assert recusadas == 0 and criados == quantidade
+            yield linha(f'importar_alunos, {processos} processo(s){sufixo}',
+                        criados, time.perf_counter() - inicio)
+
+    with dados_descartaveis():
+        yield from medir_importacao('', sorted({1, cpus}))
+        # Sem o PBKDF2, sobra o custo de validação e gravação de cada
+        # caminho (os processos do pool não herdam o override, então só 1)
+        with override_settings(
+                PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+            yield from medir_importacao(', hash MD5', [1])
@@ -0,0 +1,208 @@
+# =============================================================================
+# ARQUIVO: core/conditional.py
+# DESCRIÇÃO: GET condicional (ETag / Last-Modified) do projeto Dumbbell Fitness
+# FUNÇÃO: Responde 304 sem serializar quando os dados não mudaram
+# =============================================================================
+
+# Hash usado para montar a ETag
+import hashlib
+
+# Paginador do DRF (síncrono) nas views assíncronas
+from asgiref.sync import sync_to_async
+
+# Agregações usadas na "impressão digital" do queryset
+from django.db.models import Count, Max
+# Utilitários do Django para cabeçalhos e avaliação de If-None-Match/If-Modified-Since
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+# Request do DRF (query_params) para o paginador nas views assíncronas
+from rest_framework.request import Request
+
+
+class _NaoModificado(Exception):
+    """Sinaliza, de dentro do initial(), que a resposta deve ser 304."""
+
+    def __init__(self, resposta):
+        self.resposta = resposta
+
+
+def _agregados(campos):
+    """Agregações MAX() de cada campo de data, nomeadas max_0, max_1, ..."""
+    return {f'max_{i}': Max(campo) for i, campo in enumerate(campos)}
+
+
+def _etag(request, user_pk, media_type, partes):
+    """ETag (hash MD5) da URL, do usuário, do formato e das partes informadas."""
+    base = '|'.join([request.build_absolute_uri(), str(user_pk), media_type or '', *partes])
+    return '"%s"' % hashlib.md5(base.encode()).hexdigest()
+
+
+def _montar_etag(request, user_pk, media_type, dados, quantidade_campos):
+    """
+    Monta (ETag, Last-Modified) a partir do resultado da agregação.
+
+    Returns:
+        tuple: (etag, last_modified) com last_modified em segundos
+               desde a época, ou None se o queryset estiver vazio
+    """
+    datas = [dados[f'max_{i}'] for i in range(quantidade_campos)]
+    datas = [data for data in datas if data is not None]
+    last_modified = int(max(datas).timestamp()) if datas else None
+
+    partes = [str(dados['total']), *[data.isoformat() for data in datas]]
+    return _etag(request, user_pk, media_type, partes), last_modified
+
+
+def impressao_da_pagina(request, queryset, paginator, campos=('atualizacao',), user_pk=None,
+                        media_type='application/json', view=None):
+    """
+    ETag de uma página de listagem, a partir das linhas da própria página.
+
+    Busca, com o mesmo paginador da view (mesmo cursor e page_size), só o
+    pk, os campos de data e os campos da ordenação das linhas da página:
+    uma consulta do tamanho da página, e não da tabela. Entram na ETag o pk
+    e as datas de cada linha (alterações e exclusões na página) e os links
+    next/previous (linhas novas logo depois ou antes da página).
+
+    Args:
+        request: Request do DRF
+        queryset: Queryset listado pela view, já filtrado
+        paginator: Instância nova do paginador da view
+        campos: Campos de data de cada linha
+        user_pk: Id do usuário autenticado (None para anônimo)
+        media_type: Formato negociado da resposta
+        view: View da listagem (usada pelo paginador, pode ser None)
+
+    Returns:
+        str: ETag da página
+    """
+    nomes = {'pk', *campos}
+    if hasattr(paginator, 'get_ordering'):
+        nomes.update(campo.lstrip('-') for campo in paginator.get_ordering(request, queryset, view))
+    linhas = paginator.paginate_queryset(queryset.values(*nomes), request, view=view)
+
+    partes = [paginator.get_next_link() or '', paginator.get_previous_link() or '']
+    for linha in linhas:
+        partes.append(str(linha['pk']))
+        partes.extend(linha[campo].isoformat() if linha[campo] else '' for campo in campos)
+    return _etag(request, user_pk, media_type, partes)
+
+
+async def impressao_da_pagina_async(request, queryset, paginator, campos=('atualizacao',),
+                                    user_pk=None):
+    """
+    Versão assíncrona de impressao_da_pagina, para as views assíncronas
+    (perfil ASGI). Gera a mesma ETag da view síncrona para o mesmo usuário
+    pedindo JSON.
+
+    O paginador do DRF é síncrono, então a consulta da página roda na
+    thread das views síncronas (sync_to_async). O request.user não é lido
+    aqui: em código assíncrono ele dispararia a consulta da sessão de
+    forma síncrona; a view resolve o usuário e informa user_pk.
+
+    Args:
+        request: HttpRequest do Django
+        queryset: Queryset listado pela view
+        paginator: Instância nova do paginador da view síncrona
+        campos: Campos de data de cada linha
+        user_pk: Id do usuário autenticado (None para anônimo)
+
+    Returns:
+        str: ETag da página
+    """
+    return await sync_to_async(impressao_da_pagina)(
+        Request(request), queryset, paginator, campos, user_pk)
+
+
+class CondicionalGetMixin:
+    """
+    Mixin de ViewSet que adiciona ETag em list e retrieve, e Last-Modified
+    só em retrieve.
+
+    Antes de executar a ação, calcula uma "impressão digital" barata com
+    uma única consulta. Se o cliente enviar If-None-Match ou
+    If-Modified-Since compatíveis, a view responde 304 sem serializar os
+    registros.
+
+    - No detalhe: MAX(atualizacao) e COUNT(*) do registro
+    - Na listagem: pk e atualizacao das linhas da página pedida, mais os
+      links next/previous (ver impressao_da_pagina). A consulta custa o
+      mesmo que a página, e não cresce com a tabela
+    - atualizacao vem do BaseModel (auto_now), então qualquer save muda a ETag
+    - A URL completa (cursor, filtros) e o usuário entram na ETag, então
+      cada página e cada usuário têm a sua
+    - Na listagem vale só a ETag: uma exclusão não aumenta a atualizacao
+      de nenhuma linha, então If-Modified-Since responderia 304 com um
+      registro a menos
+
+    Use antes do ViewSet do DRF na herança:
+        class TreinoViewSet(CondicionalGetMixin, viewsets.ModelViewSet): ...
+
+    Atributo opcional:
+        condicional_campos: campos de data conferidos (padrão
+        ['atualizacao']). Inclua campos de relacionados serializados junto,
+        ex.: ['atualizacao', 'aluno__atualizacao'].
+    """
+    condicional_campos = ['atualizacao']
+
+    def _queryset_condicional(self):
+        """Queryset cuja impressão digital define a ETag da ação atual."""
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset
+
+    def _impressao_digital(self, queryset):
+        """
+        Calcula (ETag, Last-Modified) do queryset com uma única consulta.
+
+        Returns:
+            tuple: (etag, last_modified) com last_modified em segundos
+                   desde a época, ou None se o queryset estiver vazio
+        """
+        agregados = _agregados(self.condicional_campos)
+        dados = queryset.order_by().aggregate(total=Count('pk'), **agregados)
+        return _montar_etag(
+            self.request, self.request.user.pk, self.request.accepted_media_type,
+            dados, len(self.condicional_campos))
+
+    def initial(self, request, *args, **kwargs):
+        """
+        Após autenticação e permissões, verifica se a resposta pode ser 304.
+        """
+        super().initial(request, *args, **kwargs)
+
+        self._etag = self._last_modified = None
+        if request.method not in ('GET', 'HEAD') or self.action not in ('list', 'retrieve'):
+            return
+
+        queryset = self._queryset_condicional()
+        if self.action == 'retrieve':
+            self._etag, self._last_modified = self._impressao_digital(queryset)
+        elif self.paginator is not None:
+            # Listagem: só a ETag da página (ver docstring da classe)
+            self._etag = impressao_da_pagina(
+                request, queryset, self.pagination_class(), self.condicional_campos,
+                request.user.pk, request.accepted_media_type, view=self)
+        else:
+            self._etag, _ = self._impressao_digital(queryset)
+        resposta = get_conditional_response(
+            request, etag=self._etag, last_modified=self._last_modified)
+        if resposta is not None:
+            raise _NaoModificado(resposta)
+
+    def handle_exception(self, exc):
+        """Devolve a resposta 304 montada no initial()."""
+        if isinstance(exc, _NaoModificado):
+            return exc.resposta
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Adiciona ETag (list/retrieve) e Last-Modified (retrieve) nas respostas 200/304."""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, '_etag', None) and response.status_code in (200, 304):
+            response['ETag'] = self._etag
+            if self._last_modified is not None:
+                response['Last-Modified'] = http_date(self._last_modified)
+        return response
@@ -0,0 +1,178 @@
+# =============================================================================
+# ARQUIVO: core/db_router.py
+# DESCRIÇÃO: Roteamento de leituras para réplicas do projeto Dumbbell Fitness
+# FUNÇÃO: Envia leituras seguras às réplicas e mantém escritas no banco principal
+# =============================================================================
+
+"""
+Réplicas de leitura.
+
+Ativado quando settings.DATABASE_REPLICAS não está vazio (variável
+DATABASE_REPLICA_URLS). Duas peças:
+
+- ReplicaMiddleware decide, por requisição, se as leituras podem ir para
+  uma réplica: só em GET/HEAD/OPTIONS, em views que não desligaram o uso
+  de réplica (usar_replica = False) e para clientes que não escreveram
+  nos últimos REPLICA_STICKY_SEGUNDOS (read-your-writes).
+- ReplicaRouter aplica essa decisão: leituras vão para a réplica
+  sorteada para a requisição quando permitido; todo o resto vai para o
+  'default'.
+
+A réplica é sorteada uma vez por requisição (no process_view) e usada em
+todas as leituras dela: as consultas de uma mesma resposta veem o mesmo
+estado da replicação, e cada requisição abre conexão com uma réplica só.
+
+Sempre no 'default', mesmo em GET:
+- Escritas e leituras dentro de transaction.atomic()
+- Tokens e sessões (um token recém-criado no login ainda pode não ter
+  chegado à réplica)
+- Código fora de requisições (comandos, threads em segundo plano)
+"""
+
+# Identificação do cliente sem guardar o token em texto puro
+import hashlib
+# Sorteio da réplica da requisição
+import random
+# Estado por requisição (funciona com threads e com código assíncrono)
+from contextvars import ContextVar
+
+# Detecta/marca corrotinas (middleware que funciona em WSGI e em ASGI)
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Métodos que não alteram dados
+METODOS_SEGUROS = ('GET', 'HEAD', 'OPTIONS')
+
+# Apps cujos modelos são sempre lidos do banco principal
+APPS_SEMPRE_PRIMARIO = {'authtoken', 'sessions'}
+
+# Réplica sorteada para a requisição atual, ou None se ela lê do principal
+_leitura_em_replica = ContextVar('leitura_em_replica', default=None)
+
+
+def _chave_cliente(request):
+    """
+    Identifica o cliente para a marca de "escreveu há pouco".
+
+    Usa o header Authorization (token) ou, sem ele, o cookie de sessão.
+    O valor vai para o cache como hash, nunca em texto puro.
+
+    Returns:
+        str | None: Chave de cache do cliente, ou None se anônimo
+    """
+    credencial = request.META.get('HTTP_AUTHORIZATION') or request.COOKIES.get(
+        settings.SESSION_COOKIE_NAME)
+    if not credencial:
+        return None
+    return 'replica-sticky:' + hashlib.sha256(credencial.encode()).hexdigest()
+
+
+def _cache():
+    """Cache onde ficam as marcas de escrita recente."""
+    return caches[getattr(settings, 'REPLICA_STICKY_CACHE', 'default')]
+
+
+class ReplicaMiddleware:
+    """
+    Middleware que libera a leitura em réplica para a requisição atual.
+
+    Deve ficar em settings.MIDDLEWARE junto com o ReplicaRouter (o
+    settings.py adiciona os dois quando há réplicas configuradas).
+
+    Para manter uma view sempre no banco principal, declare na classe (ou
+    na função) da view:
+        usar_replica = False
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        chave = _chave_cliente(request)
+        request._replica_permitida = (
+            request.method in METODOS_SEGUROS
+            and not (chave and _cache().get(chave))
+        )
+
+        try:
+            response = self.get_response(request)
+        finally:
+            # A thread do worker atende outras requisições depois desta
+            token = getattr(request, '_replica_token', None)
+            if token is not None:
+                _leitura_em_replica.reset(token)
+
+        # Quem escreveu lê do principal por alguns segundos
+        if request.method not in METODOS_SEGUROS and chave and response.status_code < 500:
+            _cache().set(chave, True, getattr(settings, 'REPLICA_STICKY_SEGUNDOS', 10))
+        return response
+
+    async def __acall__(self, request):
+        """
+        Mesmo fluxo no ASGI. Cada requisição roda em uma task com cópia
+        própria do contexto, então a marca não precisa ser desfeita no fim.
+        """
+        chave = _chave_cliente(request)
+        request._replica_permitida = (
+            request.method in METODOS_SEGUROS
+            and not (chave and await _cache().aget(chave))
+        )
+
+        response = await self.get_response(request)
+
+        if request.method not in METODOS_SEGUROS and chave and response.status_code < 500:
+            await _cache().aset(chave, True, getattr(settings, 'REPLICA_STICKY_SEGUNDOS', 10))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Sorteia a réplica da requisição, só para views que permitem."""
+        classe = getattr(view_func, 'cls', None)
+        permitida = (
+            getattr(request, '_replica_permitida', False)
+            and getattr(view_func, 'usar_replica', True)
+            and getattr(classe, 'usar_replica', True)
+        )
+        replica = random.choice(settings.DATABASE_REPLICAS) if permitida else None
+        request._replica_token = _leitura_em_replica.set(replica)
+        return None
+
+
+class ReplicaRouter:
+    """
+    Router de banco: leituras liberadas vão para a réplica da requisição,
+    o resto para o 'default'.
+
+    Registrado em settings.DATABASE_ROUTERS quando há réplicas.
+    """
+
+    def db_for_read(self, model, **hints):
+        replica = _leitura_em_replica.get()
+        if replica is None:
+            return DEFAULT_DB_ALIAS
+        if model._meta.app_label in APPS_SEMPRE_PRIMARIO:
+            return DEFAULT_DB_ALIAS
+        # Dentro de uma transação, lê do mesmo banco em que escreve
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return replica
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Réplicas têm os mesmos dados do principal
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Migrações só no principal; as réplicas recebem pela replicação
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,162 @@
+# =============================================================================
+# ARQUIVO: core/exclusao.py
+# DESCRIÇÃO: Exclusão em lotes do projeto Dumbbell Fitness
+# FUNÇÃO: Apaga grandes volumes de linhas dependentes sem carregá-las na memória
+# =============================================================================
+
+"""
+Exclusão em lotes (cascatas grandes).
+
+O QuerySet.delete() do Django carrega as linhas na memória sempre que o
+modelo tem signals ou dependentes, e as views faziam count() + delete()
+fora de transação. Aqui cada lote é um DELETE ... WHERE id IN (...) direto
+no banco, dentro de uma transação curta, e o progresso vai para o log.
+
+As funções de cascata de cada app (ex.: exercicios/exclusao.py) usam
+excluir_em_lotes para as linhas dependentes e apagam o registro principal
+por último, com o delete() normal (signals incluídos).
+
+O DELETE direto não dispara pre_delete/post_delete. No lugar deles, cada
+lote envia o signal pre_exclusao_lote (sender=modelo, ids, using), antes
+do DELETE e na mesma transação: quem mantém dados derivados por signal de
+exclusão (ex.: o resumo do aluno em treinos/signals.py) deve ouvir também
+esse signal. Modelos com dependentes (outros modelos com FK para eles)
+são recusados, porque o DELETE direto não segue a cascata.
+
+Dependentes com on_delete=PROTECT são conferidos por conferir_protegidos
+antes da cascata e de novo na transação que apaga o registro principal.
+"""
+
+import logging
+# Thread para as cascatas grandes, fora do ciclo da requisição
+import threading
+
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models import ProtectedError
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+# Enviado antes do DELETE de cada lote, com sender=modelo, ids e using
+pre_exclusao_lote = Signal()
+
+
+def tamanho_lote():
+    """Quantidade de linhas apagadas por lote (settings.EXCLUSAO_TAMANHO_LOTE)."""
+    return getattr(settings, 'EXCLUSAO_TAMANHO_LOTE', 5000)
+
+
+def limite_sincrono():
+    """
+    Quantidade máxima de linhas dependentes apagadas durante a requisição
+    (settings.EXCLUSAO_LIMITE_SINCRONO). Acima disso, a cascata roda em
+    segundo plano.
+    """
+    return getattr(settings, 'EXCLUSAO_LIMITE_SINCRONO', 10000)
+
+
+def excluir_em_lotes(queryset, lote=None, antes_do_lote=None, descricao=None):
+    """
+    Apaga as linhas do queryset em lotes, um DELETE set-based por lote.
+
+    Não dispara pre_delete/post_delete nem segue dependentes: envia
+    pre_exclusao_lote a cada lote e só aceita modelos sem dependentes.
+
+    Args:
+        queryset: Linhas a apagar
+        lote (int | None): Linhas por lote (padrão: tamanho_lote())
+        antes_do_lote (callable | None): Chamado com a lista de ids de cada
+            lote, na mesma transação, antes do DELETE
+        descricao (str | None): Nome usado nas mensagens de progresso
+
+    Returns:
+        int: Total de linhas apagadas
+
+    Raises:
+        ValueError: Se outro modelo tiver FK para o modelo do queryset
+    """
+    modelo = queryset.model
+    dependentes = [
+        relacao.related_model._meta.label for relacao in modelo._meta.related_objects
+        if relacao.on_delete is not models.DO_NOTHING
+    ]
+    if dependentes:
+        raise ValueError(
+            f"{modelo._meta.label} tem dependentes ({', '.join(dependentes)}); "
+            "a exclusão em lotes não segue a cascata.")
+
+    lote = lote or tamanho_lote()
+    descricao = descricao or modelo._meta.verbose_name_plural
+    banco = queryset.db
+    total = 0
+
+    while True:
+        with transaction.atomic(using=banco):
+            ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:lote])
+            if not ids:
+                break
+            if antes_do_lote is not None:
+                antes_do_lote(ids)
+            pre_exclusao_lote.send(sender=modelo, ids=ids, using=banco)
+            # _raw_delete é o DELETE direto usado pelo próprio Django no
+            # "fast delete": uma instrução, sem carregar as linhas
+            apagadas = modelo._base_manager.using(banco).filter(
+                pk__in=ids)._raw_delete(banco)
+        total += apagadas
+        logger.info("Exclusão em lotes: %s %s apagados até agora", total, descricao)
+
+    return total
+
+
+def conferir_protegidos(instancia, ignorar=()):
+    """
+    Confere se a instância tem dependentes com on_delete=PROTECT.
+
+    Chamado antes de apagar qualquer dependente (também no caminho em
+    segundo plano, em que a conferência da view já pode estar velha) e de
+    novo na transação que apaga o registro principal, com a linha travada.
+
+    Args:
+        instancia: Registro que será apagado
+        ignorar (iterable): Modelos protegidos que a própria cascata apaga
+            antes (ex.: ExercicioTreino na exclusão de um exercício)
+
+    Raises:
+        ProtectedError: Se houver algum dependente protegido
+    """
+    for relacao in instancia._meta.related_objects:
+        if relacao.on_delete is not models.PROTECT or relacao.related_model in ignorar:
+            continue
+        dependente = relacao.related_model._base_manager.using(instancia._state.db).filter(
+            **{relacao.field.name: instancia.pk}).first()
+        if dependente is not None:
+            raise ProtectedError(
+                f"{relacao.related_model._meta.verbose_name_plural} dependem de "
+                f"{instancia._meta.label} {instancia.pk}.",
+                [dependente])
+
+
+def executar_em_segundo_plano(funcao, *args, nome=None):
+    """
+    Executa uma cascata em uma thread própria, depois do commit atual.
+
+    A thread usa uma conexão própria com o banco e a fecha ao terminar.
+    Erros vão para o log; rodar a cascata de novo continua de onde parou,
+    porque cada lote já apagado foi confirmado.
+
+    Args:
+        funcao (callable): Função de cascata a executar
+        *args: Argumentos da função
+        nome (str | None): Nome da thread (aparece no log)
+    """
+    def rodar():
+        try:
+            funcao(*args)
+        except Exception:
+            logger.exception("Falha na exclusão em segundo plano %s", nome or funcao.__name__)
+        finally:
+            connections.close_all()
+
+    transaction.on_commit(
+        lambda: threading.Thread(target=rodar, name=nome, daemon=False).start())
@@ -0,0 +1,215 @@
+# =============================================================================
+# ARQUIVO: core/exportacao.py
+# DESCRIÇÃO: Exportação de dados do projeto Dumbbell Fitness
+# FUNÇÃO: Gera CSV/NDJSON de alunos, matrículas e treinos em streaming
+# =============================================================================
+
+"""
+Exportação em streaming (CSV ou NDJSON).
+
+As listagens da API montam a resposta inteira na memória antes de enviar.
+Aqui as linhas são lidas com .values_list(...).iterator(chunk_size=...)
+(cursor no servidor no PostgreSQL, sem instanciar os modelos) e enviadas
+em blocos de EXPORTACAO_TAMANHO_LOTE linhas: a memória usada depende do
+tamanho do bloco, não do total exportado.
+
+Usado pela view ExportacaoView (core/views.py), com StreamingHttpResponse,
+e pelo comando exportar_dados, que grava em arquivo.
+"""
+
+import csv
+import datetime
+import decimal
+# Buffer de texto reaproveitado pelo csv.writer a cada bloco
+import io
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from cadastros.models import Aluno, Matricula
+from treinos.models import ExercicioTreino, Treino
+
+# Mesmo renderer JSON das respostas da API (orjson)
+from .renderers import ORJSONRenderer
+
+# Formatos aceitos: {formato: (content type, extensão do arquivo)}
+FORMATOS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+
+def _treinos():
+    """Treinos com o total de exercícios ativos (subconsulta, sem GROUP BY)."""
+    exercicios = (
+        ExercicioTreino.objects
+        .filter(treino=OuterRef('pk'))
+        .order_by()
+        .values('treino')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Treino.all_objects.annotate(total_exercicios=Coalesce(Subquery(exercicios), 0))
+
+
+# Exportações disponíveis: {nome: (queryset, [(coluna, campo do values_list)])}
+# Incluem os registros inativos (coluna ativo); CPF e dados de cartão ficam de fora
+EXPORTACOES = {
+    'alunos': (
+        lambda: Aluno.all_objects.all(),
+        [
+            ('id', 'pk'),
+            ('nome', 'nome'),
+            ('email', 'email'),
+            ('sexo', 'sexo'),
+            ('data_nascimento', 'data_nascimento'),
+            ('peso', 'peso'),
+            ('altura', 'altura'),
+            ('cidade', 'endereco__cidade'),
+            ('estado', 'endereco__estado'),
+            ('ativo', 'ativo'),
+            ('criacao', 'criacao'),
+            ('atualizacao', 'atualizacao'),
+        ],
+    ),
+    'matriculas': (
+        lambda: Matricula.all_objects.all(),
+        [
+            ('id', 'pk'),
+            ('aluno', 'aluno_id'),
+            ('aluno_nome', 'aluno__nome'),
+            ('plano', 'plano_id'),
+            ('plano_titulo', 'plano__titulo'),
+            ('plano_preco', 'plano__preco'),
+            ('forma_pagamento', 'forma_pagamento'),
+            ('ativo', 'ativo'),
+            ('criacao', 'criacao'),
+            ('atualizacao', 'atualizacao'),
+        ],
+    ),
+    'treinos': (
+        _treinos,
+        [
+            ('id', 'pk'),
+            ('aluno', 'aluno_id'),
+            ('aluno_nome', 'aluno__nome'),
+            ('nome', 'nome'),
+            ('objetivo', 'objetivo'),
+            ('total_exercicios', 'total_exercicios'),
+            ('ativo', 'ativo'),
+            ('criacao', 'criacao'),
+            ('atualizacao', 'atualizacao'),
+        ],
+    ),
+}
+
+
+def tamanho_lote():
+    """Linhas lidas do banco e enviadas por bloco (settings.EXPORTACAO_TAMANHO_LOTE)."""
+    return getattr(settings, 'EXPORTACAO_TAMANHO_LOTE', 2000)
+
+
+def _valor(valor):
+    """
+    Converte um valor como nas respostas da API: data/hora no fuso do
+    projeto e Decimal como texto (sem perder as casas decimais).
+    """
+    if isinstance(valor, datetime.datetime) and timezone.is_aware(valor):
+        return timezone.localtime(valor).isoformat()
+    if isinstance(valor, decimal.Decimal):
+        return str(valor)
+    return valor
+
+
+def _blocos(linhas, tamanho):
+    """Agrupa um iterador em listas de até `tamanho` itens."""
+    bloco = []
+    for linha in linhas:
+        bloco.append(linha)
+        if len(bloco) >= tamanho:
+            yield bloco
+            bloco = []
+    if bloco:
+        yield bloco
+
+
+def _gerar_csv(colunas, linhas, tamanho):
+    """Blocos de bytes do CSV: o cabeçalho e depois `tamanho` linhas por bloco."""
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+
+    def esvaziar():
+        conteudo = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return conteudo
+
+    escritor.writerow(colunas)
+    yield esvaziar()
+    for bloco in _blocos(linhas, tamanho):
+        escritor.writerows([_valor(valor) for valor in linha] for linha in bloco)
+        yield esvaziar()
+
+
+def _gerar_ndjson(colunas, linhas, tamanho):
+    """Blocos de bytes do NDJSON: um objeto JSON por linha."""
+    renderer = ORJSONRenderer()
+    for bloco in _blocos(linhas, tamanho):
+        yield b''.join(
+            renderer.render(dict(zip(colunas, map(_valor, linha)))) + b'\n'
+            for linha in bloco
+        )
+
+
+def exportar(nome, formato, using=None, lote=None):
+    """
+    Gera a exportação em blocos de bytes, lendo o banco aos poucos.
+
+    O banco é escolhido agora (using ou o roteador, que em uma requisição
+    GET pode mandar para uma réplica), e não quando o gerador for
+    consumido, que no StreamingHttpResponse acontece depois da view.
+
+    Args:
+        nome (str): Chave de EXPORTACOES ('alunos', 'matriculas', 'treinos')
+        formato (str): 'csv' ou 'ndjson'
+        using (str | None): Banco a ler (padrão: o do roteador)
+        lote (int | None): Linhas por bloco (padrão: tamanho_lote())
+
+    Returns:
+        generator: Blocos de bytes, prontos para enviar ou gravar
+    """
+    queryset, campos = EXPORTACOES[nome]
+    queryset = queryset().order_by('pk')
+    queryset = queryset.using(using or queryset.db)
+    lote = lote or tamanho_lote()
+
+    colunas = [coluna for coluna, _ in campos]
+    linhas = queryset.values_list(*[campo for _, campo in campos]).iterator(chunk_size=lote)
+    gerar = _gerar_csv if formato == 'csv' else _gerar_ndjson
+    return gerar(colunas, linhas, lote)
+
+
+def _proximo(gerador):
+    """Próximo bloco do gerador, ou None no fim (StopIteration não atravessa o await)."""
+    return next(gerador, None)
+
+
+async def exportar_async(gerador):
+    """
+    Versão assíncrona de um gerador de exportar(), para o ASGI.
+
+    Em ASGI, o StreamingHttpResponse com um gerador síncrono é lido
+    inteiro para a memória antes do envio. Aqui cada bloco é lido com
+    sync_to_async na thread das views síncronas (thread_sensitive), a
+    mesma da conexão e do cursor abertos pela view.
+    """
+    proximo = sync_to_async(_proximo, thread_sensitive=True)
+    try:
+        while (bloco := await proximo(gerador)) is not None:
+            yield bloco
+    finally:
+        # Cliente desconectou ou fim: fecha o cursor na mesma thread
+        await sync_to_async(gerador.close, thread_sensitive=True)()
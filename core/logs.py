@@ -0,0 +1,64 @@
+# =============================================================================
+# ARQUIVO: core/logs.py
+# DESCRIÇÃO: Formatação de logs estruturados do projeto Dumbbell Fitness
+# FUNÇÃO: Converte registros do módulo logging em linhas JSON
+# =============================================================================
+
+# Módulo padrão de logging do Python
+import logging
+# Serialização dos registros em JSON
+import json
+# Conversão do timestamp do registro para ISO 8601
+from datetime import datetime, timezone
+
+
+# Atributos padrão de um LogRecord; tudo que não estiver aqui veio de extra={}
+_ATRIBUTOS_PADRAO = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {
+    'message', 'asctime', 'taskName',
+}
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formatter que escreve cada registro de log como uma linha JSON.
+
+    Cada linha contém horário, nível, logger e mensagem, além de qualquer
+    campo passado via extra={...}. A mensagem só é montada aqui, quando o
+    registro realmente vai ser emitido, então chamadas como
+    logger.debug("Treino %s", treino_id) não custam nada com o nível
+    acima de DEBUG.
+
+    Exemplo de saída:
+        {"timestamp": "2025-06-01T12:00:00+00:00", "level": "INFO",
+         "logger": "treinos.serializers", "message": "Treino criado",
+         "treino_id": 42}
+    """
+
+    def format(self, record):
+        """
+        Monta o dicionário do registro e o serializa em JSON.
+
+        Args:
+            record (LogRecord): Registro de log a ser formatado
+
+        Returns:
+            str: Linha JSON com os dados do registro
+        """
+        dados = {
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+
+        # Campos extras informados na chamada do logger
+        for chave, valor in record.__dict__.items():
+            if chave not in _ATRIBUTOS_PADRAO and not chave.startswith('_'):
+                dados[chave] = valor
+
+        # Traceback só é formatado quando há exceção no registro
+        if record.exc_info:
+            dados['exc_info'] = self.formatException(record.exc_info)
+
+        # default=str cobre Decimal, datas e objetos de modelo nos extras
+        return json.dumps(dados, ensure_ascii=False, default=str)
@@ -0,0 +1,48 @@
+# =============================================================================
+# ARQUIVO: core/management/commands/benchmark.py
+# DESCRIÇÃO: Comando de manutenção do projeto Dumbbell Fitness
+# FUNÇÃO: Roda um cenário de benchmark e imprime os tempos medidos
+# =============================================================================
+
+from django.conf import settings
+# Base dos comandos de gerenciamento do Django
+from django.core.management.base import BaseCommand
+
+# Cenários e utilitários de medição
+from core.benchmarks import CENARIOS
+
+
+class Command(BaseCommand):
+    """
+    Roda um cenário de benchmark (ver core/benchmarks.py).
+
+    Uso:
+        python manage.py benchmark logs
+        python manage.py benchmark logs --repeticoes 200 --linhas 5000
+
+    Os dados sintéticos de cada cenário são criados em uma transação que é
+    desfeita no fim. Ainda assim, prefira rodar contra uma cópia do banco,
+    com as mesmas configurações (DATABASE_URL, LOG_LEVEL, ...) do ambiente
+    que se quer medir.
+    """
+    help = 'Roda um cenário de benchmark e imprime mediana, p95 e consultas.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('cenario', choices=sorted(CENARIOS),
+                            help='Cenário a medir')
+        parser.add_argument('--repeticoes', type=int, default=50,
+                            help='Execuções medidas de cada operação (padrão: 50)')
+        parser.add_argument('--linhas', type=int, default=None,
+                            help='Tamanho dos dados sintéticos (padrão: o de cada cenário)')
+        parser.add_argument('--atraso', type=float, default=20,
+                            help='Cenário assincrono: atraso simulado por consulta, em ms (padrão: 20)')
+        parser.add_argument('--concorrencia', type=int, default=20,
+                            help='Cenário assincrono: requisições simultâneas no ASGI (padrão: 20)')
+
+    def handle(self, *args, **options):
+        if settings.DEBUG:
+            self.stderr.write(self.style.WARNING(
+                'DEBUG=True: o Django guarda cada consulta e os tempos ficam maiores '
+                'que em produção.'))
+        for linha in CENARIOS[options['cenario']](options):
+            self.stdout.write(linha)
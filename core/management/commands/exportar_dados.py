@@ -0,0 +1,49 @@
+# =============================================================================
+# ARQUIVO: core/management/commands/exportar_dados.py
+# DESCRIÇÃO: Comando de manutenção do projeto Dumbbell Fitness
+# FUNÇÃO: Exporta alunos, matrículas ou treinos em CSV/NDJSON, em streaming
+# =============================================================================
+
+# Base dos comandos de gerenciamento do Django
+from django.core.management.base import BaseCommand
+
+# Mesma exportação do endpoint /api/v1/exportar/
+from core.exportacao import EXPORTACOES, FORMATOS, exportar
+
+
+class Command(BaseCommand):
+    """
+    Exporta uma tabela inteira em CSV ou NDJSON.
+
+    Uso:
+        python manage.py exportar_dados alunos --saida alunos.csv
+        python manage.py exportar_dados treinos --formato ndjson > treinos.ndjson
+
+    As linhas são lidas do banco e gravadas em blocos (ver
+    core/exportacao.py), então a memória usada é a mesma para mil ou para
+    milhões de linhas. Sem --saida, o conteúdo vai para a saída padrão.
+    """
+    help = 'Exporta alunos, matrículas ou treinos em CSV ou NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('recurso', choices=list(EXPORTACOES),
+                            help='O que exportar')
+        parser.add_argument('--formato', choices=list(FORMATOS), default='csv',
+                            help='Formato do arquivo (padrão: csv)')
+        parser.add_argument('--saida', help='Arquivo de saída (padrão: saída padrão)')
+        parser.add_argument('--lote', type=int, default=None,
+                            help='Linhas por bloco (padrão: settings.EXPORTACAO_TAMANHO_LOTE)')
+
+    def handle(self, *args, **options):
+        blocos = exportar(options['recurso'], options['formato'], lote=options['lote'])
+
+        if not options['saida']:
+            for bloco in blocos:
+                self.stdout.write(bloco.decode(), ending='')
+            return
+
+        with open(options['saida'], 'wb') as arquivo:
+            for bloco in blocos:
+                arquivo.write(bloco)
+        self.stderr.write(self.style.SUCCESS(
+            f"Exportação de {options['recurso']} gravada em {options['saida']}."))
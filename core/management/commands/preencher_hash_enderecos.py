@@ -0,0 +1,87 @@
+# =============================================================================
+# ARQUIVO: core/management/commands/preencher_hash_enderecos.py
+# DESCRIÇÃO: Comando de manutenção do projeto Dumbbell Fitness
+# FUNÇÃO: Preenche EnderecoModel.hash_conteudo nos endereços já cadastrados
+# =============================================================================
+
+# Base dos comandos de gerenciamento do Django
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# Modelo de endereço (dono do hash) e Aluno (aponta para o endereço)
+from core.models import EnderecoModel
+from cadastros.models import Aluno
+
+
+class Command(BaseCommand):
+    """
+    Preenche o hash de conteúdo dos endereços que ainda não o têm.
+
+    Uso:
+        python manage.py preencher_hash_enderecos
+
+    Os endereços são processados em lotes, do mais antigo para o mais novo.
+    Quando dois endereços têm o mesmo conteúdo, o mais antigo fica com o
+    hash; os alunos dos duplicados passam a apontar para ele e os
+    duplicados são apagados. Um duplicado não pode ficar sem hash: o
+    próximo save() dele calcularia o mesmo hash do mais antigo e violaria
+    o índice único.
+
+    Pode ser executado mais de uma vez: só mexe em endereços sem hash.
+    """
+    help = 'Preenche o hash de conteúdo dos endereços (deduplicação por índice).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lote', type=int, default=1000,
+                            help='Quantidade de endereços por lote (padrão: 1000)')
+
+    def handle(self, *args, **options):
+        lote = options['lote']
+        preenchidos = mesclados = 0
+        ultimo_id = 0
+
+        while True:
+            enderecos = list(
+                EnderecoModel.all_objects
+                .filter(hash_conteudo__isnull=True, pk__gt=ultimo_id)
+                .order_by('pk')[:lote]
+            )
+            if not enderecos:
+                break
+            ultimo_id = enderecos[-1].pk
+
+            with transaction.atomic():
+                hashes = {
+                    endereco.pk: EnderecoModel.calcular_hash(
+                        {campo: getattr(endereco, campo) for campo in EnderecoModel.CAMPOS_CONTEUDO})
+                    for endereco in enderecos
+                }
+                # Hashes que já pertencem a algum endereço: {hash: id}
+                donos = dict(
+                    EnderecoModel.all_objects
+                    .filter(hash_conteudo__in=set(hashes.values()))
+                    .values_list('hash_conteudo', 'pk')
+                )
+
+                para_atualizar = []
+                repetidos = {}  # {id duplicado: id que ficou com o hash}
+                for endereco in enderecos:
+                    hash_conteudo = hashes[endereco.pk]
+                    if hash_conteudo in donos:
+                        repetidos[endereco.pk] = donos[hash_conteudo]
+                        continue
+                    donos[hash_conteudo] = endereco.pk
+                    endereco.hash_conteudo = hash_conteudo
+                    para_atualizar.append(endereco)
+
+                EnderecoModel.all_objects.bulk_update(para_atualizar, ['hash_conteudo'])
+                preenchidos += len(para_atualizar)
+
+                if repetidos:
+                    for duplicado_id, dono_id in repetidos.items():
+                        Aluno.all_objects.filter(endereco_id=duplicado_id).update(endereco_id=dono_id)
+                    EnderecoModel.all_objects.filter(pk__in=repetidos).delete()
+                    mesclados += len(repetidos)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{preenchidos} endereço(s) preenchido(s), {mesclados} duplicado(s) mesclado(s).'))
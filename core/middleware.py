@@ -0,0 +1,76 @@
+# =============================================================================
+# ARQUIVO: core/middleware.py
+# DESCRIÇÃO: Middlewares compartilhados do projeto Dumbbell Fitness
+# FUNÇÃO: Disponibiliza o aluno do usuário logado em request.aluno
+# =============================================================================
+
+# Detecta/marca corrotinas (middleware que funciona em WSGI e em ASGI)
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+# Exceção genérica para "objeto não encontrado" (evita importar o modelo Aluno)
+from django.core.exceptions import ObjectDoesNotExist
+# Objeto preguiçoso: só executa a busca quando for usado pela primeira vez
+from django.utils.functional import SimpleLazyObject
+
+
+def get_aluno(request):
+    """
+    Retorna o Aluno vinculado ao usuário da requisição, ou None.
+
+    Usa o relacionamento one-to-one reverso User.aluno (related_name='aluno').
+    O resultado fica em cache na própria requisição, então a consulta é
+    feita no máximo uma vez, mesmo que várias partes da view usem o aluno.
+
+    Args:
+        request: Requisição HTTP (Django ou DRF)
+
+    Returns:
+        Aluno | None: Aluno do usuário logado, ou None se anônimo/sem aluno
+    """
+    if not hasattr(request, '_cached_aluno'):
+        user = getattr(request, 'user', None)
+        aluno = None
+        if user is not None and user.is_authenticated:
+            try:
+                aluno = user.aluno
+            except ObjectDoesNotExist:
+                aluno = None
+        request._cached_aluno = aluno
+    return request._cached_aluno
+
+
+class AlunoAtualMiddleware:
+    """
+    Middleware que expõe o aluno do usuário logado como request.aluno.
+
+    O valor é preguiçoso: a busca só acontece quando a view acessa
+    request.aluno. Como a autenticação por token do DRF roda dentro da view
+    e atualiza o request.user original, o aluno resolvido é sempre o do
+    usuário já autenticado.
+
+    Nas views do DRF, use self.request.aluno:
+        - Retorna o Aluno do usuário logado
+        - É "falso" (if not request.aluno) quando não há aluno vinculado
+
+    Deve vir depois do AuthenticationMiddleware em settings.MIDDLEWARE.
+
+    Funciona nos dois modos (WSGI e ASGI), sem trocar de thread no ASGI.
+    Nas views assíncronas o request.aluno não deve ser usado: a busca é
+    síncrona.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request.aluno = SimpleLazyObject(lambda: get_aluno(request))
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        request.aluno = SimpleLazyObject(lambda: get_aluno(request))
+        return await self.get_response(request)
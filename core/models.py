@@ -4,7 +4,11 @@
 # FUNÇÃO: Define modelos que são usados por outros apps (BaseModel, EnderecoModel)
 # =============================================================================
 
+# Hash do conteúdo do endereço (deduplicação)
+import hashlib
+
 # Imports do Django para definição de modelos e campos
+from django.core.exceptions import ValidationError
 from django.db import models
 
 # Import de validadores customizados do core
@@ -14,6 +18,17 @@ from .validators import cep_validator
 from .choices import EstadoChoices
 
 
+class ActiveManager(models.Manager):
+    """
+    Manager que retorna apenas registros ativos (ativo=True).
+
+    Usado como Model.objects nos modelos que herdam BaseModel.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(ativo=True)
+
+
 class BaseModel(models.Model):
     """
     Modelo abstrato base para herdar campos comuns e controle básico.
@@ -23,6 +38,16 @@ class BaseModel(models.Model):
     - atualizacao: Data e hora da última modificação (auto)
     - ativo: Flag para ativar/desativar registro (soft delete)
     
+    Managers:
+    - objects: apenas registros ativos (ActiveManager)
+    - all_objects: todos os registros, inclusive os inativos
+    
+    all_objects é declarado primeiro e por isso é o manager padrão do
+    Django (_default_manager): admin, validações de unicidade, campos de
+    relacionamento dos serializers e relações reversas continuam vendo
+    todos os registros. Use all_objects também nas telas de CRUD e em
+    rotinas de manutenção, que precisam enxergar os inativos.
+    
     Herde este modelo em outros modelos para ter esses campos automaticamente.
     """
     # Data e hora de criação do registro (preenchido automaticamente)
@@ -35,6 +60,10 @@ class BaseModel(models.Model):
     # True = ativo, False = inativo/deletado
     ativo = models.BooleanField(default=True)
 
+    # Todos os registros (manager padrão) e apenas os ativos
+    all_objects = models.Manager()
+    objects = ActiveManager()
+
     class Meta:
         # Modelo abstrato - não cria tabela no banco, apenas para herança
         abstract = True
@@ -49,7 +78,14 @@ class EnderecoModel(BaseModel):
     
     Campos obrigatórios: cep, rua, numero, bairro, cidade, estado
     Campo opcional: complemento
+
+    O campo hash_conteudo guarda um SHA-256 dos campos normalizados e tem
+    índice único: é por ele que endereços idênticos são encontrados (e
+    impedidos de duplicar) no cadastro.
     """
+    # Campos que definem o "conteúdo" do endereço, na ordem usada no hash
+    CAMPOS_CONTEUDO = ('cep', 'rua', 'numero', 'complemento', 'bairro', 'cidade', 'estado')
+
     # CEP com validação customizada (formato: 12345-678)
     cep = models.CharField(
         max_length=10,
@@ -77,6 +113,13 @@ class EnderecoModel(BaseModel):
         choices=EstadoChoices.choices(),  # Lista de estados brasileiros
     )
 
+    # SHA-256 do conteúdo normalizado (ver calcular_hash)
+    # Nulo apenas em registros antigos ainda não preenchidos pelo comando
+    # preencher_hash_enderecos (que junta os duplicados); o índice único
+    # aceita vários nulos
+    hash_conteudo = models.CharField(
+        max_length=64, unique=True, null=True, blank=True, editable=False)
+
     class Meta:
         # Configurações de meta para o modelo EnderecoModel
         verbose_name = 'Endereço'
@@ -90,3 +133,55 @@ class EnderecoModel(BaseModel):
         Retorna: "Rua Exemplo, 123 - Bairro - Cidade/SP"
         """
         return f"{self.rua}, {self.numero} - {self.bairro} - {self.cidade}/{self.estado}"
+
+    @staticmethod
+    def _normalizar(campo, valor):
+        """
+        Normaliza um campo antes do hash.
+
+        - Nulo vira texto vazio (complemento None == complemento '')
+        - Espaços repetidos e nas pontas são removidos
+        - Maiúsculas/minúsculas são ignoradas
+        - No CEP, só os dígitos contam (12345-678 == 12345678)
+        """
+        texto = ' '.join(str(valor or '').split()).casefold()
+        if campo == 'cep':
+            texto = ''.join(c for c in texto if c.isdigit())
+        return texto
+
+    @classmethod
+    def calcular_hash(cls, dados):
+        """
+        Calcula o hash do conteúdo de um endereço.
+
+        Args:
+            dados (dict): Valores dos campos de CAMPOS_CONTEUDO
+
+        Returns:
+            str: SHA-256 em hexadecimal (64 caracteres)
+        """
+        partes = [cls._normalizar(campo, dados.get(campo)) for campo in cls.CAMPOS_CONTEUDO]
+        return hashlib.sha256('\x1f'.join(partes).encode()).hexdigest()
+
+    def clean(self):
+        """
+        Impede que o endereço vire cópia de outro (validação do admin).
+
+        O hash não é editável, então o ModelForm não confere o índice
+        único: sem esta validação, salvar no admin um endereço igual a
+        outro estouraria IntegrityError no save().
+        """
+        super().clean()
+        hash_conteudo = self.calcular_hash(
+            {campo: getattr(self, campo) for campo in self.CAMPOS_CONTEUDO})
+        if EnderecoModel.all_objects.filter(hash_conteudo=hash_conteudo).exclude(pk=self.pk).exists():
+            raise ValidationError("Já existe um endereço idêntico cadastrado.")
+
+    def save(self, *args, **kwargs):
+        """Mantém hash_conteudo sincronizado com os campos do endereço."""
+        self.hash_conteudo = self.calcular_hash(
+            {campo: getattr(self, campo) for campo in self.CAMPOS_CONTEUDO})
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'hash_conteudo' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'hash_conteudo']
+        super().save(*args, **kwargs)
@@ -0,0 +1,70 @@
+# =============================================================================
+# ARQUIVO: core/pagination.py
+# DESCRIÇÃO: Classes de paginação compartilhadas do projeto Dumbbell Fitness
+# FUNÇÃO: Define a paginação por cursor usada em todos os endpoints de listagem
+# =============================================================================
+
+# Paginação por cursor (keyset) do Django REST Framework
+from rest_framework.pagination import CursorPagination
+
+
+class PadraoCursorPagination(CursorPagination):
+    """
+    Paginação por cursor (keyset) padrão do projeto.
+
+    Em vez de OFFSET, cada página é buscada a partir do último id visto
+    (WHERE id > cursor ORDER BY id LIMIT n), então o custo de uma página não
+    cresce com o tamanho da tabela nem com a posição na listagem.
+
+    Funcionalidades:
+    - Ordenação estável pelo id (único e crescente)
+    - Cursores opacos nos links 'next' e 'previous'
+    - Tamanho de página configurável via ?page_size=, limitado a max_page_size
+
+    Formato da resposta:
+        {"next": "...?cursor=cD0xMjM%3D", "previous": null, "results": [...]}
+    """
+    # Tamanho padrão da página
+    page_size = 50
+
+    # Permite ao cliente escolher o tamanho da página (?page_size=20)
+    page_size_query_param = 'page_size'
+
+    # Limite máximo para não carregar páginas gigantes em memória
+    max_page_size = 200
+
+    # Campo usado como chave do cursor (precisa ser único e imutável)
+    ordering = 'id'
+
+
+class RecentesCursorPagination(PadraoCursorPagination):
+    """
+    Paginação por cursor com os registros mais recentes primeiro.
+
+    Usada onde a listagem já era ordenada do mais novo para o mais antigo.
+    """
+    ordering = '-id'
+
+
+class SessoesCursorPagination(PadraoCursorPagination):
+    """
+    Paginação das sessões de treino, da mais recente para a mais antiga.
+
+    Ordena por início da sessão, a mesma ordem do índice
+    (aluno, -inicio) de SessaoTreino.
+    """
+    ordering = '-inicio'
+
+
+class SeriesCursorPagination(PadraoCursorPagination):
+    """
+    Paginação das séries registradas em ordem cronológica.
+
+    Ordena pelas duas últimas colunas do índice
+    (aluno, exercicio, registrado_em, id) de SerieRegistrada, então cada
+    página é uma faixa contínua do índice. O pk desempata as séries com o
+    mesmo horário (as que chegam sem registrado_em ficam com o início da
+    sessão), para que a ordem seja sempre a mesma entre uma página e outra.
+    """
+    ordering = ('registrado_em', 'pk')
+    max_page_size = 1000
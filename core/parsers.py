@@ -0,0 +1,47 @@
+# =============================================================================
+# ARQUIVO: core/parsers.py
+# DESCRIÇÃO: Parser JSON do projeto Dumbbell Fitness
+# FUNÇÃO: Lê o corpo JSON das requisições com o orjson
+# =============================================================================
+
+# Leitor JSON implementado em Rust (bem mais rápido que o json da stdlib)
+import orjson
+
+from django.conf import settings
+
+# Parser padrão do DRF, que esta classe substitui
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+# Renderer usado pela browsable API ao montar o formulário de JSON
+from .renderers import ORJSONRenderer
+
+# Nomes aceitos para UTF-8, a única codificação que o orjson lê direto dos bytes
+_UTF8 = {'utf-8', 'utf8'}
+
+
+class ORJSONParser(JSONParser):
+    """
+    Parser JSON com orjson, compatível com o JSONParser do DRF.
+
+    Registrado em REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] no lugar do
+    JSONParser. Como no DRF com STRICT_JSON (padrão), NaN e Infinity são
+    rejeitados, e erros de sintaxe viram ParseError (resposta 400).
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Lê o corpo da requisição e retorna os dados decodificados.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            conteudo = stream.read()
+            if encoding.lower() not in _UTF8:
+                conteudo = conteudo.decode(encoding)
+            return orjson.loads(conteudo)
+        except ValueError as exc:
+            # orjson.JSONDecodeError e UnicodeDecodeError herdam de ValueError
+            raise ParseError('JSON parse error - %s' % str(exc))
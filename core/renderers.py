@@ -0,0 +1,73 @@
+# =============================================================================
+# ARQUIVO: core/renderers.py
+# DESCRIÇÃO: Renderer JSON do projeto Dumbbell Fitness
+# FUNÇÃO: Gera o JSON das respostas da API com o orjson
+# =============================================================================
+
+# Serializador JSON implementado em Rust (bem mais rápido que o json da stdlib)
+import orjson
+
+# Encoder do DRF, usado para os tipos que o orjson não conhece
+from rest_framework.utils import encoders
+from rest_framework.renderers import JSONRenderer
+
+# Separadores de linha que o DRF sempre escapa (JSON seguro para JavaScript)
+_U2028 = '\u2028'.encode()
+_U2029 = '\u2029'.encode()
+
+# Instância única do encoder do DRF (default() não guarda estado)
+_encoder_drf = encoders.JSONEncoder()
+
+
+def _converter(obj):
+    """
+    Converte para JSON os tipos que o orjson não serializa sozinho.
+
+    Delega ao encoder do DRF, então o resultado é o mesmo do JSONRenderer
+    padrão:
+    - Decimal vira string (ou número, com COERCE_DECIMAL_TO_STRING=False)
+    - datetime/date/time em ISO 8601 ('Z' para UTC)
+    - Textos traduzidos preguiçosos (gettext_lazy) viram str
+    - timedelta, QuerySet, bytes, iteráveis etc.
+    """
+    return _encoder_drf.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer JSON com orjson, compatível com o JSONRenderer do DRF.
+
+    Registrado em REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] no lugar do
+    JSONRenderer. Mesmo media type, mesmo formato ('json') e o mesmo JSON
+    de saída (compacto, UTF-8 sem escapes, \\u2028/\\u2029 escapados).
+
+    Diferenças:
+    - Com indentação (browsable API ou 'application/json; indent=N'), o
+      orjson sempre indenta com 2 espaços
+    - Com UNICODE_JSON=False, cai no JSONRenderer do DRF (o orjson não
+      gera JSON só em ASCII)
+    """
+
+    # Datas passam pelo _converter para sair no mesmo formato do DRF;
+    # chaves não-string (ex.: ids inteiros) viram string, como no json
+    opcoes = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renderiza os dados em JSON, retornando bytes.
+        """
+        if data is None:
+            return b''
+
+        if self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        opcoes = self.opcoes
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            opcoes |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=_converter, option=opcoes)
+
+        if _U2028 in ret or _U2029 in ret:
+            ret = ret.replace(_U2028, b'\\u2028').replace(_U2029, b'\\u2029')
+        return ret
@@ -0,0 +1,190 @@
+# =============================================================================
+# ARQUIVO: core/response_cache.py
+# DESCRIÇÃO: Cache de respostas versionado do projeto Dumbbell Fitness
+# FUNÇÃO: Guarda o JSON já renderizado dos endpoints públicos de catálogo
+# =============================================================================
+
+# Valor inicial das versões (ver versao_catalogo)
+import time
+# Links de paginação sem o host (ver _links_relativos)
+from urllib.parse import urlsplit
+
+# Configurações e caches do Django (backend definido em settings.CACHES)
+from django.conf import settings
+from django.core.cache import caches
+# A versão só muda depois do commit da alteração
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+# Response do DRF para o caminho sem cache
+from rest_framework.response import Response
+# Renderer usado pelas views assíncronas (sempre JSON)
+from .renderers import ORJSONRenderer
+
+
+# Cabeçalhos que mudam a resposta guardada: o formato negociado entra na
+# chave; Authorization avisa os caches intermediários de que a resposta
+# (e a ETag, que inclui o usuário) vem de uma requisição autenticada
+VARY_CATALOGO = ('Accept', 'Authorization')
+
+
+def _cache():
+    """Retorna o cache usado para respostas (alias 'catalogo' em settings.CACHES)."""
+    return caches[getattr(settings, 'CATALOGO_CACHE_ALIAS', 'catalogo')]
+
+
+def versao_catalogo(nome):
+    """
+    Retorna a versão atual de um catálogo (ex.: 'planos', 'exercicios').
+
+    A versão faz parte da chave de cada resposta guardada, então trocar a
+    versão invalida de uma vez todas as respostas daquele catálogo, sem
+    precisar saber quais chaves existem.
+
+    Se a versão sumir do cache (expiração, restart), ela recomeça com o
+    horário atual em milissegundos, que nunca coincide com uma versão antiga.
+    """
+    return _cache().get_or_set(f'catalogo:{nome}:versao', lambda: int(time.time() * 1000), None)
+
+
+def _chave_resposta(request, nome, versao, media_type):
+    """
+    Chave de uma resposta em cache: catálogo, versão, formato e caminho
+    com a query string.
+
+    O host não entra: ele vem do cliente (ALLOWED_HOSTS aceita qualquer
+    um), e cada host inventado criaria entradas novas no cache. Por isso
+    as respostas guardadas têm links de paginação sem host (ver
+    _links_relativos).
+    """
+    return f'catalogo:{nome}:v{versao}:{media_type}:{request.get_full_path()}'
+
+
+def _links_relativos(dados):
+    """
+    Troca os links 'next'/'previous' de uma página por caminho + query
+    string, sem esquema e host.
+
+    A mesma resposta guardada serve a qualquer host, e o cliente resolve o
+    link relativo contra a URL que ele mesmo pediu.
+    """
+    if isinstance(dados, dict):
+        for campo in ('next', 'previous'):
+            if dados.get(campo):
+                partes = urlsplit(dados[campo])
+                dados[campo] = partes.path + (f'?{partes.query}' if partes.query else '')
+    return dados
+
+
+def invalidar_catalogo(nome, using=DEFAULT_DB_ALIAS):
+    """
+    Invalida todas as respostas em cache de um catálogo.
+
+    Chamado pelos signals de post_save/post_delete dos modelos do catálogo.
+    A versão só é trocada depois do commit da alteração (como em
+    exercicios/catalogo.py): trocada antes, uma requisição concorrente
+    poderia guardar na versão nova uma resposta montada com os dados antigos.
+    Fora de transação, on_commit executa na hora.
+
+    Args:
+        nome (str): Nome do catálogo ('planos' ou 'exercicios')
+        using (str): Banco da transação da alteração
+    """
+    transaction.on_commit(lambda: _trocar_versao(nome), using=using)
+
+
+def _trocar_versao(nome):
+    """Troca a versão do catálogo no cache (ver invalidar_catalogo)."""
+    cache = _cache()
+    chave = f'catalogo:{nome}:versao'
+    try:
+        cache.incr(chave)
+    except ValueError:
+        # Versão ainda não existe neste cache; qualquer valor novo serve
+        cache.set(chave, int(time.time() * 1000), None)
+
+
+def responder_com_cache(request, nome, montar_dados):
+    """
+    Responde com o JSON em cache ou monta, renderiza e guarda a resposta.
+
+    A chave inclui a versão do catálogo, o formato negociado e o caminho
+    com a query string, então páginas e cursores diferentes ficam em
+    entradas próprias. Os links 'next'/'previous' são guardados sem o host
+    (ver _chave_resposta). A resposta sai com Vary: Accept, Authorization.
+
+    Só respostas JSON passam pelo cache; a browsable API segue o caminho
+    normal do DRF.
+
+    Args:
+        request: Requisição do DRF (já com o renderer negociado)
+        nome (str): Nome do catálogo, usado na versão e na chave
+        montar_dados (callable): Função que retorna os dados serializados
+
+    Returns:
+        HttpResponse | Response: Resposta com o JSON do catálogo
+    """
+    renderer = request.accepted_renderer
+    if renderer.format != 'json':
+        return Response(montar_dados())
+
+    cache = _cache()
+    chave = _chave_resposta(request, nome, versao_catalogo(nome), request.accepted_media_type)
+    conteudo = cache.get(chave)
+    if conteudo is None:
+        conteudo = renderer.render(
+            _links_relativos(montar_dados()), request.accepted_media_type)
+        cache.set(chave, conteudo, getattr(settings, 'CATALOGO_CACHE_TTL', 300))
+
+    resposta = HttpResponse(conteudo, content_type=renderer.media_type)
+    patch_vary_headers(resposta, VARY_CATALOGO)
+    return resposta
+
+
+async def ler_cache_async(request, nome):
+    """
+    Versão assíncrona da leitura do cache de respostas (perfil ASGI).
+
+    Usa a mesma chave de responder_com_cache (com o formato JSON, o único
+    das views assíncronas), então as views síncronas e assíncronas
+    compartilham as respostas guardadas.
+
+    Args:
+        request: HttpRequest do Django
+        nome (str): Nome do catálogo
+
+    Returns:
+        tuple: (chave, conteúdo em bytes ou None se ainda não estiver em cache)
+    """
+    cache = _cache()
+    versao = await cache.aget_or_set(
+        f'catalogo:{nome}:versao', lambda: int(time.time() * 1000), None)
+    chave = _chave_resposta(request, nome, versao, ORJSONRenderer.media_type)
+    return chave, await cache.aget(chave)
+
+
+async def responder_com_cache_async(request, nome, montar_dados):
+    """
+    Versão assíncrona de responder_com_cache, usada pelas views de
+    core/assincrono.py.
+
+    Sempre responde JSON (as views assíncronas não servem a browsable API).
+
+    Args:
+        request: HttpRequest do Django
+        nome (str): Nome do catálogo
+        montar_dados (callable): Corrotina que retorna os dados serializados
+
+    Returns:
+        HttpResponse: Resposta com o JSON do catálogo
+    """
+    chave, conteudo = await ler_cache_async(request, nome)
+    if conteudo is None:
+        renderer = ORJSONRenderer()
+        conteudo = renderer.render(_links_relativos(await montar_dados()), renderer.media_type)
+        await _cache().aset(chave, conteudo, getattr(settings, 'CATALOGO_CACHE_TTL', 300))
+
+    resposta = HttpResponse(conteudo, content_type=ORJSONRenderer.media_type)
+    patch_vary_headers(resposta, VARY_CATALOGO)
+    return resposta
@@ -7,6 +7,9 @@
 # Import do pacote serializer do Django REST Framework
 from rest_framework import serializers
 
+# Índice único de hash_conteudo (ver EnderecoSerializer.update)
+from django.db import IntegrityError, transaction
+
 # Import do modelo padrão User do Django
 from django.contrib.auth.models import User
 
@@ -138,28 +141,41 @@ class EnderecoSerializer(serializers.ModelSerializer):
             EnderecoModel: Instância do endereço (novo ou existente)
             
         Processo:
-        1. Busca por endereço existente com os mesmos dados
-        2. Se encontrar, retorna o existente
+        1. Calcula o hash do conteúdo normalizado do endereço
+        2. Busca pelo hash (consulta no índice único hash_conteudo)
         3. Se não encontrar, cria um novo
-        """
-        # Busca por endereço existente com os mesmos dados
-        # Compara todos os campos exceto id, criacao, atualizacao e ativo
-        endereco_existente = EnderecoModel.objects.filter(
-            cep=validated_data.get('cep'),
-            rua=validated_data.get('rua'),
-            numero=validated_data.get('numero'),
-            complemento=validated_data.get('complemento'),
-            bairro=validated_data.get('bairro'),
-            cidade=validated_data.get('cidade'),
-            estado=validated_data.get('estado')
-        ).first()
-        
-        # Se encontrar um endereço idêntico, retorna o existente
-        if endereco_existente:
-            return endereco_existente
         
-        # Se não encontrar, cria um novo endereço
-        return super().create(validated_data)
+        O get_or_create trata a corrida entre dois cadastros simultâneos
+        com o mesmo endereço: o segundo INSERT viola o índice único e o
+        Django devolve o registro criado pelo primeiro.
+        """
+        hash_conteudo = EnderecoModel.calcular_hash(validated_data)
+        endereco, _ = EnderecoModel.all_objects.get_or_create(
+            hash_conteudo=hash_conteudo, defaults=validated_data)
+        return endereco
+
+    def update(self, instance, validated_data):
+        """
+        Atualiza o endereço, sem permitir que ele vire cópia de outro.
+
+        A consulta prévia cobre o caso comum; o índice único cobre a
+        corrida com outra gravação do mesmo conteúdo entre a consulta e o
+        UPDATE, que também vira erro de validação.
+
+        Raises:
+            ValidationError: Se já existir outro endereço idêntico
+        """
+        dados = {campo: getattr(instance, campo) for campo in EnderecoModel.CAMPOS_CONTEUDO}
+        dados.update(validated_data)
+        duplicado = EnderecoModel.all_objects.filter(
+            hash_conteudo=EnderecoModel.calcular_hash(dados)).exclude(pk=instance.pk).exists()
+        if duplicado:
+            raise serializers.ValidationError("Já existe um endereço idêntico cadastrado.")
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError("Já existe um endereço idêntico cadastrado.")
 
     def validate(self, data):
         """
@@ -0,0 +1,42 @@
+# =============================================================================
+# ARQUIVO: core/signals.py
+# DESCRIÇÃO: Signals compartilhados do projeto Dumbbell Fitness
+# FUNÇÃO: Mantém os caches do core coerentes com as alterações no banco
+# =============================================================================
+
+# Signals de modelo do Django
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Modelos observados
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+
+# Invalidação do cache de autenticação por token
+from .authentication import invalidar_token
+
+
+@receiver(post_delete, sender=Token)
+def invalidar_token_apagado(sender, instance, using, **kwargs):
+    """
+    Remove do cache o token apagado, depois do commit.
+
+    Cobre o logout (o token é apagado) e a exclusão do usuário, já que o
+    Token é removido em cascata junto com o User (ex.: AlunoViewSet.destroy).
+    """
+    invalidar_token(instance.key, using=using)
+
+
+@receiver(post_save, sender=User)
+def invalidar_tokens_do_usuario(sender, instance, created, using, **kwargs):
+    """
+    Remove do cache os tokens de um usuário alterado, depois do commit.
+
+    Qualquer save do User (troca de senha, desativação, mudança de e-mail)
+    invalida o cache para que a próxima requisição leia os dados novos.
+    """
+    if created:
+        return
+    chaves = Token.objects.using(using).filter(user_id=instance.pk).values_list('key', flat=True)
+    for chave in chaves:
+        invalidar_token(chave, using=using)
@@ -256,7 +256,7 @@ def validate_aluno_matricula_unica(data, instance=None):
     aluno = data.get('aluno')
     if aluno:
         # Busca apenas matrículas ativas do aluno
-        qs = Matricula.objects.filter(aluno=aluno, ativo=True)
+        qs = Matricula.objects.filter(aluno=aluno)
         
         # Se for um update, exclui a própria instância da busca
         if instance:
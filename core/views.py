@@ -4,11 +4,24 @@
 # FUNÇÃO: Define endpoints da API para endereços e outras funcionalidades base
 # =============================================================================
 
+# Resposta enviada aos poucos (exportações) e detecção do perfil ASGI
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
 # Importa os viewsets prontos do DRF para operações CRUD automáticas
 from rest_framework import viewsets
 # Importa o objeto Response para retornar dados HTTP nas views
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.permissions import IsAdminUser, IsAuthenticated, AllowAny
+from rest_framework.views import APIView
+
+# Exportação em streaming (CSV/NDJSON)
+from .exportacao import EXPORTACOES, FORMATOS, exportar, exportar_async
+
+# Paginação por cursor com os mais recentes primeiro
+from .pagination import RecentesCursorPagination
 
 # Importa o modelo que representa o endereço no banco
 from .models import EnderecoModel
@@ -38,11 +51,14 @@ class EnderecoViewSet(viewsets.ModelViewSet):
     """
 
     # QuerySet base para endereços, ordenado por data de criação decrescente
-    queryset = EnderecoModel.objects.all().order_by('-id')
+    queryset = EnderecoModel.all_objects.all().order_by('-id')
     
     # Serializer usado para converter dados
     serializer_class = EnderecoSerializer
 
+    # Mantém a listagem do mais novo para o mais antigo, agora paginada
+    pagination_class = RecentesCursorPagination
+
     def get_permissions(self):
         """
         Define permissões baseadas na ação sendo executada.
@@ -61,7 +77,7 @@ class EnderecoViewSet(viewsets.ModelViewSet):
 
     def list(self, request, *args, **kwargs):
         """
-        Retorna a lista completa de endereços serializados.
+        Retorna a lista paginada de endereços serializados.
         
         Sobrescreve o método list padrão para garantir uso do serializer correto
         e permitir futura customização se necessário.
@@ -75,9 +91,62 @@ class EnderecoViewSet(viewsets.ModelViewSet):
             Response: Lista de endereços serializados
             
         Nota:
-            Este método pode ser customizado no futuro para adicionar
-            filtros, paginação ou outras funcionalidades específicas.
+            A paginação é por cursor (ver core/pagination.py); apenas
+            a página atual é carregada do banco.
         """
         queryset = self.get_queryset()
+
+        # Busca apenas a página atual a partir do cursor
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
+
+
+class NegociacaoExportacao(DefaultContentNegotiation):
+    """
+    Negociação que ignora o header Accept.
+
+    O formato da exportação vem do parâmetro ?formato=; sem isto, um
+    cliente que envia "Accept: text/csv" receberia 406, já que nenhum
+    renderer do DRF produz CSV. Erros continuam saindo em JSON.
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+class ExportacaoView(APIView):
+    """
+    Exportação completa de alunos, matrículas ou treinos, em streaming.
+
+    Endpoint: GET /api/v1/exportar/{alunos|matriculas|treinos}/?formato=csv
+    Formatos: csv (padrão) ou ndjson (um objeto JSON por linha).
+    Restrito a usuários staff.
+
+    A resposta é um StreamingHttpResponse que lê o banco em blocos (ver
+    core/exportacao.py): a memória usada não cresce com o número de
+    linhas. No perfil ASGI, os blocos vêm de um gerador assíncrono, já que
+    um gerador síncrono seria lido inteiro antes do envio.
+    """
+    permission_classes = [IsAdminUser]
+    content_negotiation_class = NegociacaoExportacao
+
+    def get(self, request, recurso):
+        if recurso not in EXPORTACOES:
+            raise NotFound(f"Exportação '{recurso}' não existe. Opções: {', '.join(EXPORTACOES)}.")
+        formato = request.query_params.get('formato', 'csv')
+        if formato not in FORMATOS:
+            raise ValidationError({'formato': f"Use um destes: {', '.join(FORMATOS)}."})
+
+        conteudo = exportar(recurso, formato)
+        if isinstance(request._request, ASGIRequest):
+            conteudo = exportar_async(conteudo)
+
+        content_type, extensao = FORMATOS[formato]
+        resposta = StreamingHttpResponse(conteudo, content_type=content_type)
+        resposta['Content-Disposition'] = f'attachment; filename="{recurso}.{extensao}"'
+        return resposta
@@ -13,5 +13,9 @@ from django.core.asgi import get_asgi_application
 # Define qual arquivo de configurações do Django será usado
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dumbbell.settings')
 
+# No ASGI, as leituras mais acessadas usam as views assíncronas
+# (settings.VIEWS_ASSINCRONAS, ver core/assincrono.py)
+os.environ.setdefault('VIEWS_ASSINCRONAS', 'True')
+
 # Cria a aplicação ASGI que o servidor assíncrono vai usar
 application = get_asgi_application()
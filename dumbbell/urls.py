@@ -5,7 +5,9 @@
 # =============================================================================
 
 # Importações do Django para gerenciamento de URLs
+from django.conf import settings
 from django.contrib import admin
+from django.db import connection
 from django.urls import path, include
 
 # Importação específica para autenticação via token
@@ -14,15 +16,20 @@ from rest_framework.authtoken.views import obtain_auth_token
 
 # Importações para autenticação customizada
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from django.contrib.auth.models import User
 from planos.serializers import UserSerializer
 
+# Exportação de dados em streaming (apenas staff)
+from core.views import ExportacaoView
+
+# Variante assíncrona de auth_user_info (perfil ASGI)
+from core.assincrono import leitura_assincrona, resposta_json
+
 # Importa os routers de cada app (que já têm as rotas registradas)
 # Cada router contém as URLs específicas de cada funcionalidade
 from cadastros.urls import router as cadastros_router
-from exercicios.urls import router as exercicios_router
 from planos.urls import router as planos_router
 from treinos.urls import router as treinos_router
 
@@ -42,6 +49,42 @@ def auth_user_info(request):
     serializer = UserSerializer(request.user)
     return Response(serializer.data)
 
+
+@leitura_assincrona(auth_user_info, autenticada=True)
+async def auth_user_info_async(request):
+    """
+    Variante assíncrona de auth_user_info, usada com settings.VIEWS_ASSINCRONAS.
+    
+    Com o token em cache, responde sem nenhuma consulta ao banco.
+    """
+    return resposta_json(UserSerializer(request.user).data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def status_banco(request):
+    """
+    View com as métricas do pool de conexões do worker que atendeu.
+    
+    Endpoint: GET /api/v1/status/banco/
+    Restrito a usuários staff. Cada worker tem o seu pool, então os números
+    são do processo que respondeu (requests_num, connections_num,
+    requests_waiting, pool_available etc., do psycopg_pool).
+    """
+    pool = getattr(connection, 'pool', None)
+    if pool is None:
+        return Response({'banco': connection.vendor, 'pool': None})
+
+    return Response({
+        'banco': connection.vendor,
+        'pool': {
+            'nome': pool.name,
+            'min_size': pool.min_size,
+            'max_size': pool.max_size,
+            'estatisticas': pool.get_stats(),
+        },
+    })
+
 # Lista principal de padrões de URL do projeto
 urlpatterns = [
     # =====================================================================
@@ -54,7 +97,7 @@ urlpatterns = [
     
     # Rotas para gerenciamento de exercícios físicos
     # Endpoints: /api/v1/exercicios/
-    path('api/v1/exercicios/', include(exercicios_router.urls)),
+    path('api/v1/exercicios/', include('exercicios.urls')),
     
     # Rotas para gerenciamento de planos de treino
     # Endpoints: /api/v1/planos/, /api/v1/planos/<id>/, /api/v1/planos/auth/login/, /api/v1/planos/auth/user/
@@ -73,7 +116,17 @@ urlpatterns = [
     # Headers: Authorization: Token seu_token_aqui
     # Retorna: Dados do usuário logado
     # Acesso: /api/v1/auth/user/
-    path('api/v1/auth/user/', auth_user_info, name='auth-user-info'),
+    path('api/v1/auth/user/',
+         auth_user_info_async if settings.VIEWS_ASSINCRONAS else auth_user_info,
+         name='auth-user-info'),
+
+    # Métricas do pool de conexões com o banco (apenas staff)
+    # Acesso: /api/v1/status/banco/
+    path('api/v1/status/banco/', status_banco, name='status-banco'),
+
+    # Exportação completa em CSV ou NDJSON, em streaming (apenas staff)
+    # Acesso: /api/v1/exportar/alunos/?formato=csv (também matriculas e treinos)
+    path('api/v1/exportar/<str:recurso>/', ExportacaoView.as_view(), name='exportar'),
 
     # =====================================================================
     # ROTAS ADMINISTRATIVAS
@@ -8,3 +8,7 @@ class ExerciciosConfig(AppConfig):
 
     # Nome do app Django, usado para referenciar internamente
     name = 'exercicios'
+
+    def ready(self):
+        # Registra os signals do app (invalidação do cache do catálogo)
+        from . import signals  # noqa: F401
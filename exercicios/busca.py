@@ -0,0 +1,103 @@
+# =============================================================================
+# ARQUIVO: exercicios/busca.py
+# DESCRIÇÃO: Busca facetada do catálogo de exercícios do projeto Dumbbell Fitness
+# FUNÇÃO: Filtra exercícios por texto e facetas e conta os valores de cada faceta
+# =============================================================================
+
+"""
+Busca facetada de exercícios.
+
+Facetas: categoria, grupo_muscular e equipamento. Cada faceta aceita um
+ou mais valores (?categoria=Musculacao&categoria=Ginastica ou
+?categoria=Musculacao,Ginastica); valores da mesma faceta são combinados
+com OU e facetas diferentes com E.
+
+As contagens seguem o modelo usual de faceta: a contagem de uma faceta
+considera o texto buscado e os filtros das OUTRAS facetas, mas não o dela
+mesma. Assim o usuário vê quantos exercícios ganharia ao marcar mais um
+valor. Tudo sai de uma única consulta agrupada pelas três colunas, que
+tem poucas linhas (combinações distintas) e é combinada em Python.
+"""
+
+# Agregação e filtros do ORM
+from django.db.models import Count, Q
+
+# Facetas disponíveis, na ordem em que aparecem na resposta
+FACETAS = ('categoria', 'grupo_muscular', 'equipamento')
+
+
+def ler_filtros(query_params):
+    """
+    Lê os valores de cada faceta dos parâmetros da requisição.
+
+    Args:
+        query_params: QueryDict da requisição (request.query_params)
+
+    Returns:
+        dict: {faceta: set(valores)} apenas com as facetas informadas
+    """
+    filtros = {}
+    for faceta in FACETAS:
+        valores = {
+            valor.strip()
+            for parametro in query_params.getlist(faceta)
+            for valor in parametro.split(',')
+            if valor.strip()
+        }
+        if valores:
+            filtros[faceta] = valores
+    return filtros
+
+
+def filtrar_texto(queryset, termo):
+    """Filtra exercícios cujo nome ou descrição contenha o termo."""
+    termo = ' '.join((termo or '').split())
+    if not termo:
+        return queryset
+    return queryset.filter(Q(nome__icontains=termo) | Q(descricao__icontains=termo))
+
+
+def filtrar_facetas(queryset, filtros):
+    """Aplica os filtros de faceta (valores da mesma faceta com OU)."""
+    for faceta, valores in filtros.items():
+        queryset = queryset.filter(**{f'{faceta}__in': valores})
+    return queryset
+
+
+def contar_facetas(queryset, filtros):
+    """
+    Conta os exercícios por valor de cada faceta, em uma consulta.
+
+    Args:
+        queryset: Exercícios já filtrados pelo texto (sem filtros de faceta)
+        filtros (dict): Filtros de faceta ativos (ver ler_filtros)
+
+    Returns:
+        dict: {faceta: [{'valor': ..., 'total': n}, ...]}, do maior total
+              para o menor
+    """
+    combinacoes = list(
+        queryset.order_by().values(*FACETAS).annotate(total=Count('pk'))
+    )
+
+    contagens = {faceta: {} for faceta in FACETAS}
+    for linha in combinacoes:
+        for faceta in FACETAS:
+            # A linha conta para a faceta se passar nos filtros das demais
+            passa = all(
+                linha[outra] in valores
+                for outra, valores in filtros.items()
+                if outra != faceta
+            )
+            if passa:
+                valor = linha[faceta]
+                contagens[faceta][valor] = contagens[faceta].get(valor, 0) + linha['total']
+
+    return {
+        faceta: [
+            {'valor': valor, 'total': total}
+            for valor, total in sorted(
+                valores.items(), key=lambda item: (-item[1], str(item[0] or '')))
+        ]
+        for faceta, valores in contagens.items()
+    }
@@ -0,0 +1,139 @@
+# =============================================================================
+# ARQUIVO: exercicios/catalogo.py
+# DESCRIÇÃO: Snapshot em memória do catálogo de exercícios do projeto Dumbbell Fitness
+# FUNÇÃO: Valida e lê exercícios sem ir ao banco enquanto o catálogo não muda
+# =============================================================================
+
+"""
+Snapshot do catálogo de exercícios, um por processo (worker).
+
+O snapshot é imutável e traz:
+- registros: mapa somente leitura {id: ExercicioRegistro}
+- json: o catálogo inteiro já renderizado (bytes), no formato do
+  ExercicioSerializer
+
+A versão do catálogo fica no banco (VersaoCatalogo 'exercicios') e é
+incrementada a cada save/delete de Exercicio (exercicios/signals.py).
+Cada worker consulta essa versão no máximo uma vez a cada
+settings.EXERCICIOS_CATALOGO_INTERVALO segundos e só remonta o snapshot
+quando ela muda. Dentro do intervalo, nenhuma consulta é feita.
+
+O worker que fez a alteração volta a conferir a versão logo após o
+commit; os demais enxergam a mudança em até um intervalo.
+"""
+
+# Tuplas nomeadas para os registros do snapshot
+from collections import namedtuple
+# Trava para a remontagem (o snapshot é compartilhado entre threads)
+import threading
+# Relógio monotônico para o intervalo entre verificações
+import time
+# Mapa somente leitura
+from types import MappingProxyType
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+# Renderer JSON do projeto, o mesmo usado nas respostas da API
+from core.renderers import ORJSONRenderer
+
+from .models import Exercicio, VersaoCatalogo
+from .serializers import ExercicioSerializer
+
+# Nome do catálogo na tabela de versões
+NOME_CATALOGO = 'exercicios'
+
+# Registro compacto de um exercício (mesmos campos do ExercicioSerializer)
+ExercicioRegistro = namedtuple('ExercicioRegistro', ExercicioSerializer.Meta.fields)
+
+
+class CatalogoExercicios:
+    """
+    Snapshot imutável do catálogo de exercícios.
+
+    Atributos:
+        versao (int): Versão do catálogo no banco quando o snapshot foi montado
+        registros (Mapping): {id: ExercicioRegistro}, somente leitura
+        json (bytes): Lista completa de exercícios já renderizada em JSON
+    """
+    __slots__ = ('versao', 'registros', 'json')
+
+    def __init__(self, versao, registros, json):
+        object.__setattr__(self, 'versao', versao)
+        object.__setattr__(self, 'registros', MappingProxyType(registros))
+        object.__setattr__(self, 'json', json)
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError('O snapshot do catálogo é imutável')
+
+    def __contains__(self, exercicio_id):
+        return exercicio_id in self.registros
+
+
+# Estado do processo: snapshot atual e momento da última verificação
+_snapshot = None
+_verificado_em = float('-inf')
+_trava = threading.Lock()
+
+
+def _versao_no_banco():
+    """Lê a versão atual do catálogo (0 se ainda não houver linha)."""
+    versao = VersaoCatalogo.objects.filter(nome=NOME_CATALOGO).values_list(
+        'versao', flat=True).first()
+    return versao or 0
+
+
+def _montar(versao):
+    """Monta um snapshot novo a partir do banco."""
+    dados = ExercicioSerializer(Exercicio.all_objects.order_by('id'), many=True).data
+    registros = {item['id']: ExercicioRegistro(**item) for item in dados}
+    return CatalogoExercicios(versao, registros, ORJSONRenderer().render(dados))
+
+
+def obter_catalogo():
+    """
+    Retorna o snapshot atual do catálogo, remontando-o se a versão mudou.
+
+    Returns:
+        CatalogoExercicios: Snapshot do catálogo deste processo
+    """
+    global _snapshot, _verificado_em
+
+    intervalo = getattr(settings, 'EXERCICIOS_CATALOGO_INTERVALO', 5)
+    snapshot = _snapshot
+    if snapshot is not None and time.monotonic() - _verificado_em < intervalo:
+        return snapshot
+
+    with _trava:
+        # Outra thread pode ter verificado enquanto esta esperava a trava
+        if _snapshot is not None and time.monotonic() - _verificado_em < intervalo:
+            return _snapshot
+
+        # A versão é lida antes dos registros: se houver uma alteração no
+        # meio, o snapshot fica com a versão antiga e é remontado de novo
+        versao = _versao_no_banco()
+        if _snapshot is None or _snapshot.versao != versao:
+            _snapshot = _montar(versao)
+        _verificado_em = time.monotonic()
+        return _snapshot
+
+
+def _expirar_verificacao():
+    """Faz a próxima leitura deste processo conferir a versão no banco."""
+    global _verificado_em
+    _verificado_em = float('-inf')
+
+
+def incrementar_versao():
+    """
+    Incrementa a versão do catálogo no banco.
+
+    Chamado pelos signals de Exercicio. Roda na mesma transação da
+    alteração, então a versão nova só aparece junto com ela.
+    """
+    atualizados = VersaoCatalogo.objects.filter(nome=NOME_CATALOGO).update(
+        versao=F('versao') + 1)
+    if not atualizados:
+        VersaoCatalogo.objects.get_or_create(nome=NOME_CATALOGO, defaults={'versao': 1})
+    transaction.on_commit(_expirar_verificacao)
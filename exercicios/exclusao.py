@@ -0,0 +1,63 @@
+# =============================================================================
+# ARQUIVO: exercicios/exclusao.py
+# DESCRIÇÃO: Exclusão de exercícios do projeto Dumbbell Fitness
+# FUNÇÃO: Remove o exercício e suas referências nos treinos, em lotes
+# =============================================================================
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.exclusao import conferir_protegidos, excluir_em_lotes
+from treinos.models import Treino, ExercicioTreino
+
+from .models import Exercicio
+
+
+def excluir_exercicio(exercicio_id):
+    """
+    Remove as referências do exercício nos treinos e depois o exercício.
+
+    As referências (ExercicioTreino) são apagadas em lotes, sem carregar as
+    linhas; a cada lote, os treinos afetados têm a atualizacao renovada
+    para que a ETag deles mude (o resumo dos donos é agendado pelo signal
+    pre_exclusao_lote, em treinos/signals.py). O exercício é apagado por
+    último, com o delete() normal, que dispara os signals do catálogo.
+
+    Séries registradas (SerieRegistrada) protegem o exercício. Elas são
+    conferidas antes da primeira referência apagada, e então nada é
+    apagado, e de novo com o exercício travado na transação final: uma
+    série registrada durante a cascata mantém o exercício, já sem as
+    referências removidas.
+
+    Args:
+        exercicio_id (int): ID do exercício
+
+    Returns:
+        int: Quantidade de referências removidas
+
+    Raises:
+        ProtectedError: Se o exercício tiver séries registradas
+    """
+    exercicio = Exercicio.all_objects.filter(pk=exercicio_id).first()
+    if exercicio is None:
+        return 0
+    conferir_protegidos(exercicio, ignorar=(ExercicioTreino,))
+
+    def marcar_treinos(ids):
+        Treino.all_objects.filter(
+            pk__in=ExercicioTreino.all_objects.filter(pk__in=ids).values('treino_id')
+        ).update(atualizacao=timezone.now())
+
+    removidas = excluir_em_lotes(
+        ExercicioTreino.all_objects.filter(exercicio_id=exercicio_id),
+        antes_do_lote=marcar_treinos,
+        descricao=f'referências do exercício {exercicio_id}',
+    )
+
+    with transaction.atomic():
+        # O lock segura novas séries do exercício até o commit
+        exercicio = Exercicio.all_objects.select_for_update().filter(pk=exercicio_id).first()
+        if exercicio is not None:
+            conferir_protegidos(exercicio, ignorar=(ExercicioTreino,))
+            exercicio.delete()
+    return removidas
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercicios', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VersaoCatalogo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nome', models.CharField(max_length=50, unique=True, verbose_name='Nome')),
+                ('versao', models.PositiveBigIntegerField(default=0, verbose_name='Versão')),
+            ],
+            options={
+                'verbose_name': 'Versão de catálogo',
+                'verbose_name_plural': 'Versões de catálogo',
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercicios', '0002_versaocatalogo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exercicio',
+            name='grupo_muscular',
+            field=models.CharField(choices=[('Biceps', 'Biceps'), ('Triceps', 'Triceps'), ('Peito', 'Peito'), ('Costas', 'Costas'), ('Ombro', 'Ombro'), ('Glúteos', 'Glúteos'), ('Panturrilha', 'Panturrilha'), ('Quadríceps', 'Quadríceps'), ('Abdominal', 'Abdominal'), ('Lombar', 'Lombar'), ('Trapézio', 'Trapézio'), ('Outros', 'Outros')], default='Outros', max_length=30, verbose_name='Grupo Muscular'),
+        ),
+        migrations.AddIndex(
+            model_name='exercicio',
+            index=models.Index(fields=['categoria', 'grupo_muscular'], name='exercicio_cat_grupo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exercicio',
+            index=models.Index(fields=['grupo_muscular', 'equipamento'], name='exercicio_grupo_equip_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercicios', '0003_exercicio_grupo_muscular_indices_faceta'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='exercicio',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
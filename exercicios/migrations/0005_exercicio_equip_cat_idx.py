@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercicios', '0004_alter_exercicio_managers'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exercicio',
+            index=models.Index(fields=['equipamento', 'categoria'], name='exercicio_equip_cat_idx'),
+        ),
+    ]
@@ -31,5 +31,39 @@ class Exercicio(BaseModel):
     equipamento = models.CharField(
         "Equipamento", max_length=255, blank=True, null=True)
 
+    class Meta:
+        # Índices compostos para os filtros de faceta da busca (exercicios/busca.py).
+        # As três facetas se revezam na primeira coluna: cada faceta sozinha
+        # e cada par de facetas é o prefixo de um índice. A busca por texto
+        # (icontains em nome/descricao) não usa índice.
+        indexes = [
+            models.Index(fields=['categoria', 'grupo_muscular'], name='exercicio_cat_grupo_idx'),
+            models.Index(fields=['grupo_muscular', 'equipamento'], name='exercicio_grupo_equip_idx'),
+            models.Index(fields=['equipamento', 'categoria'], name='exercicio_equip_cat_idx'),
+        ]
+
     def __str__(self):
         return self.nome  # Exibe o nome no admin e em outras referências
+
+
+class VersaoCatalogo(models.Model):
+    """
+    Contador de versão de um catálogo, guardado no banco.
+
+    Cada alteração em Exercicio incrementa a versão do catálogo
+    'exercicios' (ver exercicios/signals.py). Os workers comparam essa
+    versão com a do snapshot em memória (exercicios/catalogo.py) para
+    saber quando recarregá-lo.
+
+    Não herda BaseModel: a linha só é alterada por UPDATE com F(), que não
+    passa pelo auto_now, então os campos de controle não fariam sentido.
+    """
+    nome = models.CharField("Nome", max_length=50, unique=True)
+    versao = models.PositiveBigIntegerField("Versão", default=0)
+
+    class Meta:
+        verbose_name = 'Versão de catálogo'
+        verbose_name_plural = 'Versões de catálogo'
+
+    def __str__(self):
+        return f"{self.nome} v{self.versao}"
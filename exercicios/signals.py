@@ -0,0 +1,23 @@
+# Signals de modelo do Django
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Modelo do catálogo público de exercícios
+from .models import Exercicio
+
+# Invalidação do cache de respostas do catálogo
+from core.response_cache import invalidar_catalogo
+
+# Versão do snapshot em memória do catálogo
+from .catalogo import incrementar_versao
+
+
+@receiver(post_save, sender=Exercicio)
+@receiver(post_delete, sender=Exercicio)
+def invalidar_catalogo_exercicios(sender, using, **kwargs):
+    """
+    Invalida o cache da listagem pública de exercícios e incrementa a
+    versão do snapshot em memória a cada alteração em Exercicio.
+    """
+    invalidar_catalogo('exercicios', using=using)
+    incrementar_versao()
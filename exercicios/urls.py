@@ -1,8 +1,11 @@
 # Importa o DefaultRouter do DRF para registrar rotas automaticamente com base nos ViewSets
 from rest_framework.routers import DefaultRouter
 
+from django.conf import settings
+from django.urls import path
+
 # Importa o ViewSet que controla as operações CRUD para o modelo Exercicio
-from .views import ExercicioViewSet
+from .views import ExercicioViewSet, exercicios_list_async
 
 # Cria uma instância do roteador padrão do DRF
 router = DefaultRouter()
@@ -12,3 +15,10 @@ router.register('', ExercicioViewSet)
 
 # Expõe as URLs geradas pelo router para inclusão no arquivo principal de URLs
 urlpatterns = router.urls
+
+# No perfil ASGI, a listagem usa a variante assíncrona (ver core/assincrono.py);
+# ela vem antes do router e repassa os outros métodos ao ViewSet
+if settings.VIEWS_ASSINCRONAS:
+    urlpatterns = [
+        path('', exercicios_list_async, name='exercicio-list-async'),
+    ] + urlpatterns
@@ -1,5 +1,16 @@
+import logging
+
+from django.db import transaction
+from django.db.models import ProtectedError
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+
+# Repasse à view síncrona quando a página não está em cache
+from asgiref.sync import sync_to_async
+
 # Importa o módulo viewsets do DRF, que facilita criar CRUDs completos com pouco código
-from rest_framework import viewsets, status
+from rest_framework import exceptions, viewsets, status
+from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
@@ -9,11 +20,33 @@ from .models import Exercicio
 # Importa o serializer que transforma dados do modelo em JSON e vice-versa
 from .serializers import ExercicioSerializer
 
-# Importa o modelo ExercicioTreino para remover referências
-from treinos.models import ExercicioTreino
+# Snapshot do catálogo em memória (sem consulta ao banco)
+from .catalogo import obter_catalogo
+
+# Busca por texto e facetas (categoria, grupo muscular, equipamento)
+from .busca import contar_facetas, filtrar_facetas, filtrar_texto, ler_filtros
+
+# Importa o modelo ExercicioTreino para contar as referências
+# e SerieRegistrada para preservar o histórico de séries executadas
+from treinos.models import ExercicioTreino, SerieRegistrada
+
+# Exclusão em lotes das referências nos treinos
+from core.exclusao import executar_em_segundo_plano, limite_sincrono
+from .exclusao import excluir_exercicio
+
+# Cache versionado das respostas do catálogo público
+from core.response_cache import VARY_CATALOGO, responder_com_cache, ler_cache_async
 
+# ETag / Last-Modified para listagem e detalhe
+from core.conditional import CondicionalGetMixin, impressao_da_pagina_async
 
-class ExercicioViewSet(viewsets.ModelViewSet):
+# Variante assíncrona da listagem (perfil ASGI)
+from core.assincrono import autenticar_async, leitura_assincrona
+
+logger = logging.getLogger(__name__)
+
+
+class ExercicioViewSet(CondicionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet para gerenciar operações CRUD no modelo Exercicio.
 
@@ -21,12 +54,80 @@ class ExercicioViewSet(viewsets.ModelViewSet):
     utilizando o serializer ExercicioSerializer para conversão dos dados.
     
     Acesso público - qualquer pessoa pode ver os exercícios disponíveis.
+
+    Além do CRUD:
+    - GET /api/v1/exercicios/busca/ faz a busca por texto e facetas usada
+      pelo seletor de exercícios do app
+    - GET /api/v1/exercicios/catalogo/ devolve o catálogo completo a partir
+      do snapshot em memória
     """
 
-    queryset = Exercicio.objects.all().order_by('id')
+    queryset = Exercicio.all_objects.all().order_by('id')
     serializer_class = ExercicioSerializer
     permission_classes = [AllowAny]  # Permite acesso público aos exercícios
 
+    def list(self, request, *args, **kwargs):
+        """
+        Lista os exercícios usando o cache de respostas do catálogo.
+
+        Cada página (cursor + page_size) fica em cache até a próxima
+        alteração em exercícios (ver core/response_cache.py e
+        exercicios/signals.py).
+        """
+        def montar_dados():
+            return super(ExercicioViewSet, self).list(request, *args, **kwargs).data
+
+        return responder_com_cache(request, 'exercicios', montar_dados)
+
+    @action(detail=False, methods=['get'])
+    def catalogo(self, request):
+        """
+        Retorna o catálogo completo de exercícios, sem paginação.
+
+        O JSON vem pronto do snapshot em memória do worker
+        (exercicios/catalogo.py), então a resposta não consulta o banco
+        enquanto o catálogo não muda. A ETag é a versão do catálogo: com
+        If-None-Match igual, a resposta é 304.
+        """
+        snapshot = obter_catalogo()
+        etag = f'"exercicios-{snapshot.versao}"'
+
+        resposta = get_conditional_response(request, etag=etag)
+        if resposta is None:
+            resposta = HttpResponse(snapshot.json, content_type='application/json')
+        resposta['ETag'] = etag
+        return resposta
+
+    @action(detail=False, methods=['get'])
+    def busca(self, request):
+        """
+        Busca exercícios por texto e facetas, com a contagem de cada faceta.
+
+        Parâmetros (todos opcionais):
+        - q: texto buscado no nome e na descrição
+        - categoria, grupo_muscular, equipamento: um ou mais valores
+          (repetindo o parâmetro ou separados por vírgula)
+
+        A resposta traz a página de resultados (mesma paginação por cursor
+        da listagem) e as facetas:
+            {"next": ..., "previous": ..., "results": [...],
+             "facetas": {"categoria": [{"valor": "Musculacao", "total": 12}, ...], ...}}
+
+        Usa o mesmo cache de respostas da listagem: cada combinação de
+        parâmetros fica em cache até a próxima alteração em exercícios.
+        """
+        def montar_dados():
+            filtros = ler_filtros(request.query_params)
+            por_texto = filtrar_texto(self.get_queryset(), request.query_params.get('q'))
+
+            page = self.paginate_queryset(filtrar_facetas(por_texto, filtros))
+            serializer = self.get_serializer(page, many=True)
+            dados = self.get_paginated_response(serializer.data).data
+            dados['facetas'] = contar_facetas(por_texto, filtros)
+            return dados
+
+        return responder_com_cache(request, 'exercicios', montar_dados)
+
     def destroy(self, request, *args, **kwargs):
         """
         Sobrescreve o método destroy para remover referências do exercício
@@ -34,20 +135,47 @@ class ExercicioViewSet(viewsets.ModelViewSet):
         
         Isso evita o erro ProtectedError quando o exercício está sendo usado
         em treinos.
+        
+        As referências são apagadas em lotes (exercicios/exclusao.py), em
+        uma única transação. Acima de settings.EXCLUSAO_LIMITE_SINCRONO
+        referências, a exclusão roda em segundo plano e a resposta é 202.
+        
+        Exercícios com séries registradas em sessões de treino não são
+        excluídos (409), para não apagar o histórico dos alunos; nesse caso,
+        desative o exercício (ativo=false).
         """
         exercicio = self.get_object()
+
+        if SerieRegistrada.objects.filter(exercicio=exercicio).exists():
+            return Response(
+                {
+                    'error': f'O exercício "{exercicio.nome}" tem séries registradas no '
+                             'histórico dos alunos. Desative-o em vez de excluir.'
+                },
+                status=status.HTTP_409_CONFLICT
+            )
         
         try:
-            # Remove todas as referências do exercício nos treinos
-            exercicios_treino = ExercicioTreino.objects.filter(exercicio=exercicio)
-            count_removidos = exercicios_treino.count()
-            
-            if count_removidos > 0:
-                exercicios_treino.delete()
-                print(f"Removidas {count_removidos} referências do exercício '{exercicio.nome}' nos treinos")
-            
-            # Agora pode deletar o exercício com segurança
-            self.perform_destroy(exercicio)
+            count_removidos = ExercicioTreino.all_objects.filter(exercicio=exercicio).count()
+
+            if count_removidos > limite_sincrono():
+                executar_em_segundo_plano(
+                    excluir_exercicio, exercicio.pk, nome=f'excluir-exercicio-{exercicio.pk}')
+                logger.info("Exclusão do exercício %s agendada (%s referências)",
+                            exercicio.pk, count_removidos)
+                return Response(
+                    {
+                        'message': f'Exclusão do exercício "{exercicio.nome}" agendada.',
+                        'referencias_removidas': count_removidos
+                    },
+                    status=status.HTTP_202_ACCEPTED
+                )
+
+            # Remove as referências nos treinos e depois o exercício
+            with transaction.atomic():
+                count_removidos = excluir_exercicio(exercicio.pk)
+            logger.info("Removidas %s referências do exercício %s nos treinos",
+                        count_removidos, exercicio.pk)
             
             return Response(
                 {
@@ -57,10 +185,66 @@ class ExercicioViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_200_OK
             )
             
+        except ProtectedError:
+            # Série registrada depois da conferência acima (ver excluir_exercicio)
+            logger.info("Exclusão do exercício %s interrompida: séries registradas", exercicio.pk)
+            return Response(
+                {
+                    'error': f'O exercício "{exercicio.nome}" tem séries registradas no '
+                             'histórico dos alunos. Desative-o em vez de excluir.'
+                },
+                status=status.HTTP_409_CONFLICT
+            )
+
         except Exception as e:
+            logger.exception("Erro ao deletar exercício %s", exercicio.pk)
             return Response(
                 {
                     'error': f'Erro ao deletar exercício: {str(e)}'
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+# =============================================================================
+# VARIANTE ASSÍNCRONA (perfil ASGI, settings.VIEWS_ASSINCRONAS)
+# =============================================================================
+
+# Listagem síncrona do DRF: atende POST (criação), a browsable API e as
+# páginas que ainda não estão no cache de respostas
+exercicios_list = ExercicioViewSet.as_view({'get': 'list', 'post': 'create'})
+
+
+@leitura_assincrona(exercicios_list)
+async def exercicios_list_async(request):
+    """
+    Variante assíncrona da listagem de exercícios.
+
+    A ETag vem das linhas da página pedida (ver impressao_da_pagina), com o
+    usuário resolvido de forma assíncrona: é a mesma da view síncrona. A
+    página vem do cache de respostas compartilhado com a view síncrona.
+    Se a página ainda não estiver em cache (só logo após uma alteração no
+    catálogo), a view síncrona monta a página com a paginação por cursor
+    do DRF e a guarda no cache para as próximas requisições.
+    """
+    try:
+        user = await autenticar_async(request)
+    except exceptions.APIException:
+        # Token inválido: a view síncrona responde o erro do DRF
+        return await sync_to_async(exercicios_list)(request)
+
+    # Listagem: só a ETag, como no CondicionalGetMixin (sem Last-Modified)
+    etag = await impressao_da_pagina_async(
+        request, ExercicioViewSet.queryset.all(), ExercicioViewSet.pagination_class(),
+        ExercicioViewSet.condicional_campos, user_pk=user.pk)
+
+    resposta = get_conditional_response(request, etag=etag)
+    if resposta is None:
+        _, conteudo = await ler_cache_async(request, 'exercicios')
+        if conteudo is None:
+            return await sync_to_async(exercicios_list)(request)
+        resposta = HttpResponse(conteudo, content_type='application/json')
+
+    resposta['ETag'] = etag
+    patch_vary_headers(resposta, VARY_CATALOGO)
+    return resposta
@@ -9,7 +9,7 @@ from planos.models import Plano, Modalidade, PlanoModalidade
 @admin.register(Plano)
 class PlanoAdmin(admin.ModelAdmin):
     # Campos exibidos na lista de registros do admin para facilitar a visualização
-    list_display = ('id', 'titulo', 'preco', 'mostrar_beneficios',
+    list_display = ('id', 'titulo', 'preco', 'limite_treinos', 'mostrar_beneficios',
                     'ativo', 'criacao', 'atualizacao')
     
     # Campos para filtros laterais
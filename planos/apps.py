@@ -8,3 +8,7 @@ class PlanosConfig(AppConfig):
 
     # Nome do app, usado internamente pelo Django
     name = 'planos'
+
+    def ready(self):
+        # Registra os signals do app (invalidação do cache do catálogo)
+        from . import signals  # noqa: F401
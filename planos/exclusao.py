@@ -0,0 +1,57 @@
+# =============================================================================
+# ARQUIVO: planos/exclusao.py
+# DESCRIÇÃO: Exclusão de planos do projeto Dumbbell Fitness
+# FUNÇÃO: Remove o plano, suas matrículas e modalidades, em lotes
+# =============================================================================
+
+from django.db import transaction
+
+from cadastros.models import Matricula
+from core.exclusao import conferir_protegidos, excluir_em_lotes
+
+from .models import Plano, PlanoModalidade
+
+
+def excluir_plano(plano_id):
+    """
+    Remove as matrículas e as modalidades do plano e depois o plano.
+
+    Matrículas e PlanoModalidade são apagadas em lotes, sem carregar as
+    linhas e sem o signal por linha de PlanoModalidade: o cache do
+    catálogo de planos é invalidado uma vez, pelo signal do próprio plano,
+    apagado por último com o delete() normal. O resumo dos alunos de cada
+    lote de matrículas é agendado pelo signal pre_exclusao_lote
+    (treinos/signals.py).
+
+    Dependentes protegidos além das matrículas são conferidos antes da
+    cascata e de novo com o plano travado na transação final.
+
+    Args:
+        plano_id (int): ID do plano
+
+    Returns:
+        tuple: (matrículas removidas, modalidades removidas)
+
+    Raises:
+        ProtectedError: Se o plano tiver outros dependentes protegidos
+    """
+    plano = Plano.all_objects.filter(pk=plano_id).first()
+    if plano is None:
+        return 0, 0
+    conferir_protegidos(plano, ignorar=(Matricula,))
+
+    matriculas = excluir_em_lotes(
+        Matricula.all_objects.filter(plano_id=plano_id),
+        descricao=f'matrículas do plano {plano_id}',
+    )
+    modalidades = excluir_em_lotes(
+        PlanoModalidade.all_objects.filter(plano_id=plano_id),
+        descricao=f'modalidades do plano {plano_id}',
+    )
+
+    with transaction.atomic():
+        plano = Plano.all_objects.select_for_update().filter(pk=plano_id).first()
+        if plano is not None:
+            conferir_protegidos(plano, ignorar=(Matricula,))
+            plano.delete()
+    return matriculas, modalidades
@@ -0,0 +1,36 @@
+from django.db import migrations, models
+
+
+def copiar_limites(apps, schema_editor):
+    """
+    Copia os limites que antes ficavam fixos no TreinoSerializer.
+
+    Usa SQL direto porque o estado do 0001 ainda chama o título do plano
+    de 'nome'; a coluna existente no banco é descoberta por introspecção.
+    """
+    conexao = schema_editor.connection
+    with conexao.cursor() as cursor:
+        colunas = {coluna.name for coluna in
+                   conexao.introspection.get_table_description(cursor, 'planos_plano')}
+    titulo = 'titulo' if 'titulo' in colunas else 'nome'
+
+    schema_editor.execute(
+        f"UPDATE planos_plano SET limite_treinos = 4 WHERE LOWER({titulo}) = 'starter'")
+    schema_editor.execute(
+        f"UPDATE planos_plano SET limite_treinos = NULL WHERE LOWER({titulo}) = 'dumbbell'")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='plano',
+            name='limite_treinos',
+            field=models.PositiveIntegerField(blank=True, default=0, help_text='Quantidade máxima de treinos ativos por aluno. Deixe vazio para ilimitado.', null=True, verbose_name='Limite de treinos'),
+        ),
+        migrations.RunPython(copiar_limites, migrations.RunPython.noop),
+    ]
@@ -15,13 +15,17 @@ class Plano(BaseModel):
     """
     Modelo que representa um plano de treino.
 
-    Contém informações básicas como título, preço, descrição e benefícios do plano.
+    Contém informações básicas como título, preço, descrição e benefícios do plano,
+    além do limite de treinos ativos que cada aluno do plano pode ter.
     """
 
     titulo = models.CharField('Título', max_length=255)
     preco = models.DecimalField('Preço', max_digits=8, decimal_places=2)
     descricao = models.TextField('Descrição', blank=True)
     beneficios = models.JSONField('Benefícios', default=list, help_text='Lista de benefícios oferecidos pelo plano')
+    limite_treinos = models.PositiveIntegerField(
+        'Limite de treinos', null=True, blank=True, default=0,
+        help_text='Quantidade máxima de treinos ativos por aluno. Deixe vazio para ilimitado.')
     ativo = models.BooleanField('Ativo', default=True)
 
     def __str__(self):
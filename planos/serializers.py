@@ -21,6 +21,7 @@ class PlanoSerializer(serializers.ModelSerializer):
             'titulo',
             'preco',
             'beneficios',
+            'limite_treinos',
             'ativo'
         )
 
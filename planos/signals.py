@@ -0,0 +1,23 @@
+# Signals de modelo do Django
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Modelos que fazem parte do catálogo público de planos
+from .models import Plano, Modalidade, PlanoModalidade
+
+# Invalidação do cache de respostas do catálogo
+from core.response_cache import invalidar_catalogo
+
+
+@receiver(post_save, sender=Plano)
+@receiver(post_delete, sender=Plano)
+@receiver(post_save, sender=Modalidade)
+@receiver(post_delete, sender=Modalidade)
+@receiver(post_save, sender=PlanoModalidade)
+@receiver(post_delete, sender=PlanoModalidade)
+def invalidar_catalogo_planos(sender, using, **kwargs):
+    """
+    Invalida o cache da listagem pública de planos a cada alteração
+    em Plano, Modalidade ou PlanoModalidade.
+    """
+    invalidar_catalogo('planos', using=using)
@@ -1,4 +1,5 @@
 # Importa funções para definir URLs e incluir outras rotas
+from django.conf import settings
 from django.urls import path, include
 
 # Importa roteador padrão do DRF para registrar ViewSets automaticamente
@@ -15,9 +16,16 @@ from .views import (
     planos_list,
     plano_detail,
     CustomAuthToken,
-    user_info
+    logout,
+    user_info,
+    planos_list_async,
+    plano_detail_async,
+    user_info_async
 )
 
+# No perfil ASGI, as leituras usam as variantes assíncronas (ver core/assincrono.py)
+ASSINCRONAS = settings.VIEWS_ASSINCRONAS
+
 # Cria uma instância do roteador padrão
 router = DefaultRouter()
 
@@ -35,11 +43,12 @@ router.register('planomodalidades', PlanoModalidadeViewSet,
 urlpatterns = [
     # Rotas para autenticação
     path('auth/login/', CustomAuthToken.as_view(), name='auth-login'),  # Login com token
-    path('auth/user/', user_info, name='user-info'),  # Informações do usuário logado
+    path('auth/user/', user_info_async if ASSINCRONAS else user_info, name='user-info'),  # Informações do usuário logado
+    path('auth/logout/', logout, name='auth-logout'),  # Logout (apaga o token)
     
     # Rotas customizadas para planos (mais específicas)
-    path('list/', planos_list, name='planos-list'),  # Lista todos os planos (sem auth)
-    path('detail/<int:pk>/', plano_detail, name='plano-detail'),  # Detalhes de um plano (com auth)
+    path('list/', planos_list_async if ASSINCRONAS else planos_list, name='planos-list'),  # Lista todos os planos (sem auth)
+    path('detail/<int:pk>/', plano_detail_async if ASSINCRONAS else plano_detail, name='plano-detail'),  # Detalhes de um plano (com auth)
     
     # Inclui as rotas do router (ViewSets) - deve vir por último
     path('', include(router.urls)),
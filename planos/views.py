@@ -1,3 +1,8 @@
+import logging
+
+from django.db import transaction
+from django.db.models import ProtectedError
+
 # Importa classes para views genéricas e viewsets do DRF
 from rest_framework import generics, viewsets, status
 from rest_framework.decorators import api_view, permission_classes
@@ -15,9 +20,24 @@ from .serializers import PlanoSerializer, ModalidadeSerializer, PlanoModalidadeS
 # Importa o modelo User do Django
 from django.contrib.auth.models import User
 
-# Importa o modelo Matricula para remover referências
+# Importa o modelo Matricula para contar as referências
 from cadastros.models import Matricula
 
+# Exclusão em lotes das matrículas e modalidades do plano
+from core.exclusao import executar_em_segundo_plano, limite_sincrono
+from .exclusao import excluir_plano
+
+# ETag / Last-Modified para listagem e detalhe
+from core.conditional import CondicionalGetMixin
+
+# Cache versionado das respostas do catálogo público
+from core.response_cache import responder_com_cache, responder_com_cache_async
+
+# Variantes assíncronas das views de leitura (perfil ASGI)
+from core.assincrono import leitura_assincrona, resposta_json
+
+logger = logging.getLogger(__name__)
+
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -26,10 +46,15 @@ def planos_list(request):
     View para listar todos os planos ativos.
     
     Permite acesso sem autenticação para visualização dos planos disponíveis.
+    
+    O JSON renderizado fica em cache até a próxima alteração em planos ou
+    modalidades (ver core/response_cache.py e planos/signals.py).
     """
-    planos = Plano.objects.filter(ativo=True).order_by('preco')
-    serializer = PlanoSerializer(planos, many=True)
-    return Response(serializer.data)
+    def montar_dados():
+        planos = Plano.objects.order_by('preco')
+        return PlanoSerializer(planos, many=True).data
+
+    return responder_com_cache(request, 'planos', montar_dados)
 
 
 @api_view(['GET'])
@@ -41,7 +66,7 @@ def plano_detail(request, pk):
     Requer autenticação para acessar informações detalhadas do plano.
     """
     try:
-        plano = Plano.objects.get(pk=pk, ativo=True)
+        plano = Plano.objects.get(pk=pk)
         serializer = PlanoSerializer(plano)
         return Response(serializer.data)
     except Plano.DoesNotExist:
@@ -72,6 +97,19 @@ class CustomAuthToken(ObtainAuthToken):
         })
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def logout(request):
+    """
+    View para encerrar a sessão do usuário via token.
+    
+    Apaga o token do usuário logado; o signal de Token remove a chave
+    também do cache de autenticação (ver core/signals.py).
+    """
+    Token.objects.filter(user=request.user).delete()
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def user_info(request):
@@ -84,13 +122,59 @@ def user_info(request):
     return Response(serializer.data)
 
 
-class PlanoViewSet(viewsets.ModelViewSet):
+# =============================================================================
+# VARIANTES ASSÍNCRONAS (perfil ASGI, settings.VIEWS_ASSINCRONAS)
+# =============================================================================
+
+@leitura_assincrona(planos_list)
+async def planos_list_async(request):
+    """
+    Variante assíncrona de planos_list.
+
+    Compartilha o cache de respostas com a view síncrona; no cache miss,
+    os planos são lidos com o ORM assíncrono.
+    """
+    async def montar_dados():
+        planos = [plano async for plano in Plano.objects.order_by('preco')]
+        return PlanoSerializer(planos, many=True).data
+
+    return await responder_com_cache_async(request, 'planos', montar_dados)
+
+
+@leitura_assincrona(plano_detail, autenticada=True)
+async def plano_detail_async(request, pk):
+    """
+    Variante assíncrona de plano_detail.
+
+    Requer autenticação; o plano é lido com o ORM assíncrono.
+    """
+    try:
+        plano = await Plano.objects.aget(pk=pk)
+    except Plano.DoesNotExist:
+        return resposta_json(
+            {'error': 'Plano não encontrado'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return resposta_json(PlanoSerializer(plano).data)
+
+
+@leitura_assincrona(user_info, autenticada=True)
+async def user_info_async(request):
+    """
+    Variante assíncrona de user_info.
+
+    Com o token em cache, responde sem nenhuma consulta ao banco.
+    """
+    return resposta_json(UserSerializer(request.user).data)
+
+
+class PlanoViewSet(CondicionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet para operações CRUD no modelo Plano.
 
     Permite criar, listar, atualizar e deletar registros de planos.
     """
-    queryset = Plano.objects.all().order_by('id')
+    queryset = Plano.all_objects.all().order_by('id')
     serializer_class = PlanoSerializer
     permission_classes = [IsAuthenticated]  # Adiciona autenticação obrigatória
 
@@ -101,28 +185,34 @@ class PlanoViewSet(viewsets.ModelViewSet):
         
         Isso evita o erro ProtectedError quando o plano está sendo usado
         em matrículas.
+        
+        Matrículas e modalidades são apagadas em lotes (planos/exclusao.py),
+        em uma única transação. Acima de settings.EXCLUSAO_LIMITE_SINCRONO
+        matrículas, a exclusão roda em segundo plano e a resposta é 202.
         """
         plano = self.get_object()
         
         try:
-            # Remove todas as matrículas relacionadas ao plano
-            matriculas = Matricula.objects.filter(plano=plano)
-            count_matriculas = matriculas.count()
-            
-            if count_matriculas > 0:
-                matriculas.delete()
-                print(f"Removidas {count_matriculas} matrículas do plano '{plano.titulo}'")
-            
-            # Remove relacionamentos PlanoModalidade
-            plano_modalidades = PlanoModalidade.objects.filter(plano=plano)
-            count_modalidades = plano_modalidades.count()
-            
-            if count_modalidades > 0:
-                plano_modalidades.delete()
-                print(f"Removidas {count_modalidades} relações de modalidade do plano '{plano.titulo}'")
-            
-            # Agora pode deletar o plano com segurança
-            self.perform_destroy(plano)
+            count_matriculas = Matricula.all_objects.filter(plano=plano).count()
+
+            if count_matriculas > limite_sincrono():
+                executar_em_segundo_plano(
+                    excluir_plano, plano.pk, nome=f'excluir-plano-{plano.pk}')
+                logger.info("Exclusão do plano %s agendada (%s matrículas)",
+                            plano.pk, count_matriculas)
+                return Response(
+                    {
+                        'message': f'Exclusão do plano "{plano.titulo}" agendada.',
+                        'matriculas_removidas': count_matriculas
+                    },
+                    status=status.HTTP_202_ACCEPTED
+                )
+
+            # Remove matrículas e modalidades e depois o plano
+            with transaction.atomic():
+                count_matriculas, count_modalidades = excluir_plano(plano.pk)
+            logger.info("Removidas %s matrículas e %s relações de modalidade do plano %s",
+                        count_matriculas, count_modalidades, plano.pk)
             
             return Response(
                 {
@@ -133,7 +223,19 @@ class PlanoViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_200_OK
             )
             
+        except ProtectedError as e:
+            # Dependente protegido criado durante a exclusão (ver excluir_plano)
+            logger.info("Exclusão do plano %s interrompida: %s", plano.pk, e.args[0])
+            return Response(
+                {
+                    'error': f'O plano "{plano.titulo}" ainda tem registros associados. '
+                             'Tente novamente.'
+                },
+                status=status.HTTP_409_CONFLICT
+            )
+
         except Exception as e:
+            logger.exception("Erro ao deletar plano %s", plano.pk)
             return Response(
                 {
                     'error': f'Erro ao deletar plano: {str(e)}'
@@ -148,7 +250,7 @@ class ModalidadeViewSet(viewsets.ModelViewSet):
 
     Permite criar, listar, atualizar e deletar registros de modalidades.
     """
-    queryset = Modalidade.objects.all().order_by('id')
+    queryset = Modalidade.all_objects.all().order_by('id')
     serializer_class = ModalidadeSerializer
 
 
@@ -158,5 +260,5 @@ class PlanoModalidadeViewSet(viewsets.ModelViewSet):
 
     Permite criar, listar, atualizar e deletar registros que relacionam planos e modalidades.
     """
-    queryset = PlanoModalidade.objects.all().order_by('id')
+    queryset = PlanoModalidade.all_objects.all().order_by('id')
     serializer_class = PlanoModalidadeSerializer
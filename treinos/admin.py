@@ -1,8 +1,8 @@
 # Importa o módulo admin do Django para registrar modelos na interface administrativa
 from django.contrib import admin
 
-# Importa o modelo Treino para gerenciar no admin
-from .models import Treino
+# Importa os modelos Treino e SessaoTreino para gerenciar no admin
+from .models import Treino, SessaoTreino
 
 
 @admin.register(Treino)
@@ -16,3 +16,11 @@ class TreinoAdmin(admin.ModelAdmin):
 
     def altura(self, obj):
         return obj.aluno.altura
+
+
+@admin.register(SessaoTreino)
+class SessaoTreinoAdmin(admin.ModelAdmin):
+    # Sessões registradas pelo app; as séries ficam fora do admin (tabela grande)
+    list_display = ('aluno', 'treino', 'inicio', 'fim', 'ativo')
+    list_select_related = ('aluno', 'treino')
+    raw_id_fields = ('aluno', 'treino')
@@ -0,0 +1,109 @@
+# =============================================================================
+# ARQUIVO: treinos/analise.py
+# DESCRIÇÃO: Análise de volume de treino do projeto Dumbbell Fitness
+# FUNÇÃO: Calcula o volume executado por aluno, grupo muscular e semana
+# =============================================================================
+
+"""
+Volume de treino (repetições × carga, somado sobre as séries) por aluno,
+grupo muscular e semana, a partir das séries registradas nas sessões
+(SerieRegistrada).
+
+Tudo sai de uma única consulta agrupada por (aluno, grupo muscular,
+semana), feita no banco: o Python recebe só as linhas já somadas, nunca
+os exercícios um a um. A variação em relação à semana anterior do mesmo
+grupo muscular vem de uma window function (LAG) na mesma consulta.
+
+O volume é o executado, não o prescrito: cada série conta na semana em
+que foi feita (registrado_em), com as repetições e a carga que o aluno
+registrou. A rotina (ExercicioTreino) guarda só a prescrição atual, sem
+histórico, então não serve para montar a série semanal. Semanas sem
+sessões registradas não aparecem. Séries sem carga (peso do corpo) contam
+com carga zero no volume, mas entram nas séries e repetições.
+
+A consulta filtra por aluno e período de registrado_em, o início do
+índice (aluno, exercicio, registrado_em, id) de SerieRegistrada.
+"""
+
+# Combinação de data + hora para os limites do período
+import datetime
+
+from django.db.models import Count, DecimalField, F, Sum, Value, Window
+from django.db.models.functions import Coalesce, Lag, TruncWeek
+from django.utils import timezone
+
+from .models import SerieRegistrada
+
+# Tipo do volume somado (carga tem 2 casas decimais)
+_VOLUME = DecimalField(max_digits=14, decimal_places=2)
+
+
+def _inicio_do_dia(data):
+    """Meia-noite (no fuso do projeto) do dia informado."""
+    return timezone.make_aware(datetime.datetime.combine(data, datetime.time.min))
+
+
+def volume_semanal(alunos_ids, inicio=None, fim=None):
+    """
+    Volume semanal por aluno e grupo muscular, com a variação semanal.
+
+    Soma as séries registradas no período, na semana de registrado_em. O
+    filtro de período vale antes do LAG, então a primeira semana do
+    período não tem variação.
+
+    Args:
+        alunos_ids (list): IDs dos alunos
+        inicio (date | None): Primeiro dia do período (incluso)
+        fim (date | None): Último dia do período (incluso)
+
+    Returns:
+        list[dict]: Linhas ordenadas por aluno, grupo muscular e semana:
+            {'aluno': id, 'grupo_muscular': str, 'semana': date,
+             'series': int, 'repeticoes': int, 'volume': Decimal,
+             'variacao': Decimal | None}
+    """
+    queryset = SerieRegistrada.objects.filter(aluno_id__in=alunos_ids)
+    if inicio is not None:
+        queryset = queryset.filter(registrado_em__gte=_inicio_do_dia(inicio))
+    if fim is not None:
+        queryset = queryset.filter(
+            registrado_em__lt=_inicio_do_dia(fim + datetime.timedelta(days=1)))
+
+    volume = Sum(
+        F('repeticoes') * Coalesce('carga', Value(0), output_field=_VOLUME),
+        output_field=_VOLUME,
+    )
+    linhas = (
+        queryset
+        .annotate(
+            grupo_muscular=F('exercicio__grupo_muscular'),
+            semana=TruncWeek('registrado_em'),
+        )
+        .values('aluno_id', 'grupo_muscular', 'semana')
+        .annotate(
+            series_total=Count('pk'),
+            repeticoes_total=Sum('repeticoes'),
+            volume=volume,
+        )
+        .annotate(anterior=Window(
+            Lag('volume'),
+            partition_by=[F('aluno_id'), F('grupo_muscular')],
+            order_by=F('semana').asc(),
+        ))
+        .order_by('aluno_id', 'grupo_muscular', 'semana')
+    )
+
+    return [
+        {
+            'aluno': linha['aluno_id'],
+            'grupo_muscular': linha['grupo_muscular'],
+            'semana': timezone.localtime(linha['semana']).date(),
+            'series': linha['series_total'],
+            'repeticoes': linha['repeticoes_total'],
+            'volume': linha['volume'],
+            'variacao': (
+                None if linha['anterior'] is None else linha['volume'] - linha['anterior']
+            ),
+        }
+        for linha in linhas
+    ]
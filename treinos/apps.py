@@ -8,3 +8,7 @@ class TreinosConfig(AppConfig):
 
     # Nome do app usado pelo Django para referência interna
     name = 'treinos'
+
+    def ready(self):
+        # Registra os signals do app (manutenção do resumo do aluno)
+        from . import signals  # noqa: F401
@@ -0,0 +1,76 @@
+# =============================================================================
+# ARQUIVO: treinos/management/commands/resumo_alunos.py
+# DESCRIÇÃO: Comando de manutenção do projeto Dumbbell Fitness
+# FUNÇÃO: Reconstrói ou confere a tabela ResumoAluno (resumo da tela inicial)
+# =============================================================================
+
+# Base dos comandos de gerenciamento do Django
+from django.core.management.base import BaseCommand, CommandError
+
+# Alunos (origem da lista) e o resumo mantido pelos signals
+from cadastros.models import Aluno
+from treinos.models import ResumoAluno
+from treinos.resumo import calcular_resumos, divergencias, recalcular_resumos
+
+
+class Command(BaseCommand):
+    """
+    Reconstrói ou confere o resumo de todos os alunos.
+
+    Uso:
+        python manage.py resumo_alunos
+        python manage.py resumo_alunos --verificar
+
+    Os alunos são processados em lotes, por ID. Sem opções, cada lote é
+    recalculado a partir das matrículas, treinos e exercícios e só as
+    linhas ausentes ou divergentes são regravadas (as demais mantêm a
+    data de atualização). Com --verificar, nada é gravado: as divergências
+    são listadas e o comando termina com erro se houver alguma.
+
+    Pode ser executado a qualquer momento e mais de uma vez.
+    """
+    help = 'Reconstrói ou confere o resumo dos alunos (tabela ResumoAluno).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lote', type=int, default=1000,
+                            help='Quantidade de alunos por lote (padrão: 1000)')
+        parser.add_argument('--verificar', action='store_true',
+                            help='Apenas confere as linhas, sem gravar')
+
+    def handle(self, *args, **options):
+        lote = options['lote']
+        verificar = options['verificar']
+        conferidos = divergentes = 0
+        ultimo_id = 0
+
+        while True:
+            ids = list(
+                Aluno.all_objects
+                .filter(pk__gt=ultimo_id)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:lote]
+            )
+            if not ids:
+                break
+            ultimo_id = ids[-1]
+            conferidos += len(ids)
+
+            if verificar:
+                diferentes = divergencias(
+                    calcular_resumos(ids), ResumoAluno.objects.in_bulk(ids))
+                for aluno_id, campos in diferentes.items():
+                    self.stdout.write(f'Aluno {aluno_id}: {", ".join(campos)}')
+                divergentes += len(diferentes)
+            else:
+                divergentes += len(recalcular_resumos(ids, somente_divergentes=True))
+
+        if verificar:
+            if divergentes:
+                raise CommandError(
+                    f'{divergentes} de {conferidos} resumo(s) divergente(s). '
+                    'Rode sem --verificar para corrigi-los.')
+            self.stdout.write(self.style.SUCCESS(
+                f'{conferidos} resumo(s) conferido(s), nenhuma divergência.'))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'{conferidos} aluno(s) processado(s), {divergentes} resumo(s) regravado(s).'))
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('treinos', '0002_alter_exerciciotreino_exercicio_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='treino',
+            index=models.Index(condition=models.Q(('ativo', True)), fields=['aluno'], name='treino_aluno_ativo_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastros', '0009_indices_parciais_ativo'),
+        ('exercicios', '0002_versaocatalogo'),
+        ('treinos', '0003_treino_aluno_ativo_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessaoTreino',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('criacao', models.DateTimeField(auto_now_add=True)),
+                ('atualizacao', models.DateTimeField(auto_now=True)),
+                ('ativo', models.BooleanField(default=True)),
+                ('id_cliente', models.UUIDField(blank=True, null=True, verbose_name='Identificador no app')),
+                ('inicio', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Início')),
+                ('fim', models.DateTimeField(blank=True, null=True, verbose_name='Fim')),
+                ('observacao', models.TextField(blank=True, verbose_name='Observações')),
+                ('aluno', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='sessoes', to='cadastros.aluno', verbose_name='Aluno')),
+                ('treino', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sessoes', to='treinos.treino', verbose_name='Treino')),
+            ],
+            options={
+                'verbose_name': 'Sessão de treino',
+                'verbose_name_plural': 'Sessões de treino',
+                'indexes': [models.Index(fields=['aluno', '-inicio'], name='sessao_aluno_inicio_idx')],
+                'constraints': [models.UniqueConstraint(fields=('aluno', 'id_cliente'), name='sessao_aluno_id_cliente_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SerieRegistrada',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('repeticoes', models.PositiveSmallIntegerField(verbose_name='Repetições')),
+                ('carga', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, verbose_name='Carga')),
+                ('registrado_em', models.DateTimeField(verbose_name='Registrada em')),
+                ('aluno', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='cadastros.aluno')),
+                ('exercicio', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='exercicios.exercicio')),
+                ('sessao', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='series', to='treinos.sessaotreino')),
+            ],
+            options={
+                'verbose_name': 'Série registrada',
+                'verbose_name_plural': 'Séries registradas',
+                'indexes': [models.Index(fields=['aluno', 'exercicio', 'registrado_em'], include=('repeticoes', 'carga'), name='serie_aluno_ex_tempo_idx')],
+            },
+        ),
+    ]
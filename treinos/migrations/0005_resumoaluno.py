@@ -0,0 +1,30 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastros', '0009_indices_parciais_ativo'),
+        ('planos', '0002_plano_limite_treinos'),
+        ('treinos', '0004_sessoes_e_series'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumoAluno',
+            fields=[
+                ('aluno', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='resumo', serialize=False, to='cadastros.aluno', verbose_name='Aluno')),
+                ('plano_titulo', models.CharField(blank=True, max_length=255, verbose_name='Plano')),
+                ('limite_treinos', models.PositiveIntegerField(blank=True, null=True, verbose_name='Limite de treinos')),
+                ('total_treinos', models.PositiveIntegerField(default=0, verbose_name='Treinos ativos')),
+                ('total_exercicios', models.PositiveIntegerField(default=0, verbose_name='Exercícios')),
+                ('atualizacao', models.DateTimeField(auto_now=True)),
+                ('plano', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='planos.plano', verbose_name='Plano')),
+            ],
+            options={
+                'verbose_name': 'Resumo do aluno',
+                'verbose_name_plural': 'Resumos dos alunos',
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('treinos', '0006_alter_exerciciotreino_managers_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='exerciciotreino',
+            options={'ordering': ['ordem', 'id']},
+        ),
+        migrations.AddField(
+            model_name='exerciciotreino',
+            name='ordem',
+            field=models.PositiveIntegerField(default=0, verbose_name='Ordem'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('treinos', '0007_exerciciotreino_ordem'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='serieregistrada',
+            name='serie_aluno_ex_tempo_idx',
+        ),
+        migrations.AddIndex(
+            model_name='serieregistrada',
+            index=models.Index(fields=['aluno', 'exercicio', 'registrado_em', 'id'], include=('repeticoes', 'carga'), name='serie_aluno_ex_tempo_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 # Imports do Django para criação de modelos (tabelas no banco)
 from django.db import models
+from django.utils import timezone
 
 # Importa modelos base e relacionados para usar como FK e herança
 from core.models import BaseModel
@@ -24,6 +25,13 @@ class Treino(BaseModel):
         "Objetivo", max_length=20, choices=OBJETIVO_TREINO)
     observacao = models.TextField("Observações", blank=True)
 
+    class Meta:
+        # Índice parcial: só os treinos ativos de cada aluno (limite do plano)
+        indexes = [
+            models.Index(fields=['aluno'], condition=models.Q(ativo=True),
+                         name='treino_aluno_ativo_idx'),
+        ]
+
     @property
     def peso(self):
         return self.aluno.peso
@@ -51,3 +59,125 @@ class ExercicioTreino(BaseModel):
     descanso = models.PositiveIntegerField(
         verbose_name="Tempo de descanso (em segundos)",
         help_text="Informe o tempo de descanso em segundos", default=90)
+    # Posição na rotina, com intervalos entre as linhas (ver
+    # TreinoSerializer._sincronizar_exercicios): inserir ou mover um
+    # exercício não renumera os demais. Linhas antigas ficam com 0 e seguem
+    # a ordem do id
+    ordem = models.PositiveIntegerField("Ordem", default=0)
+
+    class Meta:
+        ordering = ['ordem', 'id']
+
+
+class SessaoTreino(BaseModel):
+    """
+    Sessão de treino realizada pelo aluno (o que ele fez de fato).
+
+    O Treino é a prescrição; a sessão registra uma execução, com as séries
+    feitas em SerieRegistrada. O app envia a sessão inteira em uma única
+    requisição ao terminar (ver SessaoTreinoViewSet).
+
+    id_cliente é gerado pelo app: reenviar a mesma sessão (ex.: depois de
+    uma falha de rede) devolve a sessão já gravada em vez de duplicá-la.
+    """
+    # Sem índice próprio: o índice (aluno, -inicio) já começa por aluno
+    aluno = models.ForeignKey(
+        Aluno, on_delete=models.CASCADE, related_name='sessoes', verbose_name='Aluno',
+        db_index=False)
+    # Rotina seguida na sessão, se houver (a sessão continua se a rotina for apagada)
+    treino = models.ForeignKey(
+        Treino, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='sessoes', verbose_name='Treino')
+    id_cliente = models.UUIDField("Identificador no app", null=True, blank=True)
+    inicio = models.DateTimeField("Início", default=timezone.now)
+    fim = models.DateTimeField("Fim", null=True, blank=True)
+    observacao = models.TextField("Observações", blank=True)
+
+    class Meta:
+        verbose_name = 'Sessão de treino'
+        verbose_name_plural = 'Sessões de treino'
+        indexes = [
+            # Histórico do aluno, da sessão mais recente para a mais antiga
+            models.Index(fields=['aluno', '-inicio'], name='sessao_aluno_inicio_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['aluno', 'id_cliente'], name='sessao_aluno_id_cliente_uniq'),
+        ]
+
+
+class SerieRegistrada(models.Model):
+    """
+    Série executada em uma sessão: exercício, repetições, carga e horário.
+
+    Tabela só de inserção (append-only) e com muitas linhas por aluno, por
+    isso é compacta de propósito:
+    - Não herda BaseModel (sem criacao/atualizacao/ativo); registrado_em é
+      o horário da série
+    - aluno é repetido da sessão para que as consultas por período usem só
+      o índice (aluno, exercicio, registrado_em, id), sem juntar com a sessão
+    - Não há edição nem exclusão pela API; correções entram como novas
+      sessões
+
+    O índice composto inclui repeticoes e carga (INCLUDE, no PostgreSQL):
+    a evolução de um exercício num período é lida só do índice. O id entra
+    depois de registrado_em porque é o desempate da paginação por cursor
+    (SeriesCursorPagination ordena por registrado_em, pk): assim a página
+    é lida em ordem do índice, sem buscar as linhas na tabela.
+    """
+    sessao = models.ForeignKey(
+        SessaoTreino, on_delete=models.CASCADE, related_name='series')
+    # Sem índice próprio: o índice composto começa por aluno
+    aluno = models.ForeignKey(Aluno, on_delete=models.CASCADE, db_index=False)
+    exercicio = models.ForeignKey(Exercicio, on_delete=models.PROTECT)
+    repeticoes = models.PositiveSmallIntegerField("Repetições")
+    carga = models.DecimalField(
+        "Carga", max_digits=5, decimal_places=2, null=True, blank=True)
+    registrado_em = models.DateTimeField("Registrada em")
+
+    class Meta:
+        verbose_name = 'Série registrada'
+        verbose_name_plural = 'Séries registradas'
+        indexes = [
+            models.Index(
+                fields=['aluno', 'exercicio', 'registrado_em', 'id'],
+                include=['repeticoes', 'carga'],
+                name='serie_aluno_ex_tempo_idx',
+            ),
+        ]
+
+
+class ResumoAluno(models.Model):
+    """
+    Resumo do aluno para a tela inicial do app (uma linha por aluno).
+
+    Tabela desnormalizada: junta o plano da matrícula ativa, a contagem de
+    treinos ativos (e o limite do plano) e o total de exercícios, para que
+    a tela inicial leia uma única linha em vez de consultar matrículas,
+    treinos e exercícios a cada abertura.
+
+    É mantida pelos signals de treinos/signals.py: cada alteração em
+    Matricula, Treino ou ExercicioTreino recalcula a linha do aluno depois
+    do commit (ver treinos/resumo.py). Pode ser reconstruída ou conferida
+    com o comando resumo_alunos.
+
+    atualizacao é a data da última alteração processada para o aluno, não
+    a da última reconstrução: o comando só regrava linhas divergentes.
+    """
+    aluno = models.OneToOneField(
+        Aluno, on_delete=models.CASCADE, primary_key=True,
+        related_name='resumo', verbose_name='Aluno')
+    # Plano da matrícula ativa; título e limite são copiados para a leitura
+    # não precisar do JOIN (alterações no plano são propagadas pelo signal)
+    plano = models.ForeignKey(
+        'planos.Plano', on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='+', verbose_name='Plano')
+    plano_titulo = models.CharField("Plano", max_length=255, blank=True)
+    limite_treinos = models.PositiveIntegerField("Limite de treinos", null=True, blank=True)
+    total_treinos = models.PositiveIntegerField("Treinos ativos", default=0)
+    total_exercicios = models.PositiveIntegerField("Exercícios", default=0)
+    atualizacao = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Resumo do aluno'
+        verbose_name_plural = 'Resumos dos alunos'
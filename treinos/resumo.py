@@ -0,0 +1,250 @@
+# =============================================================================
+# ARQUIVO: treinos/resumo.py
+# DESCRIÇÃO: Resumo do aluno (tela inicial) do projeto Dumbbell Fitness
+# FUNÇÃO: Calcula e mantém a tabela desnormalizada ResumoAluno
+# =============================================================================
+
+"""
+Manutenção do ResumoAluno.
+
+O resumo de um aluno é sempre recalculado por inteiro a partir das tabelas
+de origem (matrícula ativa, treinos ativos e exercícios), nunca somado aos
+poucos: uma linha recalculada não acumula erro, e recalcular um lote de
+alunos custa o mesmo número de consultas que recalcular um só.
+
+O que é incremental é a escolha das linhas: os signals (treinos/signals.py)
+só anotam quais alunos foram alterados (agendar_resumos) e, depois do
+commit da transação, apenas esses alunos são recalculados, de uma vez.
+Vários saves do mesmo aluno na mesma transação viram um único recálculo,
+e uma transação desfeita não grava nada.
+
+As exclusões em lote de core/exclusao.py (DELETE direto, sem post_delete)
+enviam pre_exclusao_lote, também tratado em treinos/signals.py. Outras
+escritas em lote que não disparam signals (bulk_create, update) chamam
+agendar_resumos diretamente.
+"""
+
+import logging
+# Fila de alunos alterados, separada por thread
+import threading
+from functools import partial
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from cadastros.models import Aluno, Matricula
+from planos.models import Plano
+
+from .models import ExercicioTreino, ResumoAluno, Treino
+
+logger = logging.getLogger(__name__)
+
+# Campos calculados a partir das tabelas de origem (conferidos pelo comando)
+CAMPOS_CALCULADOS = (
+    'plano_id', 'plano_titulo', 'limite_treinos', 'total_treinos', 'total_exercicios')
+
+# Campos regravados quando a linha já existe (upsert)
+_CAMPOS_UPSERT = [
+    'plano', 'plano_titulo', 'limite_treinos', 'total_treinos', 'total_exercicios',
+    'atualizacao',
+]
+
+# {banco: {'alunos': set(), 'treinos': set()}} pendentes da thread atual
+_pendentes = threading.local()
+
+
+def _fila(using):
+    """Alunos e treinos pendentes da thread atual no banco informado."""
+    filas = getattr(_pendentes, 'filas', None)
+    if filas is None:
+        filas = _pendentes.filas = {}
+    return filas.setdefault(using, {'alunos': set(), 'treinos': set()})
+
+
+def agendar_resumos(alunos=(), treinos=(), using=DEFAULT_DB_ALIAS):
+    """
+    Marca alunos (ou treinos, cujo aluno é resolvido depois) para terem o
+    resumo recalculado depois do commit da transação atual.
+
+    Fora de transação, o recálculo acontece na hora. Se a transação for
+    desfeita, os ids ficam na fila e são recalculados junto com o próximo
+    lote da thread, o que é inofensivo (o recálculo é idempotente).
+
+    Args:
+        alunos (iterable): IDs de alunos alterados
+        treinos (iterable): IDs de treinos alterados
+        using (str): Banco em que a escrita aconteceu
+    """
+    fila = _fila(using)
+    fila['alunos'].update(alunos)
+    fila['treinos'].update(treinos)
+    # robust: uma falha no recálculo vai para o log sem afetar a requisição
+    # (o comando resumo_alunos corrige a linha depois)
+    transaction.on_commit(partial(_processar_fila, using), using=using, robust=True)
+
+
+def _processar_fila(using):
+    """Recalcula os resumos pendentes (chamado no on_commit)."""
+    fila = _fila(using)
+    if not fila['alunos'] and not fila['treinos']:
+        # Outro callback da mesma transação já processou a fila
+        return
+    alunos, treinos = set(fila['alunos']), set(fila['treinos'])
+    fila['alunos'].clear()
+    fila['treinos'].clear()
+
+    if treinos:
+        alunos.update(
+            Treino.all_objects.using(using).filter(pk__in=treinos)
+            .values_list('aluno_id', flat=True))
+    recalcular_resumos(alunos, using=using)
+
+
+def calcular_resumos(alunos_ids, using=DEFAULT_DB_ALIAS):
+    """
+    Calcula os campos do resumo a partir das tabelas de origem, em duas
+    consultas: uma nos alunos (com subconsultas de matrícula, treinos e
+    exercícios) e outra nos planos encontrados.
+
+    A matrícula considerada é a mesma usada na criação de treinos: a
+    matrícula ativa mais antiga do aluno. Treinos e exercícios contam só
+    os ativos (exercícios apenas de treinos ativos).
+
+    Args:
+        alunos_ids (iterable): IDs dos alunos
+        using (str): Banco a consultar
+
+    Returns:
+        dict: {aluno_id: {campo: valor}} com os CAMPOS_CALCULADOS; alunos
+            inexistentes ficam de fora
+    """
+    matricula = Matricula.objects.filter(aluno=OuterRef('pk')).order_by('pk')
+    treinos = (
+        Treino.objects
+        .filter(aluno=OuterRef('pk'))
+        .order_by()
+        .values('aluno')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    exercicios = (
+        ExercicioTreino.objects
+        .filter(treino__aluno=OuterRef('pk'), treino__ativo=True)
+        .order_by()
+        .values('treino__aluno')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    linhas = list(
+        Aluno.all_objects.using(using)
+        .filter(pk__in=alunos_ids)
+        .annotate(
+            plano_matricula=Subquery(matricula.values('plano_id')[:1]),
+            treinos_ativos=Coalesce(Subquery(treinos), 0),
+            exercicios_ativos=Coalesce(Subquery(exercicios), 0),
+        )
+        .values('pk', 'plano_matricula', 'treinos_ativos', 'exercicios_ativos')
+    )
+
+    planos = {}
+    planos_ids = {linha['plano_matricula'] for linha in linhas} - {None}
+    if planos_ids:
+        for pk, titulo, limite in (
+                Plano.all_objects.using(using).filter(pk__in=planos_ids)
+                .values_list('pk', 'titulo', 'limite_treinos')):
+            planos[pk] = (titulo, limite)
+
+    resumos = {}
+    for linha in linhas:
+        titulo, limite = planos.get(linha['plano_matricula'], ('', None))
+        resumos[linha['pk']] = {
+            'plano_id': linha['plano_matricula'],
+            'plano_titulo': titulo,
+            'limite_treinos': limite,
+            'total_treinos': linha['treinos_ativos'],
+            'total_exercicios': linha['exercicios_ativos'],
+        }
+    return resumos
+
+
+def divergencias(resumos, atuais):
+    """
+    Compara os resumos calculados com as linhas gravadas.
+
+    Args:
+        resumos (dict): Saída de calcular_resumos
+        atuais (dict): {aluno_id: ResumoAluno} gravados
+
+    Returns:
+        dict: {aluno_id: [campos divergentes]}; ['ausente'] se não há linha
+    """
+    diferentes = {}
+    for aluno_id, campos in resumos.items():
+        atual = atuais.get(aluno_id)
+        if atual is None:
+            diferentes[aluno_id] = ['ausente']
+            continue
+        alterados = [campo for campo, valor in campos.items() if getattr(atual, campo) != valor]
+        if alterados:
+            diferentes[aluno_id] = alterados
+    return diferentes
+
+
+def recalcular_resumos(alunos_ids, using=DEFAULT_DB_ALIAS, somente_divergentes=False):
+    """
+    Recalcula e grava (upsert) o resumo dos alunos informados.
+
+    Tudo roda em uma transação no banco informado (o roteador de réplicas
+    manda as leituras dentro de transação para o principal, então o
+    cálculo nunca lê de uma réplica atrasada). As linhas são gravadas com
+    um único bulk_create com update_conflicts (INSERT ... ON CONFLICT).
+
+    Args:
+        alunos_ids (iterable): IDs dos alunos
+        using (str): Banco a usar
+        somente_divergentes (bool): Só regrava as linhas que mudaram, sem
+            renovar a atualizacao das demais (usado na reconstrução)
+
+    Returns:
+        list[ResumoAluno]: Linhas gravadas
+    """
+    alunos_ids = set(alunos_ids)
+    if not alunos_ids:
+        return []
+
+    with transaction.atomic(using=using):
+        resumos = calcular_resumos(alunos_ids, using=using)
+        if somente_divergentes:
+            atuais = ResumoAluno.objects.using(using).in_bulk(list(resumos))
+            resumos = {pk: resumos[pk] for pk in divergencias(resumos, atuais)}
+        if not resumos:
+            return []
+
+        gravados = ResumoAluno.objects.using(using).bulk_create(
+            [ResumoAluno(aluno_id=pk, **campos) for pk, campos in resumos.items()],
+            update_conflicts=True,
+            unique_fields=['aluno'],
+            update_fields=_CAMPOS_UPSERT,
+        )
+
+    logger.debug("Resumo recalculado para %s aluno(s)", len(gravados))
+    return gravados
+
+
+def propagar_plano(plano, using=DEFAULT_DB_ALIAS):
+    """
+    Copia o título e o limite do plano para os resumos que apontam para ele,
+    com um único UPDATE (sem recalcular os alunos).
+
+    Returns:
+        int: Linhas atualizadas
+    """
+    return (
+        ResumoAluno.objects.using(using)
+        .filter(plano=plano)
+        .exclude(plano_titulo=plano.titulo, limite_treinos=plano.limite_treinos)
+        .update(plano_titulo=plano.titulo, limite_treinos=plano.limite_treinos,
+                atualizacao=timezone.now())
+    )
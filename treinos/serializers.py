@@ -1,16 +1,68 @@
+import logging
+# Pareamento das linhas por exercício e maior subsequência crescente
+from bisect import bisect_left
+from collections import defaultdict, deque
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Treino, ExercicioTreino
+from .models import Treino, ExercicioTreino, SessaoTreino, SerieRegistrada, ResumoAluno
+from exercicios.catalogo import obter_catalogo
 from exercicios.models import Exercicio
 from cadastros.models import Matricula
 from core.choices import OBJETIVO_TREINO
 
+logger = logging.getLogger(__name__)
+
+
+def validar_exercicios_existem(ids):
+    """
+    Confere se todos os IDs de exercício informados existem.
+
+    Usa o snapshot do catálogo em memória (exercicios/catalogo.py), sem
+    consultar o banco. Só os IDs ausentes do snapshot, que podem ser
+    exercícios criados há instantes em outro worker, são conferidos no
+    banco, com uma única consulta.
+
+    Args:
+        ids (set): IDs de exercício
+
+    Raises:
+        ValidationError: Se algum exercício não existir
+    """
+    catalogo = obter_catalogo()
+    fora_do_catalogo = {pk for pk in ids if pk not in catalogo}
+    if not fora_do_catalogo:
+        return
+
+    inexistentes = exercicios_inexistentes(fora_do_catalogo)
+    if inexistentes:
+        raise serializers.ValidationError(
+            f"Exercício com ID {inexistentes[0]} não existe")
+
+
+def exercicios_inexistentes(ids):
+    """
+    Confere os IDs de exercício direto no banco (uma consulta).
+
+    Returns:
+        list: IDs que não existem no banco, em ordem crescente
+    """
+    encontrados = set(Exercicio.all_objects.filter(pk__in=ids).values_list('pk', flat=True))
+    return sorted(set(ids) - encontrados)
+
 
 class ExercicioTreinoSerializer(serializers.ModelSerializer):
     """
     Serializador para o modelo ExercicioTreino.
 
     Manipula os dados relacionados a cada exercício dentro de um treino.
+    O exercício é recebido apenas como ID; a resolução dos objetos é feita
+    em lote pelo TreinoSerializer, evitando uma consulta por exercício.
     """
+    exercicio = serializers.IntegerField(source='exercicio_id')
+
     class Meta:
         model = ExercicioTreino
         fields = (
@@ -31,6 +83,12 @@ class TreinoSerializer(serializers.ModelSerializer):
     """
     exercicios = ExercicioTreinoSerializer(many=True)
 
+    # Campos gravados ao sincronizar os exercícios de uma rotina
+    CAMPOS_EXERCICIO = ['exercicio', 'series', 'repeticoes', 'carga', 'descanso', 'ordem']
+
+    # Intervalo entre as posições (ExercicioTreino.ordem) de uma rotina nova
+    PASSO_ORDEM = 1024
+
     class Meta:
         model = Treino
         fields = (
@@ -53,241 +111,555 @@ class TreinoSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def _validar_exercicios(self, exercicios_data):
+        """
+        Confere se todos os exercícios informados existem
+        (ver validar_exercicios_existem).
+
+        Raises:
+            ValidationError: Se algum exercício não existir
+        """
+        validar_exercicios_existem({ex_data['exercicio_id'] for ex_data in exercicios_data})
+
+    def _criar_exercicios(self, treino, exercicios_data, ordens=None):
+        """
+        Insere os exercícios do treino com um único bulk_create.
+
+        Campos omitidos (ex.: descanso) ficam com o default do modelo.
+        Sem `ordens`, as posições vão de PASSO_ORDEM em PASSO_ORDEM.
+        """
+        if ordens is None:
+            ordens = [self.PASSO_ORDEM * (i + 1) for i in range(len(exercicios_data))]
+        novos = [
+            ExercicioTreino(treino=treino, ordem=ordem, **ex_data)
+            for ex_data, ordem in zip(exercicios_data, ordens)
+        ]
+        ExercicioTreino.objects.bulk_create(novos)
+
+    @staticmethod
+    def _parear_exercicios(existentes, exercicios_data):
+        """
+        Escolhe a linha existente que cada item recebido vai reaproveitar.
+
+        Primeiro por exercício: o k-ésimo item de um exercício fica com a
+        k-ésima linha existente do mesmo exercício, na ordem da rotina.
+        Os itens que sobrarem ficam, por posição, com as linhas que também
+        sobraram (ex.: um exercício trocado por outro).
+
+        Returns:
+            tuple: (lista com a linha ou None para cada item, linhas sem par)
+        """
+        por_exercicio = defaultdict(deque)
+        for atual in existentes:
+            por_exercicio[atual.exercicio_id].append(atual)
+
+        pares = []
+        for ex_data in exercicios_data:
+            fila = por_exercicio.get(ex_data['exercicio_id'])
+            pares.append(fila.popleft() if fila else None)
+
+        usadas = {atual.pk for atual in pares if atual is not None}
+        sobras = deque(atual for atual in existentes if atual.pk not in usadas)
+        pares = [
+            atual if atual is not None else (sobras.popleft() if sobras else None)
+            for atual in pares
+        ]
+        return pares, list(sobras)
+
+    @staticmethod
+    def _maior_subsequencia_crescente(valores):
+        """Índices de uma maior subsequência estritamente crescente (O(n log n))."""
+        finais, indices_finais = [], []
+        anteriores = [None] * len(valores)
+        for i, valor in enumerate(valores):
+            k = bisect_left(finais, valor)
+            if k == len(finais):
+                finais.append(valor)
+                indices_finais.append(i)
+            else:
+                finais[k] = valor
+                indices_finais[k] = i
+            anteriores[i] = indices_finais[k - 1] if k else None
+
+        indices = []
+        i = indices_finais[-1] if indices_finais else None
+        while i is not None:
+            indices.append(i)
+            i = anteriores[i]
+        return indices[::-1]
+
+    def _ordens(self, existentes, pares):
+        """
+        Posição (ordem) de cada item recebido, mexendo no menor número de
+        linhas.
+
+        As linhas pareadas que já estão na ordem relativa certa (a maior
+        subsequência crescente das posições atuais) mantêm a ordem; as
+        demais e os itens novos recebem valores entre os vizinhos. Se não
+        houver espaço entre eles (ex.: linhas antigas, todas com ordem 0),
+        a rotina inteira é renumerada.
+
+        Returns:
+            list[int]: ordem de cada item recebido
+        """
+        posicao = {atual.pk: i for i, atual in enumerate(existentes)}
+        pareados = [i for i, atual in enumerate(pares) if atual is not None]
+        mantidos = self._maior_subsequencia_crescente(
+            [posicao[pares[i].pk] for i in pareados])
+
+        ordens = [None] * len(pares)
+        for indice in mantidos:
+            i = pareados[indice]
+            ordens[i] = pares[i].ordem
+
+        i = 0
+        while i < len(ordens):
+            if ordens[i] is not None:
+                i += 1
+                continue
+            fim = i
+            while fim < len(ordens) and ordens[fim] is None:
+                fim += 1
+            vagas = fim - i
+            antes = ordens[i - 1] if i else -1
+            if fim < len(ordens):
+                depois = ordens[fim]
+                if depois - antes <= vagas:
+                    break
+                for t in range(vagas):
+                    ordens[i + t] = antes + (depois - antes) * (t + 1) // (vagas + 1)
+            else:
+                for t in range(vagas):
+                    ordens[i + t] = max(antes, 0) + self.PASSO_ORDEM * (t + 1)
+            i = fim
+
+        if None in ordens or any(a >= b for a, b in zip(ordens, ordens[1:])):
+            return [self.PASSO_ORDEM * (i + 1) for i in range(len(pares))]
+        return ordens
+
+    def _sincronizar_exercicios(self, treino, exercicios_data):
+        """
+        Aplica a lista de exercícios recebida sobre a rotina existente.
+
+        Cada item reaproveita uma linha existente do mesmo exercício (ver
+        _parear_exercicios) e a posição na rotina fica em
+        ExercicioTreino.ordem, com intervalos (ver _ordens).
+        - Linhas com algum campo ou posição diferente são gravadas com um
+          bulk_update
+        - Itens sem linha para reaproveitar são inseridos com um bulk_create
+        - Linhas existentes que sobraram são removidas com um único DELETE
+
+        Assim, editar uma série, inserir ou remover um exercício em
+        qualquer ponto de uma rotina longa grava só as linhas envolvidas e
+        preserva as chaves primárias das demais.
+
+        Returns:
+            tuple: (alteradas, criadas, removidas)
+        """
+        self._validar_exercicios(exercicios_data)
+        existentes = list(treino.exercicios.all())
+        pares, sobras = self._parear_exercicios(existentes, exercicios_data)
+        ordens = self._ordens(existentes, pares)
+
+        alteradas = []
+        novos, ordens_novos = [], []
+        agora = timezone.now()
+        for atual, ex_data, ordem in zip(pares, exercicios_data, ordens):
+            if atual is None:
+                novos.append(ex_data)
+                ordens_novos.append(ordem)
+                continue
+            valores = {
+                'exercicio_id': ex_data['exercicio_id'],
+                'series': ex_data['series'],
+                'repeticoes': ex_data['repeticoes'],
+                # Campos omitidos voltam para o default do modelo, como no PUT
+                'carga': ex_data.get('carga', self._default('carga')),
+                'descanso': ex_data.get('descanso', self._default('descanso')),
+                'ordem': ordem,
+            }
+            if any(getattr(atual, campo) != valor for campo, valor in valores.items()):
+                for campo, valor in valores.items():
+                    setattr(atual, campo, valor)
+                # bulk_update não dispara o auto_now, então atualiza manualmente
+                atual.atualizacao = agora
+                alteradas.append(atual)
+
+        if alteradas:
+            ExercicioTreino.all_objects.bulk_update(
+                alteradas, self.CAMPOS_EXERCICIO + ['atualizacao'])
+
+        if novos:
+            self._criar_exercicios(treino, novos, ordens_novos)
+
+        if sobras:
+            ExercicioTreino.all_objects.filter(pk__in=[atual.pk for atual in sobras]).delete()
+
+        logger.debug(
+            "Exercícios do treino %s sincronizados: %s alterados, %s criados, %s removidos",
+            treino.pk, len(alteradas), len(novos), len(sobras))
+        return len(alteradas), len(novos), len(sobras)
+
+    @staticmethod
+    def _default(campo):
+        """Retorna o valor padrão de um campo do modelo ExercicioTreino."""
+        return ExercicioTreino._meta.get_field(campo).get_default()
+
+    def _matricula_para_novo_treino(self, aluno):
+        """
+        Busca e trava a matrícula ativa do aluno, já com o plano.
+
+        A linha da matrícula fica travada (SELECT ... FOR UPDATE OF) até o
+        fim da transação, então criações simultâneas do mesmo aluno passam
+        pela verificação do limite uma de cada vez. Só a matrícula é
+        travada, não o plano, que é compartilhado por vários alunos.
+
+        A contagem de treinos NÃO vai nesta consulta: em READ COMMITTED, uma
+        subconsulta no mesmo SELECT usaria o snapshot de antes da espera
+        pelo lock e não veria o treino criado por quem segurava a linha.
+        Ela é feita depois, por _treinos_ativos, já com o lock obtido.
+
+        Returns:
+            Matricula | None: Matrícula ativa, ou None se não houver
+        """
+        return (
+            Matricula.objects
+            .select_related('plano')
+            .select_for_update(of=('self',))
+            .filter(aluno=aluno)
+            .order_by('pk')
+            .first()
+        )
+
+    @staticmethod
+    def _treinos_ativos(aluno):
+        """
+        Conta os treinos ativos do aluno.
+
+        Chamado depois de travar a matrícula, na mesma transação: a consulta
+        começa depois do lock, então enxerga os treinos confirmados por uma
+        criação simultânea que segurava a linha.
+        """
+        return Treino.objects.filter(aluno=aluno).count()
+
     def create(self, validated_data):
         """
         Cria um novo treino junto com seus exercícios associados.
 
         Valida se o aluno tem matrícula ativa e plano válido,
         e respeita o limite de treinos permitidos pelo plano.
+
+        Tudo roda em uma única transação: os exercícios são validados pelo
+        snapshot do catálogo em memória e inseridos com um bulk_create, então
+        o número de consultas não cresce com o tamanho da rotina. Se um
+        exercício for excluído entre a validação e o commit, a violação de
+        FK é conferida no banco e respondida como erro de validação.
         """
-        print(f"🔄 Criando novo treino...")
-        print(f"📋 Dados recebidos: {validated_data}")
-        print(f"📋 Tipo dos dados: {type(validated_data)}")
-        print(f"📋 Chaves disponíveis: {list(validated_data.keys())}")
-        
-        # Verificar especificamente o campo nome
-        if 'nome' in validated_data:
-            print(f"📝 Nome recebido: '{validated_data['nome']}'")
-            print(f"📝 Tipo do nome: {type(validated_data['nome'])}")
-            print(f"📝 Tamanho do nome: {len(validated_data['nome'])}")
-        else:
-            print("❌ Campo 'nome' NÃO encontrado nos dados")
-        
+        # Verificar se exercicios está presente
+        if 'exercicios' not in validated_data:
+            raise serializers.ValidationError("Campo 'exercicios' é obrigatório")
+
+        exercicios_data = validated_data.pop('exercicios')
+
+        # Verificar se aluno está presente
+        if 'aluno' not in validated_data:
+            raise serializers.ValidationError("Campo 'aluno' é obrigatório")
+
+        aluno = validated_data.get('aluno')
+
+        # Resolve todos os exercícios de uma vez (uma consulta)
+        self._validar_exercicios(exercicios_data)
+
         try:
-            # Verificar se exercicios está presente
-            if 'exercicios' not in validated_data:
-                print("❌ Campo 'exercicios' não encontrado nos dados")
-                raise serializers.ValidationError("Campo 'exercicios' é obrigatório")
-            
-            exercicios_data = validated_data.pop('exercicios')
-            print(f"📋 Dados dos exercícios: {exercicios_data}")
-            print(f"📋 Tipo dos exercícios: {type(exercicios_data)}")
-            print(f"📋 Quantidade de exercícios: {len(exercicios_data) if exercicios_data else 0}")
-            
-            # Verificar se aluno está presente
-            if 'aluno' not in validated_data:
-                print("❌ Campo 'aluno' não encontrado nos dados")
-                raise serializers.ValidationError("Campo 'aluno' é obrigatório")
-            
-            aluno = validated_data.get('aluno')
-            print(f"👤 Aluno: {aluno}")
-            print(f"👤 Tipo do aluno: {type(aluno)}")
-
-            # Verificar se o aluno existe
-            from cadastros.models import Aluno
-            try:
-                # Se o DRF já converteu para objeto, usar diretamente
-                if isinstance(aluno, Aluno):
-                    aluno_obj = aluno
-                    aluno_id = aluno.id
-                else:
-                    # Se ainda é ID, buscar o objeto
-                    aluno_obj = Aluno.objects.get(id=aluno)
-                    aluno_id = aluno
-                
-                print(f"✅ Aluno encontrado: {aluno_obj.nome} (ID: {aluno_id})")
-            except Aluno.DoesNotExist:
-                print(f"❌ Aluno com ID {aluno} não existe")
-                raise serializers.ValidationError(f"Aluno com ID {aluno} não existe")
-
-            # Verifica se o aluno possui matrícula ativa
-            matricula = Matricula.objects.filter(aluno=aluno_id, ativo=True).first()
-            print(f"📋 Matrícula encontrada: {matricula}")
-            
-            if not matricula:
-                print("❌ Aluno não possui matrícula ativa")
-                raise serializers.ValidationError(
-                    "Aluno não possui matrícula ativa.")
-
-            # Verifica se a matrícula possui um plano válido
-            if not matricula.plano or not matricula.plano.titulo:
-                print("❌ Matrícula não tem plano válido")
-                raise serializers.ValidationError(
-                    "Matrícula não tem plano válido.")
-
-            plano_titulo = matricula.plano.titulo.lower()
-            print(f"📋 Plano: {plano_titulo}")
-
-            # Define limites de treinos por plano
-            limites = {
-                'starter': 4,
-                'dumbbell': 9999,  # ilimitado
-            }
-            # padrão bloqueia caso plano desconhecido
-            limite = limites.get(plano_titulo, 0)
-            print(f"📋 Limite de treinos: {limite}")
+            with transaction.atomic():
+                # Matrícula ativa + plano, com lock (a contagem vem depois do lock)
+                matricula = self._matricula_para_novo_treino(aluno)
 
-            # Conta os treinos existentes do aluno
-            treinos_count = Treino.objects.filter(aluno=aluno_id, ativo=True).count()
-            print(f"📋 Treinos existentes: {treinos_count}")
-            
-            if treinos_count >= limite:
-                print(f"❌ Limite de treinos atingido: {treinos_count}/{limite}")
-                raise serializers.ValidationError(
-                    f"Você atingiu o limite de {limite} treinos para o seu plano '{plano_titulo}'."
-                )
-
-            # Cria o treino
-            print(f"✅ Criando treino com dados: {validated_data}")
-            try:
+                if not matricula:
+                    logger.info("Aluno %s sem matrícula ativa tentou criar treino", aluno.pk)
+                    raise serializers.ValidationError(
+                        "Aluno não possui matrícula ativa.")
+
+                # Verifica se a matrícula possui um plano válido
+                if not matricula.plano or not matricula.plano.titulo:
+                    logger.warning("Matrícula %s sem plano válido", matricula.pk)
+                    raise serializers.ValidationError(
+                        "Matrícula não tem plano válido.")
+
+                plano_titulo = matricula.plano.titulo.lower()
+
+                # Limite vem do plano; None significa ilimitado
+                limite = matricula.plano.limite_treinos
+                treinos_count = None if limite is None else self._treinos_ativos(aluno)
+
+                if limite is not None and treinos_count >= limite:
+                    logger.info("Aluno %s atingiu o limite de treinos: %s/%s",
+                                aluno.pk, treinos_count, limite)
+                    raise serializers.ValidationError(
+                        f"Você atingiu o limite de {limite} treinos para o seu plano '{plano_titulo}'."
+                    )
+
+                # Cria o treino e, em seguida, todos os exercícios em lote
                 treino = Treino.objects.create(**validated_data)
-                print(f"✅ Treino criado com ID: {treino.id}")
-                print(f"✅ Nome do treino salvo: '{treino.nome}'")
-                print(f"✅ Verificando se o nome foi salvo corretamente...")
-                
-                # Recarregar o treino do banco para confirmar
-                treino_refresh = Treino.objects.get(id=treino.id)
-                print(f"✅ Nome após recarregar: '{treino_refresh.nome}'")
-                
-            except Exception as treino_error:
-                print(f"❌ Erro ao criar treino: {treino_error}")
-                print(f"❌ Tipo do erro: {type(treino_error)}")
-                import traceback
-                print(f"❌ Traceback do treino: {traceback.format_exc()}")
+                self._criar_exercicios(treino, exercicios_data)
+        except IntegrityError:
+            # Um exercício validado pelo snapshot pode ter sido excluído
+            # antes do commit: a FK recusa a linha e o erro vira um 400
+            inexistentes = exercicios_inexistentes(
+                {ex_data['exercicio_id'] for ex_data in exercicios_data})
+            if not inexistentes:
                 raise
+            logger.info("Exercício %s excluído durante a criação de treino do aluno %s",
+                        inexistentes[0], aluno.pk)
+            raise serializers.ValidationError(
+                f"Exercício com ID {inexistentes[0]} não existe")
 
-            # Cria os exercícios relacionados ao treino
-            print(f"➕ Criando {len(exercicios_data)} exercícios...")
-            for i, ex_data in enumerate(exercicios_data):
-                print(f"📝 Criando exercício {i+1}: {ex_data}")
-                try:
-                    # Verificar se o exercício existe
-                    exercicio_id = ex_data.get('exercicio')
-                    if not Exercicio.objects.filter(id=exercicio_id).exists():
-                        print(f"❌ Exercício com ID {exercicio_id} não existe")
-                        raise serializers.ValidationError(f"Exercício com ID {exercicio_id} não existe")
-                    
-                    # Buscar o objeto Exercicio
-                    exercicio_obj = Exercicio.objects.get(id=exercicio_id)
-                    
-                    # Criar ExercicioTreino com o objeto Exercicio
-                    ExercicioTreino.objects.create(
-                        treino=treino,
-                        exercicio=exercicio_obj,
-                        series=ex_data.get('series'),
-                        repeticoes=ex_data.get('repeticoes'),
-                        carga=ex_data.get('carga'),
-                        descanso=ex_data.get('descanso')
-                    )
-                    print(f"✅ Exercício {i+1} criado com sucesso")
-                except Exception as ex_error:
-                    print(f"❌ Erro ao criar exercício {i+1}: {ex_error}")
-                    print(f"❌ Tipo do erro: {type(ex_error)}")
-                    import traceback
-                    print(f"❌ Traceback do exercício: {traceback.format_exc()}")
-                    raise serializers.ValidationError(f"Erro ao criar exercício: {str(ex_error)}")
-
-            print(f"🎉 Treino criado com sucesso! ID: {treino.id}")
-            return treino
-            
-        except Exception as e:
-            print(f"❌ Erro durante criação do treino: {e}")
-            print(f"❌ Tipo do erro: {type(e)}")
-            import traceback
-            print(f"❌ Traceback completo: {traceback.format_exc()}")
-            raise
+        logger.info("Treino %s criado para o aluno %s com %s exercícios",
+                    treino.pk, aluno.pk, len(exercicios_data))
+        return treino
 
     def update(self, instance, validated_data):
         """
         Atualiza um treino existente, incluindo os exercícios associados.
 
-        Se forem fornecidos novos exercícios, os antigos são removidos e substituídos.
+        Se forem fornecidos exercícios, a lista recebida é comparada com a
+        atual (ver _sincronizar_exercicios) e apenas o que mudou é gravado.
         """
-        print(f"🔄 Atualizando treino ID: {instance.id}")
-        print(f"📋 Dados recebidos: {validated_data}")
-        print(f"📋 Tipo dos dados: {type(validated_data)}")
-        print(f"📋 Chaves disponíveis: {list(validated_data.keys())}")
-        
-        # Debug: verificar cada campo recebido
-        for key, value in validated_data.items():
-            print(f"🔍 Campo '{key}': '{value}' (tipo: {type(value)})")
-        
+        logger.debug("Atualizando treino %s (campos: %s)", instance.pk, list(validated_data))
+
         try:
             # Validar campo nome
             if 'nome' in validated_data:
                 nome = validated_data['nome']
-                print(f"📝 Nome recebido: '{nome}' (tipo: {type(nome)})")
                 if not nome or nome.strip() == '':
-                    print("❌ Nome está vazio")
                     raise serializers.ValidationError("Nome do treino não pode estar vazio")
-                print(f"✅ Nome válido: {nome}")
-            
+
             exercicios_data = validated_data.pop('exercicios', None)
-            print(f"📋 Dados dos exercícios: {exercicios_data}")
 
             # Atualiza os campos do treino
             for attr, value in validated_data.items():
-                print(f"📝 Atualizando campo {attr}: {value}")
                 try:
                     setattr(instance, attr, value)
-                    print(f"✅ Campo {attr} atualizado com sucesso")
                 except Exception as field_error:
-                    print(f"❌ Erro ao atualizar campo {attr}: {field_error}")
                     raise serializers.ValidationError(f"Erro ao atualizar campo {attr}: {str(field_error)}")
             
-            print(f"💾 Salvando treino...")
-            instance.save()
-            print(f"✅ Treino atualizado: {instance}")
-            print(f"✅ Nome final do treino: '{instance.nome}'")
-
-            # Atualiza os exercícios se fornecidos
-            if exercicios_data is not None:
-                print(f"🗑️ Removendo exercícios antigos...")
-                instance.exercicios.all().delete()
-                print(f"➕ Criando novos exercícios...")
-                for ex_data in exercicios_data:
-                    print(f"📝 Criando exercício: {ex_data}")
-                    try:
-                        # Validar se o exercício existe
-                        exercicio_id = ex_data.get('exercicio')
-                        
-                        # Se o DRF já converteu para objeto, usar o ID
-                        if hasattr(exercicio_id, 'id'):
-                            exercicio_id = exercicio_id.id
-                        
-                        print(f"🔍 Verificando exercício ID: {exercicio_id}")
-                        if not Exercicio.objects.filter(id=exercicio_id).exists():
-                            raise serializers.ValidationError(f"Exercício com ID {exercicio_id} não existe")
-                        
-                        # Preparar dados do exercício
-                        exercicio_data = {
-                            'exercicio': Exercicio.objects.get(id=exercicio_id),
-                            'series': ex_data.get('series'),
-                            'repeticoes': ex_data.get('repeticoes'),
-                            'carga': ex_data.get('carga'),
-                            'descanso': ex_data.get('descanso')
-                        }
-                        
-                        ExercicioTreino.objects.create(treino=instance, **exercicio_data)
-                        print(f"✅ Exercício criado com sucesso")
-                    except Exception as ex_error:
-                        print(f"❌ Erro ao criar exercício: {ex_error}")
-                        raise serializers.ValidationError(f"Erro ao criar exercício: {str(ex_error)}")
+            # Salva o treino e sincroniza os exercícios na mesma transação
+            with transaction.atomic():
+                instance.save()
+
+                # Atualiza os exercícios se fornecidos
+                if exercicios_data is not None:
+                    self._sincronizar_exercicios(instance, exercicios_data)
 
+            logger.info("Treino %s atualizado", instance.pk)
             return instance
         except Exception as e:
-            print(f"❌ Erro durante atualização: {e}")
-            print(f"❌ Tipo do erro: {type(e)}")
-            import traceback
-            print(f"❌ Traceback: {traceback.format_exc()}")
+            # exc_info: o traceback só é formatado se o registro for emitido
+            logger.warning("Erro ao atualizar treino %s", instance.pk, exc_info=True)
             raise serializers.ValidationError(f"Erro ao atualizar treino: {str(e)}")
+
+
+class SerieRegistradaSerializer(serializers.ModelSerializer):
+    """
+    Serializador de uma série executada (SerieRegistrada).
+
+    O exercício é recebido apenas como ID, validado em lote pelo
+    SessaoTreinoSerializer. Sem registrado_em, a série recebe o início
+    da sessão.
+    """
+    exercicio = serializers.IntegerField(source='exercicio_id')
+    registrado_em = serializers.DateTimeField(required=False)
+
+    class Meta:
+        model = SerieRegistrada
+        fields = (
+            'exercicio',
+            'repeticoes',
+            'carga',
+            'registrado_em',
+        )
+
+
+class SessaoTreinoSerializer(serializers.ModelSerializer):
+    """
+    Serializador de uma sessão de treino com todas as suas séries.
+
+    Usado na ingestão: o app envia a sessão inteira em uma requisição e ela
+    é gravada com um INSERT da sessão e um bulk_create das séries, na mesma
+    transação. Com id_cliente, reenviar a mesma sessão devolve a já gravada
+    (o atributo reenviada fica True).
+    """
+    series = SerieRegistradaSerializer(many=True)
+    treino = serializers.PrimaryKeyRelatedField(
+        queryset=Treino.all_objects.all(), required=False, allow_null=True)
+
+    class Meta:
+        model = SessaoTreino
+        fields = (
+            'id',
+            'id_cliente',
+            'aluno',
+            'treino',
+            'inicio',
+            'fim',
+            'observacao',
+            'series',
+        )
+        read_only_fields = ('aluno',)
+        # A unicidade de (aluno, id_cliente) é tratada no create (reenvio)
+        validators = []
+
+    reenviada = False
+
+    def validate_series(self, value):
+        if not value:
+            raise serializers.ValidationError("Informe ao menos uma série.")
+        limite = getattr(settings, 'SESSAO_MAX_SERIES', 500)
+        if len(value) > limite:
+            raise serializers.ValidationError(
+                f"Uma sessão pode ter no máximo {limite} séries.")
+        return value
+
+    def validate_treino(self, value):
+        aluno = getattr(self.context.get('request'), 'aluno', None)
+        if value is not None and (not aluno or value.aluno_id != aluno.pk):
+            raise serializers.ValidationError("Treino não pertence ao aluno.")
+        return value
+
+    def validate(self, attrs):
+        fim = attrs.get('fim')
+        if fim is not None and fim < attrs.get('inicio', fim):
+            raise serializers.ValidationError("O fim da sessão não pode ser antes do início.")
+        return attrs
+
+    def _sessao_existente(self, aluno, id_cliente):
+        """Sessão já gravada com o mesmo id_cliente, ou None."""
+        if id_cliente is None:
+            return None
+        return SessaoTreino.all_objects.filter(aluno=aluno, id_cliente=id_cliente).first()
+
+    def create(self, validated_data):
+        """
+        Grava a sessão e todas as séries em uma transação.
+
+        As séries entram com um único bulk_create (sem save() nem signals
+        por linha). Um reenvio com o mesmo id_cliente, inclusive dois
+        envios simultâneos, não grava nada e devolve a sessão existente.
+        """
+        series_data = validated_data.pop('series')
+        aluno = validated_data['aluno']
+        id_cliente = validated_data.get('id_cliente')
+
+        validar_exercicios_existem({serie['exercicio_id'] for serie in series_data})
+
+        existente = self._sessao_existente(aluno, id_cliente)
+        if existente is not None:
+            self.reenviada = True
+            return existente
+
+        try:
+            with transaction.atomic():
+                sessao = SessaoTreino.objects.create(**validated_data)
+                SerieRegistrada.objects.bulk_create([
+                    SerieRegistrada(
+                        sessao=sessao,
+                        aluno=aluno,
+                        exercicio_id=serie['exercicio_id'],
+                        repeticoes=serie['repeticoes'],
+                        carga=serie.get('carga'),
+                        registrado_em=serie.get('registrado_em') or sessao.inicio,
+                    )
+                    for serie in series_data
+                ])
+        except IntegrityError:
+            # Outro envio da mesma sessão gravou primeiro
+            existente = self._sessao_existente(aluno, id_cliente)
+            if existente is None:
+                raise
+            self.reenviada = True
+            return existente
+
+        logger.info("Sessão %s registrada para o aluno %s com %s séries",
+                    sessao.pk, aluno.pk, len(series_data))
+        return sessao
+
+
+class SessaoTreinoResumoSerializer(serializers.ModelSerializer):
+    """
+    Serializador da listagem de sessões: dados da sessão e total de séries
+    (anotado no queryset), sem as séries em si.
+    """
+    total_series = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = SessaoTreino
+        fields = (
+            'id',
+            'id_cliente',
+            'treino',
+            'inicio',
+            'fim',
+            'observacao',
+            'total_series',
+        )
+
+
+class SerieHistoricoSerializer(serializers.Serializer):
+    """
+    Serializador das séries na consulta por período.
+
+    Trabalha sobre dicionários com apenas as colunas do índice
+    (registrado_em, repeticoes, carga), sem instanciar o modelo.
+    """
+    registrado_em = serializers.DateTimeField()
+    repeticoes = serializers.IntegerField()
+    carga = serializers.DecimalField(max_digits=5, decimal_places=2, allow_null=True)
+
+
+class VolumeSemanalSerializer(serializers.Serializer):
+    """
+    Uma linha da análise de volume (ver treinos/analise.py): volume de um
+    grupo muscular numa semana e a variação sobre a semana anterior.
+    """
+    grupo_muscular = serializers.CharField()
+    semana = serializers.DateField()
+    series = serializers.IntegerField()
+    repeticoes = serializers.IntegerField()
+    volume = serializers.DecimalField(max_digits=14, decimal_places=2)
+    variacao = serializers.DecimalField(max_digits=14, decimal_places=2, allow_null=True)
+
+
+class VolumeAlunoSerializer(serializers.Serializer):
+    """
+    Volume semanal de um aluno, agrupado por grupo muscular e semana.
+    """
+    aluno = serializers.IntegerField()
+    nome = serializers.CharField()
+    semanas = VolumeSemanalSerializer(many=True)
+
+
+class ResumoAlunoSerializer(serializers.ModelSerializer):
+    """
+    Serializador do resumo da tela inicial (uma linha de ResumoAluno).
+
+    treinos_disponiveis é quanto falta para o limite do plano; None quando
+    o plano é ilimitado ou o aluno não tem matrícula ativa.
+    """
+    treinos_disponiveis = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ResumoAluno
+        fields = (
+            'plano',
+            'plano_titulo',
+            'limite_treinos',
+            'total_treinos',
+            'treinos_disponiveis',
+            'total_exercicios',
+            'atualizacao',
+        )
+
+    def get_treinos_disponiveis(self, obj):
+        if obj.plano_id is None or obj.limite_treinos is None:
+            return None
+        return max(obj.limite_treinos - obj.total_treinos, 0)
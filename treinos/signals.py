@@ -0,0 +1,72 @@
+# Signals de modelo do Django
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Exclusões em lote (DELETE direto, sem post_delete por linha)
+from core.exclusao import pre_exclusao_lote
+
+# Modelos que alimentam o resumo do aluno
+from cadastros.models import Matricula
+from planos.models import Plano
+from .models import ExercicioTreino, Treino
+
+# Manutenção da tabela ResumoAluno
+from .resumo import agendar_resumos, propagar_plano
+
+
+@receiver(post_save, sender=Matricula)
+@receiver(post_delete, sender=Matricula)
+@receiver(post_save, sender=Treino)
+@receiver(post_delete, sender=Treino)
+def agendar_resumo_do_aluno(sender, instance, using, raw=False, **kwargs):
+    """
+    Agenda o recálculo do resumo do aluno a cada alteração em uma
+    matrícula ou treino (inclusive soft delete, que é um save).
+    """
+    if raw:
+        return
+    agendar_resumos(alunos=[instance.aluno_id], using=using)
+
+
+@receiver(post_save, sender=ExercicioTreino)
+@receiver(post_delete, sender=ExercicioTreino)
+def agendar_resumo_do_treino(sender, instance, using, raw=False, **kwargs):
+    """
+    Agenda o recálculo do resumo do dono do treino a cada alteração em um
+    exercício do treino. O aluno é resolvido no commit, uma consulta para
+    todos os treinos alterados (evita buscar o treino a cada linha).
+    """
+    if raw:
+        return
+    agendar_resumos(treinos=[instance.treino_id], using=using)
+
+
+@receiver(pre_exclusao_lote, sender=Matricula)
+def agendar_resumos_do_lote_de_matriculas(sender, ids, using, **kwargs):
+    """
+    Agenda o resumo dos alunos de um lote de matrículas apagado por
+    excluir_em_lotes (que não dispara o post_delete acima).
+    """
+    agendar_resumos(alunos=Matricula.all_objects.using(using).filter(pk__in=ids)
+                    .values_list('aluno_id', flat=True).distinct(), using=using)
+
+
+@receiver(pre_exclusao_lote, sender=ExercicioTreino)
+def agendar_resumos_do_lote_de_exercicios(sender, ids, using, **kwargs):
+    """
+    Agenda o resumo dos donos dos treinos de um lote de ExercicioTreino
+    apagado por excluir_em_lotes.
+    """
+    agendar_resumos(treinos=ExercicioTreino.all_objects.using(using).filter(pk__in=ids)
+                    .values_list('treino_id', flat=True).distinct(), using=using)
+
+
+@receiver(post_save, sender=Plano)
+def propagar_plano_nos_resumos(sender, instance, created, using, raw=False, **kwargs):
+    """
+    Copia título e limite do plano alterado para os resumos dos alunos
+    matriculados nele.
+    """
+    if raw or created:
+        return
+    propagar_plano(instance, using=using)
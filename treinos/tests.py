@@ -0,0 +1,204 @@
+import datetime
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APITestCase
+
+from cadastros.models import Aluno, Matricula
+from core.models import EnderecoModel
+from exercicios import catalogo
+from exercicios.models import Exercicio
+from planos.models import Plano
+from .models import ExercicioTreino, Treino
+from .serializers import TreinoSerializer
+
+
+def criar_aluno(username='aluno', limite_treinos=None):
+    """Cria usuário, endereço, aluno e matrícula ativa em um plano."""
+    user = User.objects.create_user(username=username, password='senha-teste')
+    endereco = EnderecoModel.objects.create(
+        cep='12345-678', rua='Rua A', numero='1', bairro='Centro', cidade='Cidade', estado='SP')
+    aluno = Aluno.objects.create(
+        user=user, nome='Aluno Teste', cpf='123.456.789-09', email=f'{username}@teste.com',
+        sexo='M', data_nascimento=datetime.date(1990, 1, 1), endereco=endereco,
+        peso=80, altura='1.80')
+    plano = Plano.objects.create(titulo='Dumbbell', preco=100, limite_treinos=limite_treinos)
+    Matricula.objects.create(aluno=aluno, plano=plano, forma_pagamento='P')
+    return user, aluno
+
+
+def criar_exercicios(quantidade):
+    return [
+        Exercicio.objects.create(nome=f'Exercício {i}', descricao='Descrição', categoria='Musculacao')
+        for i in range(quantidade)
+    ]
+
+
+class CatalogoLimpoMixin:
+    """
+    Começa cada teste com o snapshot do catálogo montado a partir dos
+    exercícios do próprio teste (o snapshot é global ao processo).
+    """
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.multiple(catalogo, _snapshot=None, _verificado_em=float('-inf'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        catalogo.obter_catalogo()
+
+
+class TreinoSerializerCreateTests(CatalogoLimpoMixin, TestCase):
+    """O número de consultas da criação não depende do tamanho da rotina."""
+
+    # SAVEPOINT, matrícula (FOR UPDATE), INSERT do treino,
+    # bulk_create dos exercícios e RELEASE SAVEPOINT
+    CONSULTAS_CRIACAO = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.aluno = criar_aluno()
+        cls.exercicios = criar_exercicios(20)
+
+    def criar_treino(self, quantidade, consultas=CONSULTAS_CRIACAO):
+        serializer = TreinoSerializer(data={
+            'nome': f'Treino com {quantidade}',
+            'objetivo': 'Hipertrofia',
+            'exercicios': [
+                {'exercicio': exercicio.pk, 'series': 3, 'repeticoes': 10}
+                for exercicio in self.exercicios[:quantidade]
+            ],
+        })
+        serializer.is_valid(raise_exception=True)
+        with self.assertNumQueries(consultas):
+            return serializer.save(aluno=self.aluno)
+
+    def test_consultas_constantes(self):
+        for quantidade in (1, 5, 20):
+            with self.subTest(exercicios=quantidade):
+                treino = self.criar_treino(quantidade)
+                self.assertEqual(
+                    ExercicioTreino.objects.filter(treino=treino).count(), quantidade)
+
+    def test_consultas_com_limite_do_plano(self):
+        # Com limite, a contagem de treinos ativos é uma consulta a mais
+        Plano.objects.update(limite_treinos=10)
+        for quantidade in (1, 20):
+            with self.subTest(exercicios=quantidade):
+                self.criar_treino(quantidade, consultas=self.CONSULTAS_CRIACAO + 1)
+
+
+class TreinoViewSetConsultasTests(APITestCase):
+    """Listagem e detalhe custam o mesmo número de consultas para 1 ou N treinos."""
+
+    # Impressão digital da ETag, página de treinos (com o aluno) e prefetch
+    # dos exercícios (com o exercício)
+    CONSULTAS_LISTAGEM = 3
+    # Impressão digital da ETag, treino (com o aluno) e prefetch dos exercícios
+    CONSULTAS_DETALHE = 3
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.aluno = criar_aluno()
+        cls.exercicios = criar_exercicios(4)
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def criar_treinos(self, quantidade):
+        treinos = Treino.objects.bulk_create(
+            Treino(aluno=self.aluno, nome=f'Treino {i}', objetivo='Hipertrofia')
+            for i in range(quantidade)
+        )
+        ExercicioTreino.objects.bulk_create(
+            ExercicioTreino(treino=treino, exercicio=exercicio, series=3, repeticoes=10)
+            for treino in treinos
+            for exercicio in self.exercicios
+        )
+        return treinos
+
+    def assertConsultasListagem(self, quantidade):
+        with self.assertNumQueries(self.CONSULTAS_LISTAGEM):
+            resposta = self.client.get('/api/v1/treinos/')
+        self.assertEqual(resposta.status_code, 200)
+        self.assertEqual(len(resposta.data['results']), quantidade)
+
+    def assertConsultasDetalhe(self, treino):
+        with self.assertNumQueries(self.CONSULTAS_DETALHE):
+            resposta = self.client.get(f'/api/v1/treinos/{treino.pk}/')
+        self.assertEqual(resposta.status_code, 200)
+        self.assertEqual(len(resposta.data['exercicios']), len(self.exercicios))
+
+    def test_listagem_com_um_treino(self):
+        self.criar_treinos(1)
+        self.assertConsultasListagem(1)
+
+    def test_listagem_com_varios_treinos(self):
+        self.criar_treinos(10)
+        self.assertConsultasListagem(10)
+
+    def test_detalhe_com_um_treino(self):
+        treino, = self.criar_treinos(1)
+        self.assertConsultasDetalhe(treino)
+
+    def test_detalhe_com_varios_treinos(self):
+        treinos = self.criar_treinos(10)
+        self.assertConsultasDetalhe(treinos[-1])
+
+
+class SincronizarExerciciosTests(CatalogoLimpoMixin, TestCase):
+    """Editar a rotina grava só as linhas envolvidas e mantém a ordem enviada."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.aluno = criar_aluno()
+        cls.exercicios = criar_exercicios(22)
+
+    def setUp(self):
+        super().setUp()
+        self.treino = Treino.objects.create(aluno=self.aluno, nome='Rotina', objetivo='Hipertrofia')
+        self.serializer = TreinoSerializer()
+        self.rotina = self.exercicios[:20]
+        self.serializer._criar_exercicios(self.treino, self.itens(self.rotina))
+
+    @staticmethod
+    def itens(exercicios):
+        return [{'exercicio_id': exercicio.pk, 'series': 3, 'repeticoes': 10}
+                for exercicio in exercicios]
+
+    def sincronizar(self, exercicios):
+        resultado = self.serializer._sincronizar_exercicios(self.treino, self.itens(exercicios))
+        self.assertEqual(
+            [linha.exercicio_id for linha in self.treino.exercicios.all()],
+            [exercicio.pk for exercicio in exercicios])
+        return resultado
+
+    def test_inserir_no_inicio(self):
+        self.assertEqual(self.sincronizar([self.exercicios[20]] + self.rotina), (0, 1, 0))
+
+    def test_remover_no_inicio(self):
+        pks = list(self.treino.exercicios.values_list('pk', flat=True))
+        self.assertEqual(self.sincronizar(self.rotina[1:]), (0, 0, 1))
+        self.assertEqual(
+            list(self.treino.exercicios.values_list('pk', flat=True)), pks[1:])
+
+    def test_mover_um_exercicio(self):
+        rotina = self.rotina[1:5] + self.rotina[:1] + self.rotina[5:]
+        self.assertEqual(self.sincronizar(rotina), (1, 0, 0))
+
+    def test_trocar_exercicio_reaproveita_a_linha(self):
+        rotina = self.rotina[:3] + [self.exercicios[21]] + self.rotina[4:]
+        self.assertEqual(self.sincronizar(rotina), (1, 0, 0))
+
+    def test_exercicio_repetido(self):
+        rotina = self.rotina[:2] + [self.rotina[0]] + self.rotina[2:]
+        self.assertEqual(self.sincronizar(rotina), (0, 1, 0))
+
+    def test_linhas_antigas_sem_ordem_sao_renumeradas(self):
+        ExercicioTreino.all_objects.filter(treino=self.treino).update(ordem=0)
+        alteradas, criadas, removidas = self.sincronizar([self.exercicios[20]] + self.rotina)
+        self.assertEqual((alteradas, criadas, removidas), (20, 1, 0))
+        # Depois da renumeração, a próxima inserção volta a gravar uma linha
+        self.assertEqual(
+            self.sincronizar([self.exercicios[21], self.exercicios[20]] + self.rotina), (0, 1, 0))
@@ -2,12 +2,16 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-# Importa o ViewSet responsável por Treinos
-from .views import TreinoViewSet
+# Importa os ViewSets de Treinos e do registro de sessões
+from .views import TreinoViewSet, SessaoTreinoViewSet
 
 # Cria instância do DefaultRouter para registro automático de rotas RESTful
 router = DefaultRouter()
 
+# Registra o registro de sessões em 'sessoes' (antes da rota raiz, cujo
+# detalhe '<id>/' também casaria com 'sessoes/')
+router.register('sessoes', SessaoTreinoViewSet, basename='sessao')
+
 # Registra o TreinoViewSet na rota raiz deste roteador
 router.register('', TreinoViewSet)
 
@@ -1,45 +1,275 @@
-from rest_framework import viewsets, status
+import datetime
+
+from django.db.models import Count, Prefetch
+from django.utils import timezone
+from rest_framework import mixins, serializers, viewsets, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
 
-from .models import Treino
-from .serializers import TreinoSerializer
+from .models import Treino, ExercicioTreino, SessaoTreino, SerieRegistrada, ResumoAluno
+from .analise import volume_semanal
+from .resumo import recalcular_resumos
 from cadastros.models import Aluno
+from core.conditional import CondicionalGetMixin
+from core.pagination import PadraoCursorPagination, SessoesCursorPagination, SeriesCursorPagination
+from .serializers import (
+    TreinoSerializer,
+    SessaoTreinoSerializer,
+    SessaoTreinoResumoSerializer,
+    SerieHistoricoSerializer,
+    VolumeAlunoSerializer,
+    ResumoAlunoSerializer,
+)
 
 
-class TreinoViewSet(viewsets.ModelViewSet):
+class TreinoViewSet(CondicionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet para gerenciar CRUD de Treino.
 
     Apenas usuários autenticados podem acessar.
     Filtra os treinos para retornar somente os do aluno logado.
+    Listagem e detalhe respondem 304 quando nada mudou (ver core/conditional.py).
     """
-    queryset = Treino.objects.all().order_by('id')
+    queryset = Treino.all_objects.all().order_by('id')
     serializer_class = TreinoSerializer
     permission_classes = [IsAuthenticated]
 
+    # peso/altura vêm do aluno, então alterações nele também mudam a ETag
+    condicional_campos = ['atualizacao', 'aluno__atualizacao']
+
     def get_queryset(self):
         """
         Retorna os treinos pertencentes ao usuário autenticado.
+
+        Já carrega o aluno (usado em peso/altura) com select_related e os
+        exercícios com um único prefetch, então listar N treinos custa um
+        número fixo de consultas em vez de 2 por treino.
         """
         user = self.request.user
-        return self.queryset.filter(aluno__user=user)
+        return self.queryset.filter(aluno__user=user).select_related('aluno').prefetch_related(
+            Prefetch(
+                'exercicios',
+                queryset=ExercicioTreino.all_objects.select_related('exercicio'),
+            )
+        )
 
     def perform_create(self, serializer):
         """
         Associa o treino ao aluno do usuário autenticado no momento da criação.
+
+        O aluno vem de request.aluno (ver core/middleware.py), resolvido uma
+        única vez por requisição.
         """
-        try:
-            aluno = Aluno.objects.get(user=self.request.user)
-            serializer.save(aluno=aluno)
-        except Aluno.DoesNotExist:
+        aluno = self.request.aluno
+        if not aluno:
             raise ValidationError("Usuário não possui aluno associado.")
+        serializer.save(aluno=aluno)
 
     def list(self, request, *args, **kwargs):
         """
-        Retorna a lista de treinos do aluno autenticado.
+        Retorna a lista paginada (por cursor) de treinos do aluno autenticado.
         """
         queryset = self.get_queryset()
+
+        # Busca apenas a página atual a partir do cursor
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    # Período padrão da análise de volume, em semanas
+    volume_semanas_padrao = 12
+
+    @action(detail=False, methods=['get'])
+    def volume(self, request):
+        """
+        Volume de treino por grupo muscular e semana (ver treinos/analise.py).
+
+        O volume é o executado: sai das séries registradas nas sessões
+        (SerieRegistrada), somando repetições × carga na semana em que cada
+        série foi feita. A prescrição das rotinas não entra no cálculo, e
+        semanas sem sessões não aparecem.
+
+        Parâmetros (todos opcionais):
+        - inicio, fim: período em YYYY-MM-DD (padrão: as últimas 12 semanas)
+        - aluno: ID de um aluno (apenas staff)
+
+        Staff vê todos os alunos, paginados por cursor; os demais usuários
+        veem apenas o próprio aluno. Cada página custa duas consultas: a
+        dos alunos da página e a do volume de todos eles.
+
+        Returns:
+            Response: {"next": ..., "previous": ..., "results": [
+                {"aluno": 1, "nome": "...", "semanas": [
+                    {"grupo_muscular": "Peito", "semana": "2025-06-02",
+                     "series": 12, "repeticoes": 120, "volume": "5400.00",
+                     "variacao": "600.00"}, ...]}, ...]}
+        """
+        campo_data = serializers.DateField()
+        periodo = {}
+        for parametro in ('inicio', 'fim'):
+            valor = request.query_params.get(parametro)
+            if valor:
+                try:
+                    periodo[parametro] = campo_data.to_internal_value(valor)
+                except serializers.ValidationError as exc:
+                    raise serializers.ValidationError({parametro: exc.detail})
+        if 'inicio' not in periodo:
+            fim = periodo.get('fim', timezone.localdate())
+            periodo['inicio'] = fim - datetime.timedelta(weeks=self.volume_semanas_padrao)
+
+        if request.user.is_staff:
+            alunos = Aluno.all_objects.only('id', 'nome')
+            if request.query_params.get('aluno'):
+                try:
+                    alunos = alunos.filter(pk=int(request.query_params['aluno']))
+                except ValueError:
+                    raise serializers.ValidationError({'aluno': 'Informe o ID do aluno.'})
+        elif request.aluno:
+            alunos = Aluno.all_objects.filter(pk=request.aluno.pk).only('id', 'nome')
+        else:
+            raise ValidationError("Usuário não possui aluno associado.")
+
+        paginator = PadraoCursorPagination()
+        pagina = paginator.paginate_queryset(alunos, request, view=self)
+
+        semanas = {}
+        for linha in volume_semanal([aluno.pk for aluno in pagina], **periodo):
+            semanas.setdefault(linha['aluno'], []).append(linha)
+
+        serializer = VolumeAlunoSerializer(
+            [{'aluno': aluno.pk, 'nome': aluno.nome, 'semanas': semanas.get(aluno.pk, [])}
+             for aluno in pagina],
+            many=True,
+        )
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def resumo(self, request):
+        """
+        Resumo da tela inicial: plano da matrícula ativa, treinos ativos e o
+        limite do plano, total de exercícios e a data da última alteração.
+
+        Lê apenas a linha do aluno em ResumoAluno (uma consulta, com o JOIN
+        pelo usuário), mantida pelos signals de treinos/signals.py. Se a
+        linha ainda não existe (aluno sem nenhuma alteração desde a criação
+        da tabela), ela é calculada e gravada nesta requisição.
+
+        Returns:
+            Response: {"plano": 1, "plano_titulo": "...", "limite_treinos": 5,
+                       "total_treinos": 3, "treinos_disponiveis": 2,
+                       "total_exercicios": 24, "atualizacao": "..."}
+        """
+        resumo = ResumoAluno.objects.filter(aluno__user=request.user).first()
+        if resumo is None:
+            if not request.aluno:
+                raise ValidationError("Usuário não possui aluno associado.")
+            # Usa a linha recém-gravada (uma releitura poderia ir para a réplica)
+            resumo = recalcular_resumos([request.aluno.pk])[0]
+        return Response(ResumoAlunoSerializer(resumo).data)
+
+
+class SessaoTreinoViewSet(mixins.ListModelMixin,
+                          mixins.RetrieveModelMixin,
+                          mixins.CreateModelMixin,
+                          viewsets.GenericViewSet):
+    """
+    ViewSet do registro de sessões de treino (o que o aluno executou).
+
+    - GET /api/v1/treinos/sessoes/ - Sessões do aluno, mais recentes primeiro,
+      com o total de séries
+    - POST /api/v1/treinos/sessoes/ - Grava uma sessão inteira com as séries
+      (201; 200 quando é o reenvio de uma sessão já gravada, pelo id_cliente)
+    - GET /api/v1/treinos/sessoes/{id}/ - Sessão com as séries
+    - GET /api/v1/treinos/sessoes/series/ - Séries de um exercício num período
+
+    Não há edição nem exclusão: o registro é só de inserção. Cada aluno vê
+    apenas as próprias sessões.
+    """
+    queryset = SessaoTreino.all_objects.all()
+    serializer_class = SessaoTreinoSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = SessoesCursorPagination
+
+    def get_queryset(self):
+        """
+        Retorna as sessões do aluno logado.
+
+        Na listagem, o total de séries vem anotado (uma consulta por página);
+        no detalhe, as séries vêm em um único prefetch.
+        """
+        aluno = self.request.aluno
+        if not aluno:
+            return SessaoTreino.all_objects.none()
+
+        queryset = self.queryset.filter(aluno=aluno)
+        if self.action == 'list':
+            return queryset.annotate(total_series=Count('series'))
+        if self.action == 'retrieve':
+            return queryset.prefetch_related(Prefetch(
+                'series', queryset=SerieRegistrada.objects.order_by('registrado_em', 'id')))
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return SessaoTreinoResumoSerializer
+        return SessaoTreinoSerializer
+
+    def create(self, request, *args, **kwargs):
+        """
+        Grava a sessão enviada pelo app (ver SessaoTreinoSerializer.create).
+        """
+        aluno = request.aluno
+        if not aluno:
+            raise ValidationError("Usuário não possui aluno associado.")
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(aluno=aluno)
+
+        codigo = status.HTTP_200_OK if serializer.reenviada else status.HTTP_201_CREATED
+        return Response(serializer.data, status=codigo)
+
+    @action(detail=False, methods=['get'])
+    def series(self, request):
+        """
+        Séries de um exercício num período, em ordem cronológica.
+
+        Parâmetros:
+        - exercicio: ID do exercício (obrigatório)
+        - inicio, fim: período em ISO 8601 (opcionais; fim não incluso)
+
+        A consulta percorre o índice (aluno, exercicio, registrado_em, id), que
+        já traz repeticoes e carga, sem juntar com a sessão. A resposta é
+        paginada por cursor (page_size até 1000), com o pk desempatando
+        séries do mesmo horário.
+        """
+        aluno = request.aluno
+        if not aluno:
+            raise ValidationError("Usuário não possui aluno associado.")
+
+        try:
+            exercicio = int(request.query_params['exercicio'])
+        except (KeyError, ValueError):
+            raise serializers.ValidationError({'exercicio': 'Informe o ID do exercício.'})
+
+        queryset = SerieRegistrada.objects.filter(aluno=aluno, exercicio_id=exercicio)
+        campo_data = serializers.DateTimeField()
+        for parametro, lookup in (('inicio', 'registrado_em__gte'), ('fim', 'registrado_em__lt')):
+            valor = request.query_params.get(parametro)
+            if valor:
+                try:
+                    queryset = queryset.filter(**{lookup: campo_data.to_internal_value(valor)})
+                except serializers.ValidationError as exc:
+                    raise serializers.ValidationError({parametro: exc.detail})
+
+        paginator = SeriesCursorPagination()
+        page = paginator.paginate_queryset(
+            queryset.values('registrado_em', 'repeticoes', 'carga'), request, view=self)
+        serializer = SerieHistoricoSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)